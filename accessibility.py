@@ -0,0 +1,188 @@
+"""
+Z_H_10min - Accessibility audit
+The whole rule set runs inside the page in a single script call, so the
+audit costs one WebDriver round trip no matter how large the page is.
+"""
+
+# Maximum number of examples returned per rule; counts are always complete
+MAX_EXAMPLES = 25
+
+AUDIT_SCRIPT = r"""
+var maxExamples = arguments[0];
+var results = {};
+
+function selectorFor(el) {
+    if (el.id) return el.tagName.toLowerCase() + '#' + el.id;
+    var parts = [];
+    while (el && el.nodeType === 1 && parts.length < 4) {
+        var part = el.tagName.toLowerCase();
+        if (el.parentElement) {
+            var index = Array.prototype.indexOf.call(el.parentElement.children, el) + 1;
+            part += ':nth-child(' + index + ')';
+        }
+        parts.unshift(part);
+        el = el.parentElement;
+    }
+    return parts.join(' > ');
+}
+
+function report(rule, el, message) {
+    var entry = results[rule] || (results[rule] = {count: 0, examples: []});
+    entry.count++;
+    if (entry.examples.length < maxExamples) {
+        entry.examples.push({selector: el ? selectorFor(el) : 'document', message: message});
+    }
+}
+
+function isHidden(el) {
+    if (el.hidden || el.getAttribute('aria-hidden') === 'true') return true;
+    var style = window.getComputedStyle(el);
+    return style.display === 'none' || style.visibility === 'hidden';
+}
+
+function hasAccessibleName(el) {
+    if ((el.getAttribute('aria-label') || '').trim()) return true;
+    var labelledBy = el.getAttribute('aria-labelledby');
+    if (labelledBy && labelledBy.split(/\s+/).some(function (id) {
+        var ref = document.getElementById(id);
+        return ref && ref.textContent.trim();
+    })) return true;
+    return !!(el.getAttribute('title') || '').trim();
+}
+
+// Document level rules
+if (!document.title.trim()) report('document-title', null, 'Page has no <title>');
+if (!(document.documentElement.getAttribute('lang') || '').trim()) {
+    report('html-lang', document.documentElement, '<html> element has no lang attribute');
+}
+
+// Images need alternative text unless they are marked as decorative
+document.querySelectorAll('img, input[type="image"], area').forEach(function (el) {
+    var role = el.getAttribute('role');
+    if (role === 'presentation' || role === 'none') return;
+    if (!el.hasAttribute('alt') && !hasAccessibleName(el)) {
+        report('image-alt', el, 'Image has no alt attribute');
+    }
+});
+
+// Form controls need a label
+var labelled = {};
+document.querySelectorAll('label[for]').forEach(function (label) {
+    labelled[label.getAttribute('for')] = true;
+});
+document.querySelectorAll('input, select, textarea').forEach(function (el) {
+    var type = (el.getAttribute('type') || 'text').toLowerCase();
+    if (['hidden', 'submit', 'button', 'image', 'reset'].indexOf(type) !== -1) return;
+    if (el.id && labelled[el.id]) return;
+    if (el.closest('label') || hasAccessibleName(el)) return;
+    report('label', el, 'Form control has no associated label');
+});
+
+// Buttons and links need a name
+document.querySelectorAll('button, [role="button"], a[href]').forEach(function (el) {
+    if (isHidden(el)) return;
+    if (el.textContent.trim() || hasAccessibleName(el)) return;
+    if (el.querySelector('img[alt]:not([alt=""]), svg title')) return;
+    var rule = el.tagName === 'A' ? 'link-name' : 'button-name';
+    report(rule, el, (rule === 'link-name' ? 'Link' : 'Button') + ' has no accessible name');
+});
+
+// ARIA roles and references
+var validRoles = ('alert alertdialog application article banner blockquote button caption cell checkbox code ' +
+    'columnheader combobox complementary contentinfo definition deletion dialog directory document emphasis ' +
+    'feed figure form generic grid gridcell group heading img insertion link list listbox listitem log main ' +
+    'marquee math menu menubar menuitem menuitemcheckbox menuitemradio meter navigation none note option ' +
+    'paragraph presentation progressbar radio radiogroup region row rowgroup rowheader scrollbar search ' +
+    'searchbox separator slider spinbutton status strong subscript superscript switch tab table tablist ' +
+    'tabpanel term textbox time timer toolbar tooltip tree treegrid treeitem').split(' ');
+document.querySelectorAll('[role]').forEach(function (el) {
+    el.getAttribute('role').trim().split(/\s+/).forEach(function (role) {
+        if (role && validRoles.indexOf(role) === -1) report('aria-role', el, 'Invalid ARIA role "' + role + '"');
+    });
+});
+document.querySelectorAll('[aria-labelledby], [aria-describedby], [aria-controls]').forEach(function (el) {
+    ['aria-labelledby', 'aria-describedby', 'aria-controls'].forEach(function (attr) {
+        var value = el.getAttribute(attr);
+        if (!value) return;
+        value.trim().split(/\s+/).forEach(function (id) {
+            if (id && !document.getElementById(id)) report('aria-reference', el, attr + ' points to missing id "' + id + '"');
+        });
+    });
+});
+
+// Duplicate ids break label and ARIA references
+var seenIds = {};
+document.querySelectorAll('[id]').forEach(function (el) {
+    if (seenIds[el.id]) report('duplicate-id', el, 'Duplicate id "' + el.id + '"');
+    seenIds[el.id] = true;
+});
+
+// Landmarks
+if (!document.querySelector('main, [role="main"]')) report('landmark-main', null, 'Page has no main landmark');
+if (document.querySelectorAll('main, [role="main"]').length > 1) report('landmark-main', null, 'Page has more than one main landmark');
+
+// Heading structure
+var headings = document.querySelectorAll('h1, h2, h3, h4, h5, h6, [role="heading"]');
+var previousLevel = 0;
+var h1Count = 0;
+headings.forEach(function (el) {
+    var level = el.getAttribute('aria-level') ? parseInt(el.getAttribute('aria-level'), 10) :
+        parseInt(el.tagName.charAt(1), 10) || 2;
+    if (level === 1) h1Count++;
+    if (!el.textContent.trim()) report('empty-heading', el, 'Heading is empty');
+    if (previousLevel && level > previousLevel + 1) {
+        report('heading-order', el, 'Heading level jumps from h' + previousLevel + ' to h' + level);
+    }
+    previousLevel = level;
+});
+if (h1Count === 0) report('page-has-heading-one', null, 'Page has no h1 heading');
+
+// Text contrast (WCAG AA: 4.5:1, 3:1 for large text)
+function parseColor(value) {
+    var m = value.match(/rgba?\(([\d.]+),\s*([\d.]+),\s*([\d.]+)(?:,\s*([\d.]+))?\)/);
+    return m ? [+m[1], +m[2], +m[3], m[4] === undefined ? 1 : +m[4]] : null;
+}
+function luminance(rgb) {
+    var c = rgb.slice(0, 3).map(function (v) {
+        v /= 255;
+        return v <= 0.03928 ? v / 12.92 : Math.pow((v + 0.055) / 1.055, 2.4);
+    });
+    return 0.2126 * c[0] + 0.7152 * c[1] + 0.0722 * c[2];
+}
+function backgroundOf(el) {
+    while (el && el.nodeType === 1) {
+        var style = window.getComputedStyle(el);
+        if (style.backgroundImage !== 'none') return null;  // cannot judge text over images
+        var bg = parseColor(style.backgroundColor);
+        if (bg && bg[3] > 0) return bg;
+        el = el.parentElement;
+    }
+    return [255, 255, 255, 1];
+}
+var walker = document.createTreeWalker(document.body || document.documentElement, NodeFilter.SHOW_TEXT);
+var checked = new Set();
+while (walker.nextNode()) {
+    var parent = walker.currentNode.parentElement;
+    if (!parent || checked.has(parent) || !walker.currentNode.textContent.trim()) continue;
+    checked.add(parent);
+    if (['SCRIPT', 'STYLE', 'NOSCRIPT'].indexOf(parent.tagName) !== -1 || isHidden(parent)) continue;
+    var style = window.getComputedStyle(parent);
+    var fg = parseColor(style.color);
+    var bg = backgroundOf(parent);
+    if (!fg || !bg || fg[3] < 1) continue;
+    var l1 = luminance(fg), l2 = luminance(bg);
+    var ratio = (Math.max(l1, l2) + 0.05) / (Math.min(l1, l2) + 0.05);
+    var size = parseFloat(style.fontSize);
+    var large = size >= 24 || (size >= 18.66 && parseInt(style.fontWeight, 10) >= 700);
+    if (ratio < (large ? 3 : 4.5)) {
+        report('color-contrast', parent, 'Contrast ratio ' + ratio.toFixed(2) + ':1 is below ' + (large ? '3' : '4.5') + ':1');
+    }
+}
+
+return results;
+"""
+
+
+def run_accessibility_audit(driver, max_examples=MAX_EXAMPLES):
+    """Run every rule in the page and return {rule: {'count': n, 'examples': [...]}}"""
+    return driver.execute_script(AUDIT_SCRIPT, max_examples) or {}
@@ -0,0 +1,269 @@
+"""
+Z_H_10min - Authenticated scanning
+Logs in once, through a scripted browser flow or an imported cookie file,
+and keeps the resulting cookies in sync between the Selenium driver and
+the pooled requests session. The state is shared with other workers
+through a state file or the coordinator and refreshed when it expires.
+"""
+
+import json
+import os
+import threading
+import time
+from http.cookiejar import MozillaCookieJar
+from string import Template
+from urllib.parse import urlparse
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+
+def load_cookie_file(path):
+    """Read cookies from a JSON export (browser extensions, DevTools) or a Netscape cookies.txt"""
+    with open(path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    if text.lstrip().startswith(('[', '{')):
+        data = json.loads(text)
+        if isinstance(data, dict):
+            data = data.get('cookies', [])
+        cookies = []
+        for cookie in data:
+            expires = cookie.get('expires', cookie.get('expirationDate', cookie.get('expiry', -1)))
+            cookies.append({
+                'name': cookie['name'],
+                'value': cookie['value'],
+                'domain': cookie.get('domain', ''),
+                'path': cookie.get('path', '/'),
+                'secure': bool(cookie.get('secure', False)),
+                'httpOnly': bool(cookie.get('httpOnly', False)),
+                'expires': float(expires) if expires not in (None, '') else -1,
+            })
+        return cookies
+    jar = MozillaCookieJar()
+    jar.load(path, ignore_discard=True, ignore_expires=True)
+    return [{'name': c.name, 'value': c.value, 'domain': c.domain, 'path': c.path, 'secure': c.secure,
+             'httpOnly': c.has_nonstandard_attr('HttpOnly'), 'expires': float(c.expires or -1)} for c in jar]
+
+
+def load_login_script(path):
+    """Read a login script; ${VAR} in values is taken from the environment so secrets stay out of the file"""
+    with open(path, 'r', encoding='utf-8') as f:
+        script = json.load(f)
+    for step in script.get('steps', []):
+        if 'value' in step:
+            step['value'] = Template(step['value']).substitute(os.environ)
+    return script
+
+
+def run_login(driver, script, timeout=20):
+    """Perform the login steps in the browser and return its cookies"""
+    driver.get(script['url'])
+    wait = WebDriverWait(driver, timeout)
+    for step in script.get('steps', []):
+        if 'fill' in step:
+            field = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, step['fill'])))
+            field.clear()
+            field.send_keys(step['value'])
+        elif 'click' in step:
+            wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, step['click']))).click()
+        elif 'wait' in step:
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, step['wait'])))
+        elif 'sleep' in step:
+            time.sleep(float(step['sleep']))
+    if script.get('success'):
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, script['success'])))
+    return browser_cookies(driver)
+
+
+def site_domain(url):
+    """Registrable domain of a URL's host (example.co.uk for www.example.co.uk), approximated without a suffix list"""
+    host = (urlparse(url).hostname or '').rstrip('.')
+    labels = host.split('.')
+    if len(labels) <= 2 or host.replace('.', '').isdigit():
+        return host  # localhost, IPv4 or already registrable
+    # Two-letter country codes usually sit under a second level like co. or com.
+    if len(labels[-1]) == 2 and labels[-2] in ('co', 'com', 'org', 'net', 'ac', 'gov', 'edu'):
+        return '.'.join(labels[-3:])
+    return '.'.join(labels[-2:])
+
+
+def on_site(cookie, domain):
+    """True if a cookie belongs to the domain or one of its subdomains"""
+    cookie_domain = cookie.get('domain', '').lstrip('.').lower()
+    return cookie_domain == domain or cookie_domain.endswith('.' + domain)
+
+
+def browser_cookies(driver):
+    """Every cookie of the browser, for all domains"""
+    return driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+
+
+def set_browser_cookies(driver, cookies):
+    """Install cookies in the browser without first navigating to their domains"""
+    params = []
+    for cookie in cookies:
+        entry = {'name': cookie['name'], 'value': cookie['value'], 'domain': cookie['domain'],
+                 'path': cookie.get('path', '/'), 'secure': cookie.get('secure', False),
+                 'httpOnly': cookie.get('httpOnly', False)}
+        if cookie.get('expires', -1) > 0:
+            entry['expires'] = cookie['expires']
+        params.append(entry)
+    driver.execute_cdp_cmd('Network.setCookies', {'cookies': params})
+
+
+def set_session_cookies(session, cookies):
+    """Mirror cookies into a requests session"""
+    for cookie in cookies:
+        expires = cookie.get('expires', -1)
+        session.cookies.set(cookie['name'], cookie['value'], domain=cookie['domain'],
+                            path=cookie.get('path', '/'), secure=cookie.get('secure', False),
+                            expires=int(expires) if expires and expires > 0 else None)
+
+
+class FileAuthStore:
+    """Auth state shared by the processes of one machine"""
+
+    def __init__(self, path):
+        self.path = path
+
+    def load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, state):
+        tmp = self.path + '.tmp'
+        # The state holds session cookies, keep it readable by the owner only
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.chmod(tmp, 0o600)  # in case a stale tmp file had other permissions
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp, self.path)
+
+
+class BrokerAuthStore:
+    """Auth state shared by all workers of a coordinator"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def load(self):
+        return self.client.call('/auth').get('state')
+
+    def save(self, state):
+        self.client.call('/auth', state=state)
+
+
+class AuthManager:
+    def __init__(self, session, login=None, cookies=None, store=None, max_age=3600):
+        """Authenticate with a login script or imported cookies, sharing the state through store"""
+        self.session = session
+        self.login = login  # parsed login script
+        self.imported = cookies or []  # cookies from --cookies
+        self.store = store
+        self.max_age = max_age
+        self.state = None  # {'cookies', 'expires', 'version'}
+        self.logins = 0
+        self.lock = threading.Lock()  # testers share the manager, one of them logs in
+        self.forbidden_hosts = set()  # hosts where a fresh login still got 401/403 once
+
+    def valid(self, state):
+        """True if a state exists and has not expired"""
+        return bool(state and state.get('cookies') and state.get('expires', 0) > time.time())
+
+    def _expiry(self, cookies):
+        """The earliest expiry of the cookies, capped at max_age from now"""
+        expiry = time.time() + self.max_age
+        for cookie in cookies:
+            if cookie.get('expires', -1) > 0:
+                expiry = min(expiry, cookie['expires'])
+        return expiry
+
+    def _adopt(self, state, driver):
+        self.state = state
+        set_session_cookies(self.session, state['cookies'])
+        if driver is not None:
+            set_browser_cookies(driver, state['cookies'])
+
+    def _shared(self):
+        if not self.store:
+            return None
+        try:
+            return self.store.load()
+        except Exception:
+            return None  # coordinator unreachable, log in locally
+
+    def ensure(self, driver):
+        """Make the driver and the session authenticated, logging in only if nobody else has"""
+        shared = self._shared()
+        if self.valid(shared) and (not self.state or shared.get('version', 0) >= self.state.get('version', 0)):
+            self._adopt(shared, driver)
+        elif self.valid(self.state):
+            self._adopt(self.state, driver)
+        else:
+            self.refresh(driver)
+
+    def refresh(self, driver):
+        """Log in again, unless another tester or worker already stored newer state"""
+        version = self.state['version'] if self.state else 0
+        with self.lock:
+            if self.state and self.state['version'] > version and self.valid(self.state):
+                self._adopt(self.state, driver)  # logged in by another tester while we waited
+                return
+            self._refresh(driver, version)
+
+    def _refresh(self, driver, version):
+        shared = self._shared()
+        if self.valid(shared) and shared.get('version', 0) > version:
+            self._adopt(shared, driver)
+            return
+        if self.login:
+            cookies = run_login(driver, self.login)
+        else:
+            cookies = list(self.imported)
+            if cookies and all(0 < c.get('expires', -1) <= time.time() for c in cookies):
+                raise ValueError("The imported cookies have expired, export them again")
+        self.logins += 1
+        state = {'cookies': cookies, 'expires': self._expiry(cookies),
+                 'version': max(version, shared.get('version', 0) if shared else 0) + 1}
+        self._adopt(state, driver)
+        if self.store:
+            try:
+                self.store.save(state)
+            except Exception:
+                pass
+
+    def expired(self, response):
+        """True if a response shows the session is no longer logged in"""
+        if self.state and self.state['expires'] <= time.time():
+            return True
+        if response is None:
+            return False
+        login_url = self.login.get('url') if self.login else None
+        if login_url and response.history and response.url.split('?')[0] == login_url.split('?')[0]:
+            return True
+        # A forbidden page is a normal page to test; only trust 401/403 until a fresh login gets one too
+        return response.status_code in (401, 403) and urlparse(response.url).hostname not in self.forbidden_hosts
+
+    def recheck(self, response):
+        """Remember whether a page refused after a fresh login is simply forbidden"""
+        if response is not None and response.status_code in (401, 403):
+            self.forbidden_hosts.add(urlparse(response.url).hostname)
+
+    def sync_from_driver(self, driver, url):
+        """Copy cookies the site at url set or rotated in the browser back to the session"""
+        try:
+            cookies = browser_cookies(driver)
+        except Exception:
+            return
+        # Third-party cookies (ads, analytics, embeds) stay in the browser
+        domain = site_domain(url)
+        cookies = [cookie for cookie in cookies if on_site(cookie, domain)]
+        with self.lock:
+            set_session_cookies(self.session, cookies)
+            if self.state:
+                others = [cookie for cookie in self.state['cookies'] if not on_site(cookie, domain)]
+                self.state['cookies'] = others + cookies
@@ -0,0 +1,225 @@
+"""
+Z_H_10min - Scan broker
+A small HTTP/JSON broker that hands out leased jobs from a JobStore to
+workers on other nodes, tracks their heartbeats and redelivers the jobs
+of workers that disappear.
+"""
+
+import ipaddress
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse
+
+import requests
+
+DEFAULT_LEASE = 120  # seconds a job stays leased without a heartbeat
+JOB_PATHS = ('/heartbeat', '/complete', '/fail', '/release')  # POSTs about one leased job
+
+
+def is_loopback(host):
+    """True if the bind address only accepts connections from this machine"""
+    if host == 'localhost':
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False  # a host name that may resolve to any interface
+
+
+class _BrokerHandler(BaseHTTPRequestHandler):
+    """JSON endpoints: /jobs, /lease, /heartbeat, /complete, /fail, /release, /auth, /status, /results"""
+
+    def log_message(self, format, *args):
+        pass  # keep the coordinator output readable
+
+    def _reply(self, payload, status=200):
+        body = json.dumps(payload).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _authorized(self):
+        token = self.server.broker.token
+        return not token or self.headers.get('X-Broker-Token') == token
+
+    def do_GET(self):
+        if not self._authorized():
+            return self._reply({'error': 'unauthorized'}, 401)
+        broker = self.server.broker
+        path = urlparse(self.path).path
+        if path == '/status':
+            return self._reply(broker.status())
+        if path == '/results':
+            return self._reply({url: findings for url, findings in broker.store.results()})
+        return self._reply({'error': 'not found'}, 404)
+
+    def do_POST(self):
+        if not self._authorized():
+            return self._reply({'error': 'unauthorized'}, 401)
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            data = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            return self._reply({'error': 'invalid JSON'}, 400)
+        if not isinstance(data, dict):
+            return self._reply({'error': 'expected a JSON object'}, 400)
+
+        broker = self.server.broker
+        store = broker.store
+        path = urlparse(self.path).path
+        if path in JOB_PATHS and not isinstance(data.get('url'), str):
+            return self._reply({'error': "missing 'url'"}, 400)
+        worker = data.get('worker')
+        if worker:
+            broker.seen(worker)
+
+        if path == '/jobs':
+            urls = data.get('urls', [])
+            if not isinstance(urls, list) or not all(isinstance(url, str) for url in urls):
+                return self._reply({'error': "'urls' must be a list of URLs"}, 400)
+            store.add(urls)
+            return self._reply({'queued': len(urls)})
+        if path == '/lease':
+            store.expire_leases()
+            url = store.claim(worker=worker, lease=broker.lease)
+            # Workers run the coordinator's checks, not their own defaults
+            return self._reply({'url': url, 'lease': broker.lease, 'checks': broker.checks,
+                                'done': url is None and store.remaining() == 0})
+        if path == '/heartbeat':
+            return self._reply({'ok': store.heartbeat(data['url'], worker, broker.lease)})
+        if path == '/auth':
+            if not broker.token:
+                # Session cookies are credentials, never hand them out to anyone who asks
+                return self._reply({'error': 'sharing the login needs --broker-token'}, 403)
+            # Workers share one login; newer state replaces older
+            state = data.get('state')
+            with broker.lock:
+                if state and (not broker.auth or state.get('version', 0) > broker.auth.get('version', 0)):
+                    broker.auth = state
+                return self._reply({'state': broker.auth})
+        if path == '/complete':
+            store.complete(data['url'], data.get('findings', []))
+            return self._reply({'ok': True})
+        if path == '/fail':
+            store.fail(data['url'], data.get('error', 'unknown error'))
+            return self._reply({'ok': True})
+        if path == '/release':
+            # An interrupted worker hands its job back without using up an attempt
+            store.release(data['url'], worker)
+            return self._reply({'ok': True})
+        return self._reply({'error': 'not found'}, 404)
+
+
+class Broker:
+    def __init__(self, store, host='127.0.0.1', port=8470, lease=DEFAULT_LEASE, token=None):
+        """Serve the jobs in store over HTTP; a token is required unless bound to loopback"""
+        if not token and not is_loopback(host):
+            raise ValueError(f"Serving on {host} needs --broker-token, or bind to 127.0.0.1")
+        self.store = store
+        self.checks = json.loads(store.checks) if store.checks else None
+        self.lease = lease
+        self.token = token
+        self.workers = {}  # worker id -> last time it talked to the broker
+        self.auth = None  # login state shared by the workers
+        self.lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), _BrokerHandler)
+        self.server.daemon_threads = True
+        self.server.broker = self
+        self.stopping = threading.Event()
+        self.threads = []
+
+    @property
+    def address(self):
+        """Base URL workers should connect to"""
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def seen(self, worker):
+        """Note that a worker is alive"""
+        self.workers[worker] = time.time()
+
+    def status(self):
+        """Job counts and the workers heard from recently"""
+        now = time.time()
+        return {
+            'jobs': self.store.counts(),
+            'remaining': self.store.remaining(),
+            'workers': {worker: round(now - last, 1) for worker, last in self.workers.items()
+                        if now - last < self.lease * 2},
+        }
+
+    def _reap(self):
+        """Redeliver jobs of dead workers even when nobody asks for work"""
+        while not self.stopping.wait(max(self.lease / 4, 1)):
+            self.store.expire_leases()
+
+    def start(self):
+        """Serve in background threads"""
+        for target in (self.server.serve_forever, self._reap):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self.threads.append(thread)
+        return self
+
+    def stop(self):
+        """Stop serving and reaping"""
+        self.stopping.set()
+        self.server.shutdown()
+        self.server.server_close()
+
+
+class BrokerClient:
+    def __init__(self, url, worker, token=None, timeout=30):
+        """Talk to a broker at url as the given worker id"""
+        self.url = url.rstrip('/')
+        self.worker = worker
+        self.timeout = timeout
+        self.http = requests.Session()
+        if token:
+            self.http.headers['X-Broker-Token'] = token
+
+    def call(self, path, **payload):
+        """POST a JSON request to the broker and return the decoded reply"""
+        payload['worker'] = self.worker
+        response = self.http.post(self.url + path, json=payload, timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+    def status(self):
+        """Job counts and live workers"""
+        response = self.http.get(self.url + '/status', timeout=self.timeout)
+        response.raise_for_status()
+        return response.json()
+
+
+class Heartbeat:
+    """Keeps a job's lease alive while the worker is busy with it"""
+
+    def __init__(self, client, url, interval):
+        self.client = client
+        self.url = url
+        self.interval = interval
+        self.lost = False
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        while not self.stopped.wait(self.interval):
+            try:
+                if not self.client.call('/heartbeat', url=self.url)['ok']:
+                    self.lost = True  # lease expired and the job went to someone else
+                    return
+            except Exception:
+                continue  # broker briefly unreachable, try again next interval
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stopped.set()
+        self.thread.join()
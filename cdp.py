@@ -0,0 +1,147 @@
+"""
+Z_H_10min - Chrome DevTools Protocol event collector
+ChromeDriver records DevTools network and page events in its performance
+log and console/exception events in its browser log while the page loads.
+The collector drains both into one bounded ring buffer, and every check
+reads from that buffer instead of polling the page.
+"""
+
+import json
+from collections import deque
+
+# Browser log levels worth keeping as console events
+CONSOLE_LEVELS = {'SEVERE': 'error', 'WARNING': 'warning', 'INFO': 'info'}
+
+
+def enable_event_logging(chrome_options):
+    """Ask ChromeDriver to record DevTools and console events"""
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL', 'browser': 'ALL'})
+    chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': True})
+
+
+class CDPEventCollector:
+    def __init__(self, driver, capacity=20000):
+        """Collect events from driver into a ring buffer of at most capacity entries"""
+        self.driver = driver
+        self.events = deque(maxlen=capacity)
+        self.dropped = 0
+
+    def attach(self):
+        """Enable the DevTools domains and discard events from before attaching"""
+        try:
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Page.enable', {})
+        except Exception:
+            pass  # the performance log enables them as well
+        self.reset()
+
+    def reset(self):
+        """Start a new capture, typically right before a navigation"""
+        self._read_logs()
+        self.events.clear()
+        self.dropped = 0
+
+    def _read_logs(self):
+        """Fetch whatever ChromeDriver has buffered since the last call"""
+        entries = []
+        for log_type in ('performance', 'browser'):
+            try:
+                entries.extend((log_type, entry) for entry in self.driver.get_log(log_type))
+            except Exception:
+                continue
+        return entries
+
+    def drain(self):
+        """Move buffered DevTools and console events into the ring buffer"""
+        for log_type, entry in self._read_logs():
+            if len(self.events) == self.events.maxlen:
+                self.dropped += 1
+            if log_type == 'performance':
+                try:
+                    message = json.loads(entry['message'])['message']
+                except (KeyError, ValueError):
+                    continue
+                self.events.append((message.get('method', ''), message.get('params', {})))
+            else:
+                self.events.append(('Console.message', {
+                    'level': CONSOLE_LEVELS.get(entry.get('level'), 'debug'),
+                    'text': entry.get('message', ''),
+                    'source': entry.get('source', ''),
+                    'timestamp': entry.get('timestamp'),
+                }))
+        return len(self.events)
+
+    def console_messages(self, level=None):
+        """Console messages and uncaught exceptions, optionally filtered by level"""
+        return [params for method, params in self.events
+                if method == 'Console.message' and (level is None or params['level'] == level)]
+
+    def page_timings(self):
+        """DOMContentLoaded and load times of the last navigation, in seconds"""
+        start = None
+        timings = {}
+        for method, params in self.events:
+            if (method == 'Network.requestWillBeSent' and params.get('type') == 'Document'
+                    and start is None):
+                start = params.get('timestamp')
+            elif method == 'Page.domContentEventFired':
+                timings['dom_content_loaded'] = params.get('timestamp')
+            elif method == 'Page.loadEventFired':
+                timings['load'] = params.get('timestamp')
+        if start is None:
+            return {}
+        return {name: value - start for name, value in timings.items() if value}
+
+    def pending_requests(self):
+        """Requests started in the current capture that have neither finished nor failed"""
+        inflight = set()
+        for method, params in self.events:
+            if method == 'Network.requestWillBeSent':
+                inflight.add(params.get('requestId'))
+            elif method in ('Network.loadingFinished', 'Network.loadingFailed'):
+                inflight.discard(params.get('requestId'))
+        return len(inflight)
+
+    def requests(self):
+        """Assemble network events into one dict per request"""
+        requests = {}
+        for method, params in self.events:
+            if not method.startswith('Network.'):
+                continue
+            request_id = params.get('requestId')
+            if request_id is None:
+                continue
+            entry = requests.setdefault(request_id, {
+                'url': None, 'method': None, 'type': None, 'status': None, 'headers': {},
+                'mime_type': None, 'size': 0, 'duration': None, 'failed': False, 'error': None,
+                'protocol': None, 'from_cache': False, 'redirects': [], 'started': None,
+            })
+            if method == 'Network.requestWillBeSent':
+                if params.get('redirectResponse'):
+                    redirect = params['redirectResponse']
+                    entry['redirects'].append((redirect.get('url'), redirect.get('status')))
+                entry['url'] = params['request']['url']
+                entry['method'] = params['request'].get('method')
+                entry['type'] = params.get('type')
+                if entry['started'] is None:
+                    entry['started'] = params.get('timestamp')
+            elif method == 'Network.responseReceived':
+                response = params.get('response', {})
+                entry['url'] = entry['url'] or response.get('url')
+                entry['type'] = entry['type'] or params.get('type')
+                entry['status'] = response.get('status')
+                entry['headers'] = {k.lower(): v for k, v in response.get('headers', {}).items()}
+                entry['mime_type'] = response.get('mimeType')
+                entry['protocol'] = response.get('protocol')
+                entry['from_cache'] = bool(response.get('fromDiskCache') or response.get('fromServiceWorker'))
+            elif method == 'Network.loadingFinished':
+                entry['size'] = params.get('encodedDataLength', 0)
+                if entry['started'] is not None:
+                    entry['duration'] = (params.get('timestamp', entry['started']) - entry['started']) * 1000
+            elif method == 'Network.loadingFailed':
+                entry['failed'] = True
+                entry['error'] = params.get('blockedReason') or params.get('errorText')
+                entry['type'] = entry['type'] or params.get('type')
+                if params.get('canceled'):
+                    entry['error'] = 'canceled'
+        return [entry for entry in requests.values() if entry['url'] and not entry['url'].startswith('data:')]
@@ -0,0 +1,80 @@
+"""
+Z_H_10min - Check registry
+Every check lives in its own module under checks/ and is imported only
+when it is selected. Each entry declares what it needs, so runners start
+a browser only when a check uses one and open the page once for all the
+checks that read the DOM.
+"""
+
+import importlib
+
+from tracing import span
+
+# What a check needs from the runner
+PAGE = 'page'            # the page opened in the browser with the load profile
+FULL_LOAD = 'full-load'  # the browser, for a complete page load the check does itself
+HTTP = 'http'            # the shared requests session
+NETWORK = 'network'      # plain sockets
+
+
+class CheckSpec:
+    """Registry entry; the module is imported on first use"""
+    __slots__ = ('name', 'module', 'needs', 'description', 'reusable')
+
+    def __init__(self, name, module, needs, description, reusable=False):
+        self.name = name
+        self.module = module
+        self.needs = frozenset(needs)
+        self.description = description
+        self.reusable = reusable  # findings follow from the page's HTML and headers alone
+
+    @property
+    def uses_browser(self):
+        return bool(self.needs & {PAGE, FULL_LOAD})
+
+    def run(self, tester, url):
+        """Import the check module if needed and run it"""
+        with span(tester.tracer, f"check {self.name}", {'check': self.name}):
+            return importlib.import_module(self.module).run(tester, url)
+
+
+REGISTRY = {spec.name: spec for spec in (
+    CheckSpec('console', 'checks.console', [PAGE], 'Browser console errors', reusable=True),
+    CheckSpec('links', 'checks.links', [PAGE, HTTP], 'Broken links'),
+    CheckSpec('screenshot', 'checks.screenshot', [PAGE], 'Screenshot and visual regression', reusable=True),
+    CheckSpec('forms', 'checks.forms', [PAGE], 'Form security', reusable=True),
+    CheckSpec('seo', 'checks.seo', [PAGE, HTTP], 'SEO elements (and site crawl with --seo-pages)'),
+    CheckSpec('accessibility', 'checks.accessibility', [PAGE], 'Accessibility audit', reusable=True),
+    CheckSpec('headers', 'checks.headers', [HTTP], 'Security headers', reusable=True),
+    CheckSpec('ssl', 'checks.ssl_certificate', [NETWORK], 'SSL certificate'),
+    CheckSpec('performance', 'checks.performance', [FULL_LOAD], 'Page load performance'),
+    CheckSpec('resources', 'checks.resources', [FULL_LOAD], 'Subresource audit'),
+)}
+
+BASIC_CHECKS = ('console', 'links', 'screenshot')
+DEFAULT_CHECKS = BASIC_CHECKS + ('forms', 'headers', 'performance', 'resources')
+GROUPS = {'basic': BASIC_CHECKS, 'default': DEFAULT_CHECKS, 'all': tuple(REGISTRY)}
+
+
+def resolve(names):
+    """Turn check and group names into specs, keeping the given order and dropping repeats"""
+    if isinstance(names, str):
+        names = [n.strip() for n in names.split(',') if n.strip()]
+    specs = []
+    for name in names:
+        for expanded in GROUPS.get(name, (name,)):
+            if expanded not in REGISTRY:
+                raise ValueError(f"Unknown check '{expanded}', choose from {', '.join(list(REGISTRY) + list(GROUPS))}")
+            if REGISTRY[expanded] not in specs:
+                specs.append(REGISTRY[expanded])
+    return specs
+
+
+def needs(specs, resource):
+    """True if any of the checks needs the resource"""
+    return any(resource in spec.needs for spec in specs)
+
+
+def uses_browser(specs):
+    """True if any of the checks needs Chrome"""
+    return any(spec.uses_browser for spec in specs)
@@ -0,0 +1,33 @@
+"""In-page accessibility audit of the rendered document"""
+
+from colorama import Fore, Style
+
+from accessibility import run_accessibility_audit
+
+
+def run(tester, url):
+    """Run the in-page accessibility audit"""
+    try:
+        print(f"\n{Fore.CYAN}=== Accessibility Testing ==={Style.RESET_ALL}")
+        
+        # One script evaluates every rule, instead of a lookup per element
+        violations = run_accessibility_audit(tester.driver)
+        
+        if not violations:
+            print(f"{Fore.GREEN}[✓] No accessibility violations found{Style.RESET_ALL}")
+            return violations
+        
+        total = sum(result['count'] for result in violations.values())
+        print(f"{Fore.YELLOW}[!] Found {total} accessibility violation(s) across {len(violations)} rule(s){Style.RESET_ALL}")
+        for rule, result in sorted(violations.items(), key=lambda item: -item[1]['count']):
+            print(f"\n{Fore.YELLOW}{rule} ({result['count']}){Style.RESET_ALL}")
+            for example in result['examples'][:5]:
+                print(f"- {example['message']}: {example['selector']}")
+            if result['count'] > 5:
+                print(f"  ... and {result['count'] - 5} more")
+            tester.add_finding('accessibility', 'warning', f"{rule}: {result['count']} violation(s)")
+        return violations
+            
+    except Exception as e:
+        print(Fore.RED + f"[!] Error during accessibility testing: {str(e)}" + Style.RESET_ALL)
+        return None
@@ -0,0 +1,28 @@
+"""Browser console errors and uncaught exceptions captured during the page load"""
+
+from colorama import Fore, Style
+
+from profiles import is_blocked
+
+
+def run(tester, url):
+    print(f"\n{Fore.YELLOW}=== Console Error Check ==={Style.RESET_ALL}")
+    check_console_errors(tester)
+
+
+def check_console_errors(tester):
+    """Check browser console for errors"""
+    try:
+        # Console messages and uncaught exceptions captured during navigation
+        tester.events.drain()
+        # Requests blocked by the load profile are not the page's fault
+        errors = [e for e in tester.events.console_messages('error') if not is_blocked(e['text'])]
+        if errors:
+            print(Fore.YELLOW + "[!] Browser console errors found:" + Style.RESET_ALL)
+            for error in errors:
+                print(f"- {error['text']}")
+                tester.add_finding('console', 'error', error['text'])
+        else:
+            print(Fore.GREEN + "[+] No browser console errors found" + Style.RESET_ALL)
+    except Exception as e:
+        print(Fore.YELLOW + f"[!] Could not retrieve browser logs: {str(e)}" + Style.RESET_ALL)
@@ -0,0 +1,61 @@
+"""Transport and CSRF protection of the forms on the page"""
+
+from colorama import Fore, Style
+from selenium.webdriver.common.by import By
+
+
+def run(tester, url):
+    test_forms(tester)
+
+
+def test_forms(tester):
+    """Test all forms on the page"""
+    try:
+        print(f"\n{Fore.CYAN}=== Form Testing ==={Style.RESET_ALL}")
+        forms = tester.driver.find_elements(By.TAG_NAME, 'form')
+        
+        if not forms:
+            print("No forms found on the page.")
+            return
+            
+        print(f"Found {len(forms)} form(s) on the page.")
+        
+        for i, form in enumerate(forms, 1):
+            print(f"\n{Fore.YELLOW}Form {i}:{Style.RESET_ALL}")
+            
+            # Get form attributes
+            form_id = form.get_attribute('id') or 'No ID'
+            form_action = form.get_attribute('action') or 'No action specified'
+            form_method = form.get_attribute('method') or 'GET'
+            
+            print(f"ID: {form_id}")
+            print(f"Action: {form_action}")
+            print(f"Method: {form_method}")
+            
+            # Check for password fields
+            password_fields = form.find_elements(By.CSS_SELECTOR, 'input[type="password"]')
+            if password_fields:
+                print(f"{Fore.YELLOW}[!] Contains password field(s) - check for HTTPS in form action{Style.RESET_ALL}")
+                if not form_action.startswith('https://'):
+                    tester.add_finding('forms', 'warning', f"Password form {form_id} does not post over HTTPS")
+            
+            # Check for CSRF token
+            csrf_tokens = form.find_elements(By.CSS_SELECTOR, 'input[name*="csrf"], input[name*="CSRF"]')
+            if not csrf_tokens:
+                print(f"{Fore.YELLOW}[!] No CSRF token detected - potential security risk{Style.RESET_ALL}")
+                tester.add_finding('forms', 'warning', f"No CSRF token in form {i} ({form_action})")
+            
+            # List all input fields
+            inputs = form.find_elements(By.TAG_NAME, 'input')
+            if inputs:
+                print("\nInput fields:")
+                for input_field in inputs:
+                    input_type = input_field.get_attribute('type') or 'text'
+                    input_name = input_field.get_attribute('name') or 'No name'
+                    input_id = input_field.get_attribute('id') or 'No ID'
+                    print(f"- {input_type.upper()}: {input_name} (ID: {input_id})")
+        
+        print(f"\n{Fore.GREEN}[✓] Form testing completed{Style.RESET_ALL}")
+        
+    except Exception as e:
+        print(Fore.RED + f"[!] Error testing forms: {str(e)}" + Style.RESET_ALL)
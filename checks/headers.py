@@ -0,0 +1,56 @@
+"""Security headers of the HTTP response"""
+
+import requests
+from colorama import Fore, Style
+
+
+def run(tester, url):
+    test_security_headers(tester, url)
+
+
+def test_security_headers(tester, url, response=None):
+    """Test for important security headers, reusing response if it was already fetched"""
+    try:
+        print(f"\n{Fore.CYAN}=== Testing Security Headers ==={Style.RESET_ALL}")
+        
+        if response is None:
+            response = tester.session.get(url, verify=False, timeout=tester.timeout)
+        headers = response.headers
+        
+        security_headers = {
+            'X-Content-Type-Options': 'Prevents MIME type sniffing',
+            'X-Frame-Options': 'Prevents clickjacking',
+            'X-XSS-Protection': 'Cross-site scripting filter',
+            'Content-Security-Policy': 'Prevents XSS and data injection',
+            'Strict-Transport-Security': 'Enforces HTTPS',
+            'Referrer-Policy': 'Controls referrer information',
+            'Permissions-Policy': 'Controls browser features',
+            'Cross-Origin-Opener-Policy': 'Isolates browsing context',
+            'Cross-Origin-Resource-Policy': 'Controls cross-origin requests'
+        }
+        
+        missing_headers = []
+        
+        for header, description in security_headers.items():
+            if header.lower() in (h.lower() for h in headers):
+                print(f"{Fore.GREEN}[✓] {header}: {headers.get(header, 'Present')}" + 
+                      f"{Style.DIM} - {description}{Style.RESET_ALL}")
+            else:
+                missing_headers.append(header)
+                tester.add_finding('headers', 'warning', f"Missing header: {header}")
+                print(f"{Fore.RED}[!] Missing: {header}{Style.RESET_ALL} {Style.DIM}- {description}{Style.RESET_ALL}")
+        
+        if missing_headers:
+            print(f"\n{Fore.YELLOW}Recommendations:")
+            for header in missing_headers:
+                print(f"- Consider adding the {header} header for better security")
+            print(Style.RESET_ALL)
+        
+        return len(missing_headers) == 0
+        
+    except Exception as e:
+        print(Fore.RED + f"[!] Error checking security headers: {str(e)}" + Style.RESET_ALL)
+        tester.add_finding('headers', 'error', "Could not fetch the response headers")
+        if isinstance(e, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)):
+            tester.unreachable = str(e)[:200]
+        return False
@@ -0,0 +1,77 @@
+"""Status of every link on the page, shared across pages through the link cache"""
+
+from colorama import Fore, Style
+
+from redirects import RedirectResolver, format_chain, needless_redirect
+
+# Unique absolute http(s) links of the current page
+LINKS_SCRIPT = """
+var seen = {};
+var links = [];
+var anchors = document.getElementsByTagName('a');
+for (var i = 0; i < anchors.length; i++) {
+    var href = anchors[i].href;
+    if (href && /^https?:/.test(href) && !seen[href]) {
+        seen[href] = true;
+        links.push(href);
+    }
+}
+return links;
+"""
+
+
+def run(tester, url):
+    print(f"\n{Fore.YELLOW}=== Link Validation ==={Style.RESET_ALL}")
+    check_broken_links(tester)
+
+
+def check_broken_links(tester):
+    """Check for broken links on the page"""
+    try:
+        # One script returns the unique hrefs, no WebElement is kept on the Python side
+        hrefs = tester.driver.execute_script(LINKS_SCRIPT) or []
+        print(f"Found {len(hrefs)} unique links on the page")
+        
+        broken_links = 0
+        for href in hrefs:
+            # Link results are shared across pages in a bounded cache
+            try:
+                result = tester.link_status[href]
+            except KeyError:
+                result = probe_link(tester, href)
+                tester.link_status[href] = result
+            
+            status = result['status']
+            # A single permanent hop (http -> https, a trailing slash) is normal, longer chains cost round trips
+            if needless_redirect(result['chain']):
+                chain = format_chain(result)
+                print(Fore.YELLOW + f"[!] Redirect ({len(result['chain'])} hop(s)): {chain}" + Style.RESET_ALL)
+                tester.add_finding('links', 'warning', f"Redirect ({len(result['chain'])} hop(s)): {chain}")
+            if result['error'] and status is not None:
+                print(Fore.RED + f"[!] Redirect error ({result['error']}): {href}" + Style.RESET_ALL)
+                tester.add_finding('links', 'error', f"Redirect error ({result['error']}): {href}")
+                broken_links += 1
+            elif status is None:
+                print(Fore.RED + f"[!] Error checking link {href}" + Style.RESET_ALL)
+                tester.add_finding('links', 'error', f"Unreachable link: {href}")
+                broken_links += 1
+            elif status >= 400:
+                print(Fore.RED + f"[!] Broken link ({status}): {href}" + Style.RESET_ALL)
+                tester.add_finding('links', 'error', f"Broken link ({status}): {href}")
+                broken_links += 1
+        
+        if broken_links == 0:
+            print(Fore.GREEN + "[+] No broken links found" + Style.RESET_ALL)
+        
+    except Exception as e:
+        print(Fore.YELLOW + f"[!] Error checking links: {str(e)}" + Style.RESET_ALL)
+
+
+def probe_link(tester, href):
+    """Resolve a link hop by hop; the status is None if it cannot be reached"""
+    if tester.redirects is None:
+        tester.redirects = RedirectResolver(tester.session, cache_size=tester.link_status.maxsize)
+    try:
+        return tester.redirects.resolve(href, timeout=min(5, tester.timeout))
+    except Exception as e:
+        return {'url': href, 'final_url': href, 'status': None, 'chain': [], 'error': str(e)[:200]}
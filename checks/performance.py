@@ -0,0 +1,65 @@
+"""Load time, transfer size and failed requests of a full page load"""
+
+from colorama import Fore, Style
+
+
+def run(tester, url):
+    test_performance(tester, url)
+
+
+def test_performance(tester, url):
+    """Test page load performance"""
+    try:
+        print(f"\n{Fore.CYAN}=== Performance Testing ==={Style.RESET_ALL}")
+        
+        # Always measure the complete page as visitors get it
+        load_time = tester.load(url, 'full', ('load',) + tester.readiness.conditions)
+        
+        # Navigation timings come from the captured Page events
+        timings = tester.events.page_timings()
+        print(f"Page loaded in {load_time:.2f} seconds")
+        if 'dom_content_loaded' in timings:
+            print(f"DOM loading time: {timings['dom_content_loaded']:.2f} seconds")
+        if 'load' in timings:
+            print(f"Full page load time: {timings['load']:.2f} seconds")
+        
+        # Sizes are the encoded bytes on the wire, also for cross-origin resources
+        resources = tester.events.requests()
+        total_size = sum(r['size'] for r in resources)
+        print(f"Requests: {len(resources)}, transferred: {total_size / (1024 * 1024):.2f} MB")
+        
+        failed = [r for r in resources if r['failed'] or (r['status'] or 0) >= 400]
+        if failed:
+            print(f"\n{Fore.RED}Failed requests:{Style.RESET_ALL}")
+            for resource in failed[:10]:
+                reason = resource['error'] or f"HTTP {resource['status']}"
+                print(f"- {resource['url']} ({reason})")
+                tester.add_finding('performance', 'error', f"Failed request: {resource['url']}")
+        
+        # Sort resources by size (largest first)
+        large_resources = sorted(
+            [r for r in resources if r['size'] > 102400],  # > 100KB
+            key=lambda x: x['size'],
+            reverse=True
+        )
+        
+        if large_resources:
+            print(f"\n{Fore.YELLOW}Large resources found (over 100KB):{Style.RESET_ALL}")
+            for i, resource in enumerate(large_resources[:5], 1):  # Show top 5
+                size_mb = resource['size'] / (1024 * 1024)
+                tester.add_finding('performance', 'warning', f"Large resource: {resource['url']}")
+                print(f"{i}. {resource['url']}")
+                print(f"   Type: {resource['type']}")
+                print(f"   Size: {size_mb:.2f} MB")
+                if resource['duration'] is not None:
+                    print(f"   Load time: {resource['duration']:.2f} ms")
+        
+        if tester.events.dropped:
+            print(Fore.YELLOW + f"[!] Event buffer overflowed, {tester.events.dropped} oldest event(s) were dropped" + Style.RESET_ALL)
+        
+        print(f"\n{Fore.GREEN}[✓] Performance testing completed{Style.RESET_ALL}")
+        return load_time
+        
+    except Exception as e:
+        print(Fore.RED + f"[!] Error during performance testing: {str(e)}" + Style.RESET_ALL)
+        return None
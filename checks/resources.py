@@ -0,0 +1,58 @@
+"""Mixed content, integrity, compression, caching and duplicates of the subresources"""
+
+from colorama import Fore, Style
+
+from resource_audit import INTEGRITY_SCRIPT, audit_resources, potential_savings
+
+
+def run(tester, url):
+    test_resources(tester, url)
+
+
+def test_resources(tester, url):
+    """Audit the subresources captured during the last page load"""
+    try:
+        print(f"\n{Fore.CYAN}=== Resource Audit ==={Style.RESET_ALL}")
+        
+        resources = tester.events.requests()
+        if not resources or tester.loaded_profile != 'full':
+            # Nothing captured yet or assets were blocked, load the full page once
+            tester.load(url, 'full')
+            resources = tester.events.requests()
+        
+        integrity_tags = tester.driver.execute_script(INTEGRITY_SCRIPT) or []
+        issues = audit_resources(tester.driver.current_url, resources, integrity_tags)
+        print(f"Audited {len(resources)} request(s)")
+        
+        if not issues:
+            print(Fore.GREEN + "[+] No resource issues found" + Style.RESET_ALL)
+            return issues
+        
+        labels = {
+            'mixed-content': 'Mixed content',
+            'sri': 'Missing subresource integrity',
+            'compression': 'Uncompressed assets',
+            'caching': 'Uncached assets',
+            'duplicate': 'Duplicate downloads',
+        }
+        for rule, label in labels.items():
+            entries = [(resource_url, message) for r, resource_url, message in issues if r == rule]
+            if not entries:
+                continue
+            color = Fore.RED if rule == 'mixed-content' else Fore.YELLOW
+            print(f"\n{color}[!] {label} ({len(entries)}):{Style.RESET_ALL}")
+            for resource_url, message in entries[:10]:
+                print(f"- {resource_url}: {message}")
+                tester.add_finding('resources', 'error' if rule == 'mixed-content' else 'warning',
+                                 f"{label}: {resource_url}")
+            if len(entries) > 10:
+                print(f"  ... and {len(entries) - 10} more")
+        
+        saved = potential_savings(resources, issues)
+        if saved:
+            print(f"\n{Fore.CYAN}[i] Estimated page weight reduction: {saved / 1024:.0f} KB{Style.RESET_ALL}")
+        return issues
+        
+    except Exception as e:
+        print(Fore.RED + f"[!] Error during resource audit: {str(e)}" + Style.RESET_ALL)
+        return None
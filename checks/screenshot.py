@@ -0,0 +1,74 @@
+"""Screenshot of the page, compared with its baseline when visual diffing is on"""
+
+from colorama import Fore, Style
+
+from incremental import dom_fingerprint
+from screenshots import ScreenshotPipeline
+
+
+def run(tester, url):
+    print(f"\n{Fore.YELLOW}=== Capturing Screenshot ==={Style.RESET_ALL}")
+    capture_page(tester, url)
+
+
+def capture_page(tester, url):
+    """Take a screenshot, unless the rendered page kept its structure"""
+    fingerprint = None
+    screenshot = None
+    if tester.state:
+        fingerprint = dom_fingerprint(tester.driver.page_source)
+        if tester.state.dom_unchanged(url, fingerprint) and tester.state.previous_screenshot(url):
+            screenshot = tester.state.previous_screenshot(url)
+            print(Fore.CYAN + f"[i] DOM structure unchanged, keeping {screenshot}" + Style.RESET_ALL)
+    if not screenshot:
+        if tester.loaded_profile != 'full':
+            # Captures and baselines need the images and fonts the load profile blocked
+            print(Fore.CYAN + "[i] Reloading with the full profile for the screenshot" + Style.RESET_ALL)
+            tester.load(url, 'full')
+        screenshot = take_screenshot(tester, url)
+    if tester.state:
+        tester.state.record(url, None, tester.findings, fingerprint, screenshot)
+    return screenshot
+
+
+def take_screenshot(tester, url):
+    """Take a screenshot of the current page, filed under the scanned URL"""
+    try:
+        # Encoding and the disk write happen on the pipeline's worker thread
+        png = tester.driver.get_screenshot_as_png()
+        if tester.screenshots is None:
+            tester.screenshots = ScreenshotPipeline()  # the writer thread starts with the first capture
+        # Under --replay the browser sees a local address with a random port
+        filename = tester.screenshots.submit(png, label=url)
+        print(Fore.GREEN + f"[+] Screenshot queued as {filename}" + Style.RESET_ALL)
+        if tester.visual and tester.loaded_profile == 'full':
+            compare_with_baseline(tester, url, png)
+        elif tester.visual:
+            print(Fore.YELLOW + f"[!] Page loaded with the {tester.loaded_profile} profile, "
+                  "skipping the visual comparison" + Style.RESET_ALL)
+        return filename
+    except Exception as e:
+        print(Fore.YELLOW + f"[!] Could not take screenshot: {str(e)}" + Style.RESET_ALL)
+        return None
+
+
+def compare_with_baseline(tester, url, png):
+    """Compare a capture with the stored baseline for the URL"""
+    try:
+        result = tester.visual.compare(url, png)
+        if result['status'] == 'baseline-created':
+            print(Fore.CYAN + "[i] No baseline yet, stored this capture as the baseline" + Style.RESET_ALL)
+        elif result['score'] < tester.visual_threshold:
+            print(Fore.GREEN + f"[+] No visual changes against baseline (score {result['score']:.4f})" + Style.RESET_ALL)
+        else:
+            regions = result['regions']
+            print(Fore.YELLOW + f"[!] Visual changes against baseline: {result['score']:.2%} of pixels in {len(regions)} region(s)" + Style.RESET_ALL)
+            if 'reason' in result:
+                print(f"- {result['reason']}")
+            for x, y, w, h in regions[:10]:
+                print(f"- {w}x{h} at ({x}, {y})")
+            tester.add_finding('visual', 'warning', f"Visual change in {len(regions)} region(s)")
+        return result
+    except Exception as e:
+        print(Fore.YELLOW + f"[!] Could not compare with baseline: {str(e)}" + Style.RESET_ALL)
+        return None
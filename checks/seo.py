@@ -0,0 +1,83 @@
+"""SEO elements of the page, plus the cross-page analysis when --seo-pages is above 1"""
+
+import threading
+from urllib.parse import urlparse
+
+from colorama import Fore, Style
+
+from seo import SiteSeoAnalyzer, page_issues, parse_document
+
+# Guards the run's set of analyzed hosts, which the testers' threads share
+_sites_lock = threading.Lock()
+
+
+def run(tester, url):
+    issues = test_seo(tester)
+    if tester.seo_pages > 1:
+        host = urlparse(url).netloc
+        first = True
+        if tester.seo_sites is not None:
+            with _sites_lock:
+                first = host not in tester.seo_sites
+                tester.seo_sites.add(host)
+        if first:
+            test_site_seo(tester, url, tester.seo_pages, tester.seo_cache)
+        else:
+            print(Fore.CYAN + f"[i] Site SEO analysis of {host} already done in this run" + Style.RESET_ALL)
+    return issues
+
+
+def test_seo(tester):
+    """Check for basic SEO elements"""
+    try:
+        print(f"\n{Fore.CYAN}=== SEO Checks ==={Style.RESET_ALL}")
+        
+        # Parse the rendered document once instead of one lookup per element
+        record = parse_document(tester.driver.current_url, tester.driver.page_source)
+        if record.title:
+            print(f"{Fore.GREEN}[✓] Page Title found: {record.title[:50]}...{Style.RESET_ALL}")
+        if record.description:
+            print(f"{Fore.GREEN}[✓] Meta Description found: {record.description[:50]}...{Style.RESET_ALL}")
+        
+        issues = page_issues(record)
+        for rule, severity, message in issues:
+            color = Fore.RED if severity == 'error' else Fore.YELLOW
+            print(f"{color}[!] {message}{Style.RESET_ALL}")
+            tester.add_finding('seo', severity, message)
+        if not issues:
+            print(f"{Fore.GREEN}[✓] No SEO issues found on this page{Style.RESET_ALL}")
+        return issues
+
+    except Exception as e:
+        print(Fore.RED + f"[!] Error during SEO checks: {str(e)}" + Style.RESET_ALL)
+        return None
+
+
+def test_site_seo(tester, url, max_pages=500, cache_path=None):
+    """Crawl the site and run the cross-page SEO checks"""
+    analyzer = SiteSeoAnalyzer(tester.session, max_pages=max_pages, cache_path=cache_path)
+    try:
+        print(f"\n{Fore.CYAN}=== Site SEO Analysis (up to {max_pages} pages) ==={Style.RESET_ALL}")
+        analyzer.crawl(url)
+        issues = analyzer.issues + analyzer.site_issues(analyzer.sitemap_urls(url))
+        print(f"Analyzed {len(analyzer.pages)} page(s)")
+        
+        by_rule = {}
+        for page, rule, message in issues:
+            by_rule.setdefault(rule, []).append((page, message))
+        for rule, entries in sorted(by_rule.items(), key=lambda item: -len(item[1])):
+            print(f"\n{Fore.YELLOW}[!] {rule}: {len(entries)} issue(s){Style.RESET_ALL}")
+            for page, message in entries[:5]:
+                print(f"- {page}: {message}")
+            if len(entries) > 5:
+                print(f"  ... and {len(entries) - 5} more")
+            tester.add_finding('seo', 'warning', f"Site {rule}: {len(entries)} issue(s)")
+        if not issues:
+            print(f"{Fore.GREEN}[✓] No site-level SEO issues found{Style.RESET_ALL}")
+        return issues
+        
+    except Exception as e:
+        print(Fore.RED + f"[!] Error during site SEO analysis: {str(e)}" + Style.RESET_ALL)
+        return None
+    finally:
+        analyzer.close()
@@ -0,0 +1,68 @@
+"""Validity and expiry of the site's TLS certificate"""
+
+import socket
+import ssl
+from datetime import datetime
+
+from colorama import Fore, Style
+
+from tracing import span
+
+
+def _connect(addresses, timeout=10):
+    """Connect to the first resolved address that answers, like socket.create_connection"""
+    error = None
+    for family, kind, proto, _, address in addresses:
+        sock = socket.socket(family, kind, proto)
+        try:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            return sock
+        except OSError as e:
+            error = e
+            sock.close()
+    raise error or OSError("No address to connect to")
+
+
+def run(tester, url):
+    """Check SSL certificate details"""
+    try:
+        print(f"\n{Fore.CYAN}=== SSL Certificate Check ==={Style.RESET_ALL}")
+        
+        if not url.startswith('https'):
+            print(f"{Fore.YELLOW}[!] Not an HTTPS URL, skipping SSL check{Style.RESET_ALL}")
+            return
+
+        hostname = url.replace('https://', '').split('/')[0]
+        context = ssl.create_default_context()
+        
+        # Resolved, connected and handshaken in steps so traces show which one was slow
+        with span(tester.tracer, 'dns', {'server.address': hostname}):
+            addresses = socket.getaddrinfo(hostname, 443, type=socket.SOCK_STREAM)
+        with span(tester.tracer, 'tcp connect', {'server.address': hostname}):
+            sock = _connect(addresses)
+        with sock:
+            with span(tester.tracer, 'tls handshake', {'server.address': hostname}):
+                ssock = context.wrap_socket(sock, server_hostname=hostname)
+            with ssock:
+                cert = ssock.getpeercert()
+                
+                not_after = datetime.strptime(cert['notAfter'], '%b %d %H:%M:%S %Y %Z')
+                days_left = (not_after - datetime.utcnow()).days
+                
+                print(f"Issued To: {dict(x[0] for x in cert['subject'])['commonName']}")
+                print(f"Issued By: {dict(x[0] for x in cert['issuer'])['commonName']}")
+                print(f"Valid Until: {not_after}")
+                
+                if days_left < 0:
+                    print(f"{Fore.RED}[!] Certificate EXPIRED {abs(days_left)} days ago{Style.RESET_ALL}")
+                    tester.add_finding('ssl', 'error', f"Certificate expired {abs(days_left)} days ago")
+                elif days_left < 30:
+                    print(f"{Fore.YELLOW}[!] Certificate expires soon ({days_left} days left){Style.RESET_ALL}")
+                    tester.add_finding('ssl', 'warning', f"Certificate expires in {days_left} days")
+                else:
+                    print(f"{Fore.GREEN}[✓] Certificate is valid ({days_left} days left){Style.RESET_ALL}")
+                    
+    except Exception as e:
+        print(Fore.RED + f"[!] Error checking SSL: {str(e)}" + Style.RESET_ALL)
+        tester.add_finding('ssl', 'error', f"Certificate check failed: {str(e)[:100]}")
@@ -0,0 +1,96 @@
+"""
+Z_H_10min - Finding records
+Compact result records and a writer that streams them to disk as JSON
+lines, so long runs never keep their results in memory.
+"""
+
+import json
+import sys
+import threading
+
+
+class Finding:
+    """One warning or error reported by a check"""
+    __slots__ = ('check', 'severity', 'message', 'url')
+
+    def __init__(self, check, severity, message, url=None):
+        self.check = check
+        self.severity = severity
+        self.message = message
+        self.url = url
+
+    def to_dict(self):
+        """Plain dict for JSON output"""
+        data = {'check': self.check, 'severity': self.severity, 'message': self.message}
+        if self.url:
+            data['url'] = self.url
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a finding from JSON output"""
+        return cls(data.get('check', ''), data.get('severity', 'warning'), data.get('message', ''), data.get('url'))
+
+    def __repr__(self):
+        return f"Finding({self.check!r}, {self.severity!r}, {self.message!r})"
+
+
+def to_dicts(findings):
+    """Convert findings for JSON output"""
+    return [finding.to_dict() for finding in findings]
+
+
+class ResultWriter:
+    def __init__(self, path):
+        """Write one JSON object per scanned URL to path ('-' for standard output)"""
+        self.lock = threading.Lock()
+        # sys.__stdout__ so that results still come out when --quiet silences the console
+        self.file = sys.__stdout__ if path == '-' else open(path, 'w', encoding='utf-8')
+
+    def add(self, url, findings, duration=None, error=None):
+        """Write the outcome of one URL"""
+        findings = [f if isinstance(f, Finding) else Finding.from_dict(f) for f in findings]
+        errors = sum(1 for f in findings if f.severity == 'error')
+        record = {
+            'url': url,
+            'status': 'error' if error else 'failed' if errors else 'passed',
+            'errors': errors,
+            'warnings': len(findings) - errors,
+            'duration': round(duration, 2) if duration is not None else None,
+            'findings': to_dicts(findings),
+        }
+        if error:
+            record['error'] = error
+        with self.lock:
+            self.file.write(json.dumps(record) + '\n')
+            self.file.flush()
+
+    def close(self):
+        """Close the output file"""
+        if self.file is not sys.__stdout__:
+            self.file.close()
+
+
+class FindingWriter:
+    def __init__(self, path):
+        """Append findings to path as one JSON object per line"""
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, 'a', encoding='utf-8', buffering=1024 * 64)
+
+    def write(self, url, findings):
+        """Stream the findings of one URL to disk"""
+        with self.lock:
+            for finding in findings:
+                record = finding.to_dict()
+                record['url'] = url
+                self.file.write(json.dumps(record) + '\n')
+            if not findings:
+                # Keep clean pages in the file so reports can count them
+                self.file.write(json.dumps({'url': url}) + '\n')
+            self.file.flush()
+
+    def close(self):
+        """Close the output file"""
+        with self.lock:
+            self.file.close()
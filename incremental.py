@@ -0,0 +1,143 @@
+"""
+Z_H_10min - Incremental scan state
+Stores a fingerprint of every scanned page so unchanged pages can reuse
+the findings of the previous run.
+"""
+
+import hashlib
+import json
+import os
+import time
+from html.parser import HTMLParser
+
+from findings import Finding, to_dicts
+
+# Headers that change on every response and must not invalidate a page
+VOLATILE_HEADERS = {
+    'date', 'age', 'expires', 'set-cookie', 'etag', 'last-modified',
+    'x-request-id', 'x-amz-request-id', 'x-amz-cf-id', 'cf-ray', 'server-timing',
+    'x-runtime', 'x-served-by', 'x-cache', 'x-cache-hits', 'x-timer', 'via',
+    'report-to', 'nel', 'content-length', 'connection', 'keep-alive',
+}
+
+
+class _StructureParser(HTMLParser):
+    """Feed tag names and attribute names into a running hash"""
+
+    def __init__(self, digest):
+        super().__init__(convert_charrefs=True)
+        self.digest = digest
+
+    def handle_starttag(self, tag, attrs):
+        names = sorted(name for name, _ in attrs)
+        self.digest.update(f"<{tag} {' '.join(names)}>".encode())
+
+    def handle_endtag(self, tag):
+        self.digest.update(f"</{tag}>".encode())
+
+
+def content_hash(text):
+    """Hash the raw HTML of a page"""
+    return hashlib.sha256((text or '').encode('utf-8', 'replace')).hexdigest()
+
+
+def headers_hash(headers):
+    """Hash the response headers, ignoring the ones that change per request"""
+    digest = hashlib.sha256()
+    lowered = {name.lower(): value for name, value in headers.items()}
+    for name in sorted(lowered):
+        if name in VOLATILE_HEADERS:
+            continue
+        digest.update(f"{name}:{lowered[name]}\n".encode('utf-8', 'replace'))
+    return digest.hexdigest()
+
+
+def dom_fingerprint(html):
+    """Hash the element structure of a rendered DOM, ignoring text and attribute values"""
+    digest = hashlib.sha256()
+    parser = _StructureParser(digest)
+    try:
+        parser.feed(html or '')
+        parser.close()
+    except Exception:
+        digest.update(content_hash(html).encode())
+    return digest.hexdigest()
+
+
+def finding_key(finding):
+    """Identity of a finding across runs"""
+    return (finding.get('check', ''), finding.get('message', ''))
+
+
+class ScanState:
+    def __init__(self, path):
+        """Load the state written by the previous run, if any"""
+        self.path = path
+        self.previous = {}
+        self.current = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.previous = json.load(f).get('pages', {})
+            except (OSError, ValueError):
+                self.previous = {}
+
+    def is_unchanged(self, url, response, checks=None):
+        """Return True if the HTML and headers match the previous run and the same checks ran"""
+        if response is None or url not in self.previous:
+            return False
+        entry = self.previous[url]
+        if checks is not None and entry.get('checks') != list(checks):
+            return False  # the stored findings come from other checks
+        return (entry.get('content_hash') == content_hash(response.text) and
+                entry.get('headers_hash') == headers_hash(response.headers))
+
+    def dom_unchanged(self, url, fingerprint):
+        """Return True if the rendered DOM has the same structure as last run"""
+        entry = self.previous.get(url)
+        return bool(entry) and entry.get('dom_fingerprint') == fingerprint
+
+    def previous_findings(self, url):
+        """Findings recorded for the URL by the previous run"""
+        return [Finding.from_dict(data) for data in self.previous.get(url, {}).get('findings', [])]
+
+    def previous_screenshot(self, url):
+        """Screenshot taken for the URL by the previous run"""
+        return self.previous.get(url, {}).get('screenshot')
+
+    def record(self, url, response, findings, fingerprint=None, screenshot=None, checks=None):
+        """Store the fingerprint and findings of the current run, and the checks behind them"""
+        entry = dict(self.current.get(url) or self.previous.get(url, {}))
+        if response is not None:
+            entry['content_hash'] = content_hash(response.text)
+            entry['headers_hash'] = headers_hash(response.headers)
+        if fingerprint:
+            entry['dom_fingerprint'] = fingerprint
+        if screenshot:
+            entry['screenshot'] = screenshot
+        if checks is not None:
+            entry['checks'] = list(checks)
+        entry['findings'] = to_dicts(findings)
+        entry['scanned_at'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+        self.current[url] = entry
+
+    def diff(self):
+        """Return new and resolved findings per URL compared with the previous run"""
+        result = {}
+        for url, entry in self.current.items():
+            old = {finding_key(f): f for f in self.previous.get(url, {}).get('findings', [])}
+            new = {finding_key(f): f for f in entry['findings']}
+            added = [new[k] for k in new if k not in old]
+            resolved = [old[k] for k in old if k not in new]
+            if added or resolved:
+                result[url] = {'new': added, 'resolved': resolved}
+        return result
+
+    def save(self):
+        """Write the merged state back to disk"""
+        pages = dict(self.previous)
+        pages.update(self.current)
+        tmp_path = self.path + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'version': 1, 'pages': pages}, f, indent=2)
+        os.replace(tmp_path, self.path)
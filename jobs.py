@@ -0,0 +1,195 @@
+"""
+Z_H_10min - Resumable scan jobs
+The work queue and the completed results live in a SQLite checkpoint, so
+a run that is killed or loses its browser resumes where it stopped.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    url TEXT PRIMARY KEY,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    updated_at REAL,
+    lease_owner TEXT,
+    lease_expires REAL,
+    checks TEXT
+);
+CREATE TABLE IF NOT EXISTS results (
+    url TEXT PRIMARY KEY,
+    findings TEXT NOT NULL,
+    completed_at REAL NOT NULL
+);
+"""
+
+
+def read_urls(path):
+    """Read one URL per line, skipping blanks and # comments"""
+    urls = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith('#'):
+                urls.append(line if line.startswith(('http://', 'https://')) else 'http://' + line)
+    return urls
+
+
+class JobStore:
+    def __init__(self, path, max_attempts=3, checks=None):
+        """Open (or create) the checkpoint at path; results of other checks than these are not reused"""
+        self.path = path
+        self.max_attempts = max_attempts
+        self.checks = json.dumps(list(checks)) if checks is not None else None
+        self.db = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.db.execute('PRAGMA journal_mode=WAL')
+        self.db.execute('PRAGMA synchronous=NORMAL')
+        self.db.executescript(SCHEMA)
+        columns = {row[1] for row in self.db.execute('PRAGMA table_info(jobs)')}
+        for column, kind in (('lease_owner', 'TEXT'), ('lease_expires', 'REAL'), ('checks', 'TEXT')):
+            if column not in columns:  # checkpoint written by an older version
+                self.db.execute(f'ALTER TABLE jobs ADD COLUMN {column} {kind}')
+        self.lock = threading.RLock()  # one connection shared by the broker's threads
+
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements atomically"""
+        with self.lock:
+            self.db.execute('BEGIN IMMEDIATE')
+            try:
+                yield self.db
+            except BaseException:
+                self.db.execute('ROLLBACK')
+                raise
+            self.db.execute('COMMIT')
+
+    def add(self, urls):
+        """Queue URLs; URLs already in the checkpoint keep their state unless other checks produced it"""
+        with self.transaction():
+            self.db.executemany(
+                "INSERT OR IGNORE INTO jobs (url, updated_at) VALUES (?, ?)",
+                [(url, time.time()) for url in urls]
+            )
+            if self.checks is not None:
+                stale = [(url,) for (url,) in self.db.execute(
+                    "SELECT url FROM jobs WHERE status IN ('done', 'failed') AND checks IS NOT ?", (self.checks,))]
+                self.db.executemany("DELETE FROM results WHERE url = ?", stale)
+                self.db.executemany(
+                    "UPDATE jobs SET status = 'pending', attempts = 0, last_error = NULL WHERE url = ?", stale)
+
+    def recover(self):
+        """Requeue jobs that were running when the previous process died"""
+        with self.transaction():
+            cursor = self.db.execute("UPDATE jobs SET status = 'pending' WHERE status = 'running'")
+        return cursor.rowcount
+
+    def expire_leases(self):
+        """Fail running jobs whose worker stopped sending heartbeats, so they are redelivered"""
+        with self.transaction():
+            cursor = self.db.execute(
+                "UPDATE jobs SET status = 'failed', last_error = 'lease expired (worker ' || "
+                "COALESCE(lease_owner, '?') || ')', lease_owner = NULL "
+                "WHERE status = 'running' AND lease_expires IS NOT NULL AND lease_expires < ?",
+                (time.time(),)
+            )
+        return cursor.rowcount
+
+    def heartbeat(self, url, worker, lease):
+        """Extend a worker's lease; returns False if the job is no longer leased to it"""
+        with self.transaction():
+            cursor = self.db.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE url = ? AND lease_owner = ? AND status = 'running'",
+                (time.time() + lease, url, worker)
+            )
+        return cursor.rowcount == 1
+
+    def claim(self, worker=None, lease=None):
+        """Mark the next pending or retryable job as running and return its URL"""
+        with self.transaction():
+            # 'pending' sorts after 'failed', so fresh jobs go before retries
+            row = self.db.execute(
+                "SELECT url FROM jobs WHERE status = 'pending' "
+                "OR (status = 'failed' AND attempts < ?) ORDER BY status DESC, rowid LIMIT 1",
+                (self.max_attempts,)
+            ).fetchone()
+            if row:
+                self.db.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, updated_at = ?, "
+                    "lease_owner = ?, lease_expires = ? WHERE url = ?",
+                    (time.time(), worker, time.time() + lease if lease else None, row[0])
+                )
+        return row[0] if row else None
+
+    def complete(self, url, findings):
+        """Store the result and mark the job done in one transaction (safe to repeat)"""
+        with self.transaction():
+            self.db.execute(
+                "INSERT OR REPLACE INTO results (url, findings, completed_at) VALUES (?, ?, ?)",
+                (url, json.dumps(findings), time.time())
+            )
+            self.db.execute(
+                "UPDATE jobs SET status = 'done', last_error = NULL, lease_owner = NULL, updated_at = ?, checks = ? "
+                "WHERE url = ?",
+                (time.time(), self.checks, url)
+            )
+
+    def fail(self, url, error):
+        """Mark a job as failed; it is retried until max_attempts is reached"""
+        with self.transaction():
+            self.db.execute(
+                "UPDATE jobs SET status = 'failed', last_error = ?, lease_owner = NULL, updated_at = ?, checks = ? "
+                "WHERE url = ? AND status != 'done'",  # a late report must not undo another worker's result
+                (str(error)[:500], time.time(), self.checks, url)
+            )
+
+    def release(self, url, worker=None):
+        """Put a job back without counting the attempt (e.g. on Ctrl+C); only the worker's own lease"""
+        with self.transaction():
+            self.db.execute(
+                "UPDATE jobs SET status = 'pending', attempts = MAX(attempts - 1, 0), lease_owner = NULL "
+                "WHERE url = ? AND status = 'running' AND (? IS NULL OR lease_owner = ?)",
+                (url, worker, worker)
+            )
+
+    def counts(self):
+        """Number of jobs per status"""
+        with self.lock:
+            return dict(self.db.execute("SELECT status, COUNT(*) FROM jobs GROUP BY status").fetchall())
+
+    def remaining(self):
+        """Jobs that are pending, running or still retryable"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT COUNT(*) FROM jobs WHERE status IN ('pending', 'running') "
+                "OR (status = 'failed' AND attempts < ?)", (self.max_attempts,)
+            ).fetchone()[0]
+
+    def results(self):
+        """Iterate over (url, findings) for completed jobs"""
+        last = 0
+        while True:
+            with self.lock:
+                rows = self.db.execute(
+                    "SELECT rowid, url, findings FROM results WHERE rowid > ? ORDER BY rowid LIMIT 500", (last,)
+                ).fetchall()
+            if not rows:
+                return
+            for last, url, findings in rows:
+                yield url, json.loads(findings)
+
+    def failures(self):
+        """(url, last_error) for jobs that ran out of attempts"""
+        with self.lock:
+            return self.db.execute(
+                "SELECT url, last_error FROM jobs WHERE status = 'failed' AND attempts >= ? ORDER BY rowid",
+                (self.max_attempts,)
+            ).fetchall()
+
+    def close(self):
+        """Close the checkpoint database"""
+        self.db.close()
@@ -0,0 +1,152 @@
+"""
+Z_H_10min - Memory limits
+Measures the memory of the scanner and of its browser, recycles the
+browser when it grows too large and stops a worker before it exceeds
+its budget. Also provides the bounded caches used by the checks.
+"""
+
+import gc
+import os
+import sys
+from collections import OrderedDict
+
+try:
+    import psutil
+except ImportError:  # fall back to /proc on Linux
+    psutil = None
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
+
+class BoundedCache(OrderedDict):
+    """Dict that forgets its least recently used entries beyond maxsize"""
+
+    def __init__(self, maxsize=10000):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
+
+
+def _page_size_mb():
+    return os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+
+
+def process_rss_mb(pid=None):
+    """Resident memory of a process in MB, or None if it cannot be read"""
+    pid = pid or os.getpid()
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss / (1024 * 1024)
+        except psutil.Error:
+            return None
+    try:
+        with open(f'/proc/{pid}/statm') as f:
+            return int(f.read().split()[1]) * _page_size_mb()
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _children(pid):
+    """Direct child pids of a process"""
+    if psutil is not None:
+        try:
+            return [child.pid for child in psutil.Process(pid).children()]
+        except psutil.Error:
+            return []
+    children = []
+    try:
+        for task in os.listdir(f'/proc/{pid}/task'):
+            with open(f'/proc/{pid}/task/{task}/children') as f:
+                children.extend(int(child) for child in f.read().split())
+    except (OSError, ValueError):
+        pass
+    return children
+
+
+def tree_rss_mb(pid):
+    """Resident memory of a process and all its descendants in MB"""
+    total = 0.0
+    stack = [pid]
+    seen = set()
+    while stack:
+        current = stack.pop()
+        if current in seen:
+            continue
+        seen.add(current)
+        rss = process_rss_mb(current)
+        if rss:
+            total += rss
+        stack.extend(_children(current))
+    return total
+
+
+def peak_rss_mb():
+    """Peak resident memory of this process in MB"""
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    if psutil is not None:
+        info = psutil.Process().memory_info()
+        return getattr(info, 'peak_wset', info.rss) / (1024 * 1024)
+    return 0.0
+
+
+class MemoryGuard:
+    def __init__(self, max_rss_mb=None, browser_max_rss_mb=None):
+        """Watch the scanner against max_rss_mb and its browser against browser_max_rss_mb"""
+        self.max_rss_mb = max_rss_mb
+        self.browser_max_rss_mb = browser_max_rss_mb
+        self.peak_browser_mb = 0.0
+        self.recycles = 0
+        self.exhausted = False
+
+    def browser_rss_mb(self, driver):
+        """Memory of chromedriver and the Chrome processes it started"""
+        try:
+            return tree_rss_mb(driver.service.process.pid)
+        except Exception:
+            return None
+
+    def check(self, tester):
+        """Call between pages: recycles the browser or flags the worker as exhausted"""
+        if tester.driver is not None:
+            browser = self.browser_rss_mb(tester.driver)
+            if browser:
+                self.peak_browser_mb = max(self.peak_browser_mb, browser)
+                if self.browser_max_rss_mb and browser > self.browser_max_rss_mb:
+                    tester.recycle_driver(f"browser uses {browser:.0f} MB")
+                    self.recycles += 1
+
+        if self.max_rss_mb:
+            rss = process_rss_mb()
+            if rss and rss > self.max_rss_mb:
+                tester.link_status.clear()
+                if tester.redirects:
+                    tester.redirects.urls.clear()
+                gc.collect()
+                rss = process_rss_mb()
+                if rss and rss > self.max_rss_mb:
+                    self.exhausted = True  # stop taking work, the checkpoint resumes elsewhere
+        return not self.exhausted
+
+    def summary(self):
+        """Peak memory figures for the end-of-run report"""
+        return {
+            'peak_rss_mb': round(peak_rss_mb(), 1),
+            'peak_browser_mb': round(self.peak_browser_mb, 1),
+            'browser_recycles': self.recycles,
+            'exhausted': self.exhausted,
+        }
@@ -0,0 +1,52 @@
+"""
+Z_H_10min - Load profiles
+Non-visual checks do not need images, fonts, media or analytics tags.
+A profile is a list of URL patterns the browser blocks through the
+DevTools Network domain, so it can be switched between page loads
+without restarting Chrome.
+"""
+
+
+def _extensions(*names):
+    """Patterns for files with these extensions, with or without a query string"""
+    return [pattern for name in names for pattern in (f'*.{name}', f'*.{name}?*')]
+
+
+# URL patterns understood by Network.setBlockedURLs ('*' is a wildcard matching the whole URL)
+IMAGES = _extensions('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'ico', 'bmp', 'svg')
+FONTS = _extensions('woff', 'woff2', 'ttf', 'otf', 'eot')
+MEDIA = _extensions('mp4', 'webm', 'ogg', 'mp3', 'wav', 'm4a', 'mov', 'm3u8')
+STYLES = _extensions('css')
+
+# Analytics, ads and tag managers that never affect the checks
+TRACKERS = [
+    '*google-analytics.com*', '*googletagmanager.com*', '*googlesyndication.com*',
+    '*doubleclick.net*', '*adservice.google.*', '*connect.facebook.net*', '*hotjar.com*',
+    '*segment.com*', '*segment.io*', '*mixpanel.com*', '*clarity.ms*', '*newrelic.com*',
+    '*nr-data.net*', '*intercom.io*', '*hs-scripts.com*', '*hs-analytics.net*',
+    '*scorecardresearch.com*', '*quantserve.com*', '*taboola.com*', '*outbrain.com*',
+    '*criteo.com*', '*adsrvr.org*', '*amazon-adsystem.com*', '*bing.com/bat*',
+    '*snap.licdn.com*', '*static.ads-twitter.com*', '*tiktok.com/i18n/pixel*',
+]
+
+PROFILES = {
+    'full': [],
+    'no-media': IMAGES + FONTS + MEDIA + TRACKERS,
+    'dom-only': IMAGES + FONTS + MEDIA + STYLES + TRACKERS,
+}
+
+# Chrome reports requests blocked by a profile with this error
+BLOCKED_ERROR = 'ERR_BLOCKED_BY_CLIENT'
+
+
+def apply_profile(driver, name):
+    """Block the resources excluded by a profile for the following page loads"""
+    if name not in PROFILES:
+        raise ValueError(f"Unknown load profile '{name}', choose from {', '.join(PROFILES)}")
+    driver.execute_cdp_cmd('Network.enable', {})
+    driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': PROFILES[name]})
+
+
+def is_blocked(message):
+    """True for console errors caused by the profile rather than by the page"""
+    return BLOCKED_ERROR in message
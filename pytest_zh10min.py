@@ -0,0 +1,218 @@
+"""
+Z_H_10min - pytest plugin
+Turns every (URL, check) pair into a pytest item so deploys can be gated
+in CI. URLs come from *.urls files (one URL per line) given to pytest.
+Items run one after another, so each test process starts one browser and
+shares it; to scan with more browsers, use pytest-xdist workers
+(--dist loadgroup keeps the checks of one URL on the same worker so they
+reuse its page load).
+
+    pytest -p pytest_zh10min smoke.urls --zh-max-load-time 5 -n 8 --dist loadgroup
+"""
+
+import pytest
+
+from checks import PAGE, REGISTRY
+from checks.console import check_console_errors
+from checks.forms import test_forms
+from checks.headers import test_security_headers
+from checks.links import check_broken_links
+from checks.performance import test_performance
+from checks.resources import test_resources
+from jobs import read_urls
+from profiles import PROFILES
+
+# Checks with their own thresholds; any other registered check fails on error findings
+CHECKS = ('console', 'links', 'forms', 'headers', 'performance', 'resources')
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup('zh10min', 'Z_H_10min website checks')
+    group.addoption('--zh-checks', default=','.join(CHECKS),
+                    help=f"Comma-separated checks to run per URL (default: {','.join(CHECKS)})")
+    group.addoption('--zh-headed', action='store_true', help='Show the browser windows')
+    group.addoption('--zh-profile', choices=list(PROFILES), default='no-media',
+                    help='Load profile for the DOM checks (default no-media)')
+    group.addoption('--zh-max-load-time', type=float, default=10.0, help='Fail pages slower than this many seconds')
+    group.addoption('--zh-max-broken-links', type=int, default=0, help='Broken links allowed per page')
+    group.addoption('--zh-max-console-errors', type=int, default=0, help='Console errors allowed per page')
+    group.addoption('--zh-allow-missing-header', action='append', default=[], metavar='HEADER',
+                    help='Security header that may be missing (repeatable)')
+
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 'xdist_group(name): run the checks of one URL on the same xdist worker')
+    config.addinivalue_line('markers', 'zh10min: a Z_H_10min website check')
+
+
+def pytest_collect_file(parent, file_path):
+    if file_path.suffix == '.urls':
+        return UrlsFile.from_parent(parent, path=file_path)
+
+
+class CheckFailed(Exception):
+    """A check exceeded its threshold"""
+
+
+class BrowserPool:
+    """The tester shared by all items of a test process"""
+
+    def __init__(self, config):
+        self.config = config
+        self.tester = None
+        self.failure = None  # why Chrome could not be started, so later items do not try again
+        self.loaded = {}  # id(tester) -> URL currently open in its browser
+
+    def acquire(self, browser):
+        """The process's tester; Chrome is started for the first item that needs it"""
+        if self.tester is None:
+            from readiness import ReadinessPolicy
+            from web_tester import WebTester
+            timeout = max(self.config.getoption('zh_max_load_time') * 3, 30)
+            self.tester = WebTester(headless=not self.config.getoption('zh_headed'),
+                                    profile=self.config.getoption('zh_profile'),
+                                    readiness=ReadinessPolicy(timeout=timeout), browser=False)
+        if browser and self.tester.driver is None:
+            if self.failure is None:
+                try:
+                    self.tester.setup_driver()
+                except SystemExit:  # setup_driver exits the CLI when Chrome does not start
+                    self.failure = "Chrome could not be started, see the output of the first browser check"
+            if self.failure:
+                pytest.fail(self.failure, pytrace=False)
+        return self.tester
+
+    def release(self, tester, broken=False):
+        """Restart the tester's browser if the check crashed it"""
+        if broken and tester.driver:
+            self.loaded.pop(id(tester), None)
+            try:
+                tester.recycle_driver("check raised an error")
+            except SystemExit:
+                self.failure = "Chrome could not be restarted after a check crashed it"
+
+    def open(self, tester, url):
+        """Load url unless the tester's browser already shows it"""
+        if self.loaded.get(id(tester)) != url:
+            tester.load(url)
+            self.loaded[id(tester)] = url
+
+    def close(self):
+        if self.tester is not None:
+            self.tester.cleanup()
+
+
+def _pool(config):
+    pool = getattr(config, '_zh10min_pool', None)
+    if pool is None:
+        pool = config._zh10min_pool = BrowserPool(config)
+    return pool
+
+
+def pytest_unconfigure(config):
+    pool = getattr(config, '_zh10min_pool', None)
+    if pool is not None:
+        pool.close()
+
+
+class UrlsFile(pytest.File):
+    """A file with one URL per line"""
+
+    def collect(self):
+        checks = [c for c in self.config.getoption('zh_checks').split(',') if c]
+        unknown = [c for c in checks if c not in REGISTRY]
+        if unknown:
+            raise pytest.UsageError(f"Unknown check(s): {', '.join(unknown)}")
+        for url in read_urls(str(self.path)):
+            for check in checks:
+                item = CheckItem.from_parent(self, name=f"{url}::{check}", url=url, check=check)
+                item.add_marker(pytest.mark.xdist_group(url))
+                item.add_marker(pytest.mark.zh10min)
+                yield item
+
+
+class CheckItem(pytest.Item):
+    def __init__(self, *, url, check, **kwargs):
+        super().__init__(**kwargs)
+        self.url = url
+        self.check = check
+
+    def runtest(self):
+        pool = _pool(self.config)
+        tester = pool.acquire(REGISTRY[self.check].uses_browser)
+        broken = False
+        try:
+            tester.findings = []
+            getattr(self, f'check_{self.check}', self.check_registered)(tester, pool)
+        except CheckFailed:
+            raise
+        except Exception:
+            broken = True
+            raise
+        finally:
+            pool.release(tester, broken)
+
+    def _findings(self, tester, check, severity=None):
+        return [f for f in tester.findings if f.check == check and (severity is None or f.severity == severity)]
+
+    def _fail_if(self, findings, allowed, what):
+        if len(findings) > allowed:
+            details = '\n'.join(f"  - {f.message}" for f in findings[:20])
+            raise CheckFailed(f"{len(findings)} {what} (allowed {allowed}):\n{details}")
+
+    def check_console(self, tester, pool):
+        pool.open(tester, self.url)
+        check_console_errors(tester)
+        self._fail_if(self._findings(tester, 'console'), self.config.getoption('zh_max_console_errors'),
+                      'console error(s)')
+
+    def check_links(self, tester, pool):
+        pool.open(tester, self.url)
+        check_broken_links(tester)
+        self._fail_if(self._findings(tester, 'links', 'error'), self.config.getoption('zh_max_broken_links'),
+                      'broken link(s)')
+
+    def check_forms(self, tester, pool):
+        pool.open(tester, self.url)
+        test_forms(tester)
+        self._fail_if(self._findings(tester, 'forms'), 0, 'form issue(s)')
+
+    def check_headers(self, tester, pool):
+        test_security_headers(tester, self.url)
+        allowed = {h.lower() for h in self.config.getoption('zh_allow_missing_header')}
+        missing = [f for f in self._findings(tester, 'headers')
+                   if f.message.split(': ', 1)[-1].lower() not in allowed]
+        self._fail_if(missing, 0, 'missing security header(s)')
+
+    def check_performance(self, tester, pool):
+        load_time = test_performance(tester, self.url)
+        pool.loaded.pop(id(tester), None)  # reloaded with the full profile
+        if load_time is None:
+            raise CheckFailed("Could not measure the page load")
+        limit = self.config.getoption('zh_max_load_time')
+        if load_time > limit:
+            raise CheckFailed(f"Page loaded in {load_time:.2f}s (limit {limit:.2f}s)")
+        self._fail_if(self._findings(tester, 'performance', 'error'), 0, 'failed request(s)')
+
+    def check_resources(self, tester, pool):
+        tester.events.reset()  # audit a fresh full load, not a previous item's capture
+        test_resources(tester, self.url)
+        pool.loaded.pop(id(tester), None)
+        self._fail_if(self._findings(tester, 'resources', 'error'), 0, 'mixed content resource(s)')
+
+    def check_registered(self, tester, pool):
+        spec = REGISTRY[self.check]
+        if PAGE in spec.needs:
+            pool.open(tester, self.url)
+        elif spec.uses_browser:
+            pool.loaded.pop(id(tester), None)  # the check navigates away
+        spec.run(tester, self.url)
+        self._fail_if([f for f in tester.findings if f.severity == 'error'], 0, f'{self.check} error(s)')
+
+    def repr_failure(self, excinfo):
+        if isinstance(excinfo.value, CheckFailed):
+            return f"{self.check} check failed for {self.url}\n{excinfo.value}"
+        return super().repr_failure(excinfo)
+
+    def reportinfo(self):
+        return self.path, None, f"{self.url} [{self.check}]"
@@ -0,0 +1,111 @@
+"""
+Z_H_10min - Page readiness
+Decides when a page is ready for the checks instead of trusting the
+return of driver.get: document state, network idle from the captured
+DevTools events, DOM mutation quiescence and custom selectors, all
+bounded by one hard deadline per page.
+"""
+
+import time
+
+STRATEGIES = ('normal', 'eager', 'none')
+CONDITIONS = ('load', 'network-idle', 'dom-quiet')
+
+# Installed before any page script runs, records the time of the last DOM mutation
+MUTATION_SCRIPT = """
+(function () {
+    if (window.__zhLastMutation !== undefined) { return; }
+    window.__zhLastMutation = performance.now();
+    new MutationObserver(function () { window.__zhLastMutation = performance.now(); })
+        .observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+})();
+"""
+
+QUIET_SCRIPT = """
+if (window.__zhLastMutation === undefined) { return null; }
+return performance.now() - window.__zhLastMutation;
+"""
+
+
+class ReadinessPolicy:
+    def __init__(self, strategy='normal', conditions=(), selector=None, timeout=15, idle_time=0.5,
+                 max_inflight=0, poll_interval=0.1):
+        """Wait for conditions (and selector) after each navigation, for at most timeout seconds"""
+        if strategy not in STRATEGIES:
+            raise ValueError(f"Unknown page load strategy '{strategy}'")
+        unknown = [c for c in conditions if c not in CONDITIONS]
+        if unknown:
+            raise ValueError(f"Unknown readiness condition(s): {', '.join(unknown)}")
+        self.strategy = strategy
+        self.conditions = tuple(conditions)
+        self.selector = selector
+        self.timeout = timeout
+        self.idle_time = idle_time
+        self.max_inflight = max_inflight
+        self.poll_interval = poll_interval
+
+    def configure(self, chrome_options):
+        """Let driver.get return early for eager/none, the policy decides the rest"""
+        chrome_options.page_load_strategy = self.strategy
+
+    def install(self, driver):
+        """Register the mutation observer for every new document"""
+        if 'dom-quiet' not in self.conditions:
+            return
+        try:
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': MUTATION_SCRIPT})
+        except Exception:
+            pass  # installed on the loaded page in wait() instead
+
+    def _checks(self, conditions, selector):
+        """Condition name -> callable(driver, events, now) that is True once satisfied"""
+        checks = {}
+        if 'load' in conditions:
+            checks['load'] = lambda driver, events, now: driver.execute_script('return document.readyState') == 'complete'
+        elif self.strategy == 'none':
+            # Without any strategy the document may not even exist yet
+            checks['interactive'] = lambda driver, events, now: driver.execute_script('return document.readyState') != 'loading'
+        if 'network-idle' in conditions:
+            idle_since = [None]
+
+            def network_idle(driver, events, now):
+                events.drain()
+                if events.pending_requests() > self.max_inflight:
+                    idle_since[0] = None
+                    return False
+                if idle_since[0] is None:
+                    idle_since[0] = now
+                return now - idle_since[0] >= self.idle_time
+            checks['network-idle'] = network_idle
+        if 'dom-quiet' in conditions:
+            def dom_quiet(driver, events, now):
+                quiet = driver.execute_script(QUIET_SCRIPT)
+                if quiet is None:
+                    driver.execute_script(MUTATION_SCRIPT)
+                    return False
+                return quiet >= self.idle_time * 1000
+            checks['dom-quiet'] = dom_quiet
+        if selector:
+            checks['selector'] = lambda driver, events, now: driver.execute_script(
+                'return document.querySelector(arguments[0]) !== null', selector)
+        return checks
+
+    def wait(self, driver, events, conditions=None, deadline=None):
+        """Poll until every condition holds or the deadline passes; returns (ready, waited, pending)"""
+        conditions = self.conditions if conditions is None else conditions
+        checks = self._checks(conditions, self.selector)
+        start = time.time()
+        deadline = deadline or start + self.timeout
+        pending = list(checks)
+        while pending:
+            now = time.time()
+            for name in list(pending):
+                try:
+                    if checks[name](driver, events, now):
+                        pending.remove(name)
+                except Exception:
+                    continue  # page navigating or script context gone, retry next poll
+            if not pending or now >= deadline:
+                break
+            time.sleep(self.poll_interval)
+        return not pending, time.time() - start, pending
@@ -0,0 +1,115 @@
+"""
+Z_H_10min - Redirect resolver
+Follows redirects hop by hop and remembers permanent ones (301/308), so
+links that go through the same http -> https -> www chain are rewritten
+to their target before they are probed. Each result keeps the full chain.
+"""
+
+import threading
+from urllib.parse import urljoin, urlsplit
+
+import requests
+
+from memory import BoundedCache
+
+PERMANENT = (301, 308)
+REDIRECTS = (301, 302, 303, 307, 308)
+
+
+def origin_of(url):
+    """scheme://host[:port] of a URL"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class RedirectResolver:
+    def __init__(self, session, max_hops=10, cache_size=10000):
+        """Resolve URLs with session, caching permanent redirects"""
+        self.session = session
+        self.max_hops = max_hops
+        # A permanent redirect that keeps path and query moves the whole origin
+        self.origins = {}  # origin -> canonical origin
+        self.urls = BoundedCache(cache_size)  # URL -> target of a path-specific permanent redirect
+        self.lock = threading.Lock()
+
+    def _learn(self, url, status, target):
+        if status not in PERMANENT:
+            return
+        source, moved = urlsplit(url), urlsplit(target)
+        with self.lock:
+            if (source.path or '/', source.query) == (moved.path or '/', moved.query):
+                self.origins[origin_of(url)] = origin_of(target)
+            else:
+                self.urls[url] = target
+
+    def rewrite(self, url):
+        """Apply the cached permanent redirects; returns the new URL and the hops taken"""
+        hops = []
+        seen = {url}
+        while len(hops) < self.max_hops:
+            with self.lock:
+                target = self.urls.get(url)
+                if target is None:
+                    canonical = self.origins.get(origin_of(url))
+                    if canonical:
+                        target = canonical + url[len(origin_of(url)):]
+            if target is None or target in seen:
+                break
+            hops.append({'url': url, 'status': 'cached', 'location': target})
+            seen.add(target)
+            url = target
+        return url, hops
+
+    def _request(self, url, timeout):
+        try:
+            response = self.session.head(url, allow_redirects=False, timeout=timeout, verify=False)
+            if response.status_code not in (405, 501):
+                return response
+        except requests.exceptions.SSLError:
+            pass
+        # Some servers reject HEAD or break on it, ask with a streamed GET instead
+        response = self.session.get(url, allow_redirects=False, timeout=timeout, verify=False, stream=True)
+        response.close()
+        return response
+
+    def resolve(self, url, timeout=5):
+        """Follow url to its final response: {'url', 'final_url', 'status', 'chain', 'error'}"""
+        current, chain = self.rewrite(url)
+        result = {'url': url, 'final_url': current, 'status': None, 'chain': chain, 'error': None}
+        seen = {url, current}
+        while True:
+            try:
+                response = self._request(current, timeout)
+            except requests.exceptions.RequestException as e:
+                result['error'] = str(e)[:200]
+                return result
+            location = response.headers.get('Location')
+            if response.status_code not in REDIRECTS or not location:
+                result['status'] = response.status_code
+                result['final_url'] = current
+                return result
+            target = urljoin(current, location)
+            chain.append({'url': current, 'status': response.status_code, 'location': target})
+            self._learn(current, response.status_code, target)
+            if target in seen or len(chain) >= self.max_hops:
+                result['status'] = response.status_code
+                result['final_url'] = target
+                result['error'] = 'redirect loop' if target in seen else 'too many redirects'
+                return result
+            seen.add(target)
+            current = target
+
+
+def needless_redirect(chain):
+    """Whether a chain is worth reporting: more than one hop, or a redirect that is not permanent"""
+    return len(chain) > 1 or any(hop['status'] not in PERMANENT + ('cached',) for hop in chain)
+
+
+def format_chain(result):
+    """'a -(301)-> b -(302)-> c' for printing and findings"""
+    if not result['chain']:
+        return result['url']
+    parts = [result['chain'][0]['url']]
+    for hop in result['chain']:
+        parts.append(f"-({hop['status']})-> {hop['location']}")
+    return ' '.join(parts)
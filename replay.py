@@ -0,0 +1,354 @@
+"""
+Z_H_10min - Record and replay
+Records every HTTP exchange of the shared session and a snapshot of each
+page the browser loaded into a HAR file. Replays serve the archive to the
+HTTP checks through a transport adapter and to the browser through a
+local stand-in server, so checks can be developed and benchmarked
+offline with the same inputs every run.
+"""
+
+import argparse
+import base64
+import html
+import io
+import json
+import re
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+# Kept out of archives, which tend to be shared
+REDACTED = ('authorization', 'cookie', 'set-cookie', 'proxy-authorization')
+SCRIPTS = re.compile(r'<script\b[^>]*>.*?</script\s*>', re.IGNORECASE | re.DOTALL)
+HEAD = re.compile(r'<head\b[^>]*>', re.IGNORECASE)
+STREAM_LIMIT = 1024 * 1024  # streamed bodies above this are recorded without their content
+
+
+def _headers(headers):
+    return [{'name': name, 'value': 'redacted' if name.lower() in REDACTED else value}
+            for name, value in headers.items()]
+
+
+def normalize(url):
+    """URL in the form requests sends it, so snapshots and lookups agree on keys"""
+    request = requests.PreparedRequest()
+    request.prepare_url(url, None)
+    return request.url
+
+
+def _content(body, mime_type):
+    """HAR content object, base64 for anything that is not UTF-8 text"""
+    if body is None:
+        return {'size': -1, 'mimeType': mime_type, 'comment': 'body not recorded'}
+    try:
+        return {'size': len(body), 'mimeType': mime_type, 'text': body.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'size': len(body), 'mimeType': mime_type, 'text': base64.b64encode(body).decode('ascii'),
+                'encoding': 'base64'}
+
+
+class _Replayed(io.RawIOBase):
+    """The bytes the recorder already read from a stream, then the rest of it"""
+
+    def __init__(self, head, raw):
+        self.head = io.BytesIO(head)
+        self.raw = raw
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        count = self.head.readinto(buffer)
+        if count:
+            return count
+        data = self.raw.read(len(buffer), decode_content=True)
+        buffer[:len(data)] = data
+        return len(data)
+
+    def release_conn(self):
+        self.raw.release_conn()
+
+    def close(self):
+        self.raw.close()
+        super().close()
+
+
+def _started(timestamp):
+    return datetime.fromtimestamp(timestamp, timezone.utc).isoformat().replace('+00:00', 'Z')
+
+
+class HarRecorder:
+    def __init__(self, path):
+        """Stream HAR entries to path; pages are written when the recorder is closed"""
+        self.path = path
+        self.lock = threading.Lock()
+        self.pages = []
+        self.entries = 0
+        self.file = open(path, 'w', encoding='utf-8')
+        self.file.write('{"log": {"version": "1.2", "creator": {"name": "Z_H_10min", "version": "1.0"},\n'
+                        '"entries": [\n')
+
+    def attach(self, session):
+        """Record every response of a requests session"""
+        session.hooks['response'].append(self.on_response)
+
+    def _write(self, entry):
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write((',\n' if self.entries else '') + json.dumps(entry))
+            self.entries += 1
+
+    def on_response(self, response, *args, **kwargs):
+        """requests response hook"""
+        request = response.request
+        if request.method == 'HEAD':
+            body = b''
+        elif kwargs.get('stream'):
+            # Streamed responses may be whole downloads, only their start is read; the caller gets it back
+            head = response.raw.read(STREAM_LIMIT + 1, decode_content=True)
+            response.raw = _Replayed(head, response.raw)
+            body = head if len(head) <= STREAM_LIMIT else None
+        else:
+            body = response.content
+        elapsed = response.elapsed.total_seconds() * 1000
+        self._write({
+            'startedDateTime': _started(time.time() - elapsed / 1000),
+            'time': round(elapsed, 1),
+            'request': {'method': request.method, 'url': request.url, 'httpVersion': 'HTTP/1.1',
+                        'headers': _headers(request.headers), 'queryString': [], 'cookies': [],
+                        'headersSize': -1, 'bodySize': -1},
+            'response': {'status': response.status_code, 'statusText': response.reason or '',
+                         'httpVersion': 'HTTP/1.1', 'headers': _headers(response.headers), 'cookies': [],
+                         'content': _content(body, response.headers.get('Content-Type', '')),
+                         'redirectURL': response.headers.get('Location', ''), 'headersSize': -1, 'bodySize': -1},
+            'cache': {},
+            'timings': {'send': 0, 'wait': round(elapsed, 1), 'receive': 0},
+        })
+        return response
+
+    def snapshot(self, url, source, title=''):
+        """Record the DOM of a page loaded in the browser"""
+        url = normalize(url)
+        with self.lock:
+            page_id = f"page_{len(self.pages) + 1}"
+            self.pages.append({'startedDateTime': _started(time.time()), 'id': page_id, 'title': title or url,
+                               'pageTimings': {}})
+        body = source.encode('utf-8')
+        self._write({
+            'pageref': page_id,
+            '_snapshot': True,  # rendered DOM, not the bytes the server sent
+            'startedDateTime': _started(time.time()),
+            'time': 0,
+            'request': {'method': 'GET', 'url': url, 'httpVersion': 'HTTP/1.1', 'headers': [], 'queryString': [],
+                        'cookies': [], 'headersSize': -1, 'bodySize': -1},
+            'response': {'status': 200, 'statusText': 'OK', 'httpVersion': 'HTTP/1.1',
+                         'headers': [{'name': 'Content-Type', 'value': 'text/html; charset=utf-8'}], 'cookies': [],
+                         'content': _content(body, 'text/html; charset=utf-8'), 'redirectURL': '',
+                         'headersSize': -1, 'bodySize': -1},
+            'cache': {},
+            'timings': {'send': 0, 'wait': 0, 'receive': 0},
+        })
+
+    def close(self):
+        """Finish the archive"""
+        with self.lock:
+            if self.file is None:
+                return
+            self.file.write('\n],\n"pages": ' + json.dumps(self.pages) + '}}\n')
+            self.file.close()
+            self.file = None
+
+
+class HarArchive:
+    def __init__(self, path):
+        """Index a HAR file by method and URL"""
+        with open(path, 'r', encoding='utf-8') as f:
+            log = json.load(f)['log']
+        self.responses = {}  # (method, url) -> recorded responses in order
+        self.snapshots = {}  # url -> rendered DOM
+        self.served = {}  # (method, url) -> times served, to step through repeated requests
+        self.lock = threading.Lock()
+        for entry in log.get('entries', []):
+            request, response = entry['request'], entry['response']
+            record = {
+                'status': response['status'],
+                'reason': response.get('statusText', ''),
+                'headers': [(h['name'], h['value']) for h in response.get('headers', [])],
+                'body': self._body(response.get('content', {})),
+            }
+            if entry.get('_snapshot'):
+                self.snapshots[normalize(request['url'])] = record['body']
+            else:
+                self.responses.setdefault((request['method'], request['url']), []).append(record)
+
+    @staticmethod
+    def _body(content):
+        text = content.get('text', '')
+        if content.get('encoding') == 'base64':
+            return base64.b64decode(text)
+        return text.encode('utf-8')
+
+    def __len__(self):
+        return sum(len(records) for records in self.responses.values())
+
+    def lookup(self, method, url):
+        """The recorded response for a request, or None; repeats step through the recordings"""
+        key = (method, url)
+        if key not in self.responses:
+            # HEAD and GET answer for each other, without a body for HEAD
+            other = ('GET' if method == 'HEAD' else 'HEAD', url)
+            if method not in ('HEAD', 'GET') or other not in self.responses:
+                return None
+            key = other
+        with self.lock:
+            count = self.served.get(key, 0)
+            self.served[key] = count + 1
+        records = self.responses[key]
+        record = records[min(count, len(records) - 1)]
+        if method == 'HEAD':
+            record = dict(record, body=b'')
+        return record
+
+
+class ReplayAdapter(BaseAdapter):
+    """requests transport answering from a HAR archive instead of the network"""
+
+    def __init__(self, archive):
+        super().__init__()
+        self.archive = archive
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        record = self.archive.lookup(request.method, request.url)
+        if record is None:
+            raise requests.exceptions.ConnectionError(f"Not in the archive: {request.method} {request.url}",
+                                                      request=request)
+        response = requests.Response()
+        response.status_code = record['status']
+        response.reason = record['reason']
+        response.headers = CaseInsensitiveDict(record['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.raw = io.BytesIO(record['body'])
+        response._content = record['body']
+        response._content_consumed = True
+        response.url = request.url
+        response.request = request
+        response.connection = self
+        return response
+
+    def close(self):
+        pass
+
+
+def mount(session, archive):
+    """Serve every request of session from the archive"""
+    adapter = ReplayAdapter(archive)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return adapter
+
+
+class ReplayServer:
+    """Local stand-in for the recorded sites, for the browser
+
+    Pages are opened at local_url(url). Snapshots get a <base> pointing at
+    the original URL so links keep their real targets, and their scripts
+    are removed because the DOM already shows what they did. Used as the
+    browser's proxy it also answers plain HTTP subresources; HTTPS
+    tunnels are refused, nothing leaves the machine.
+    """
+
+    def __init__(self, archive, host='127.0.0.1', port=0):
+        self.archive = archive
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.handle(self)
+
+            def do_HEAD(self):
+                server.handle(self)
+
+            def do_CONNECT(self):
+                self.send_error(502, 'Replay does not tunnel HTTPS')
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.httpd.daemon_threads = True
+        self.address = f"{host}:{self.httpd.server_port}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='replay-server', daemon=True)
+        self.thread.start()
+
+    def local_url(self, url):
+        """Where the stand-in serves url"""
+        parts = urlsplit(url)
+        path = parts.path or '/'
+        return f"http://{self.address}/{parts.scheme}/{parts.netloc}{quote(path)}" + (f"?{parts.query}" if parts.query else '')
+
+    def original_url(self, path):
+        if path.startswith(('http://', 'https://')):  # proxy request
+            return path
+        scheme, _, rest = path.lstrip('/').partition('/')
+        netloc, _, rest = rest.partition('/')
+        rest, _, query = rest.partition('?')
+        return f"{scheme}://{netloc}{unquote('/' + rest)}" + (f"?{query}" if query else '')
+
+    def handle(self, request):
+        url = normalize(self.original_url(request.path))
+        snapshot = self.archive.snapshots.get(url) if request.command == 'GET' else None
+        if snapshot is not None:
+            page = SCRIPTS.sub('', snapshot.decode('utf-8'))
+            base = f'<base href="{html.escape(url, quote=True)}">'
+            page = HEAD.sub(lambda m: m.group(0) + base, page, count=1) if HEAD.search(page) else base + page
+            status, reason, headers, body = 200, 'OK', [('Content-Type', 'text/html; charset=utf-8')], page.encode('utf-8')
+        else:
+            record = self.archive.lookup(request.command, url)
+            if record is None:
+                request.send_error(404, 'Not in the archive')
+                return
+            status, reason, body = record['status'], record['reason'], record['body']
+            skip = ('content-length', 'content-encoding', 'transfer-encoding', 'connection')
+            headers = [(name, value) for name, value in record['headers'] if name.lower() not in skip]
+        request.send_response(status, reason)
+        for name, value in headers:
+            request.send_header(name, value)
+        request.send_header('Content-Length', str(len(body)))
+        request.end_headers()
+        if request.command != 'HEAD':
+            request.wfile.write(body)
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def main():
+    """Serve an archive on a local port until interrupted"""
+    parser = argparse.ArgumentParser(description='Z_H_10min - Serve a recorded HAR archive')
+    parser.add_argument('archive', help='HAR file written with --record')
+    parser.add_argument('--port', type=int, default=8471, help='Port of the stand-in server')
+    args = parser.parse_args()
+
+    archive = HarArchive(args.archive)
+    server = ReplayServer(archive, port=args.port)
+    print(f"Serving {len(archive)} response(s) and {len(archive.snapshots)} page snapshot(s) "
+          f"on http://{server.address}/ (Ctrl+C to stop)")
+    for url in sorted(archive.snapshots):
+        print(f"  {server.local_url(url)}")
+    try:
+        server.thread.join()
+    except KeyboardInterrupt:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""
+Z_H_10min - Reports
+Writes HTML, JUnit XML and JSON summaries while the scan runs. Rows go
+straight to disk; only per-host and per-check counters stay in memory,
+so reports for very large runs are cheap to build and to open.
+"""
+
+import argparse
+import html
+import json
+import os
+import shutil
+import threading
+import time
+from collections import Counter, defaultdict
+from urllib.parse import urlparse
+from xml.sax.saxutils import quoteattr, escape
+
+from findings import Finding
+
+FORMATS = ('html', 'junit', 'json')
+
+STYLE = """
+body { font-family: -apple-system, Segoe UI, sans-serif; margin: 2em; color: #222; }
+table { border-collapse: collapse; width: 100%; }
+th, td { border-bottom: 1px solid #ddd; padding: 4px 8px; text-align: left; vertical-align: top; }
+th { background: #f4f4f4; }
+.error { color: #b00020; } .warning { color: #9a6700; } .passed { color: #1a7f37; }
+nav { margin: 1em 0; } nav a { margin-right: 1em; }
+ul { margin: 0; padding-left: 1.2em; }
+"""
+
+
+def _host(url):
+    return urlparse(url).hostname or url
+
+
+class ReportWriter:
+    def __init__(self, directory, formats=FORMATS, page_size=500):
+        """Stream results into reports under directory"""
+        unknown = [f for f in formats if f not in FORMATS]
+        if unknown:
+            raise ValueError(f"Unknown report format(s): {', '.join(unknown)}")
+        self.directory = directory
+        self.formats = tuple(formats)
+        self.page_size = page_size
+        self.started = time.time()
+        self.totals = Counter()  # urls, passed, failed, errors, warnings
+        self.hosts = defaultdict(Counter)
+        self.checks = defaultdict(Counter)
+        self.pages = 0
+        self.rows = 0  # rows in the current HTML page
+        self.page = None
+        self.junit = None
+        self.lock = threading.Lock()  # scanner threads add results concurrently
+        os.makedirs(directory, exist_ok=True)
+        if 'html' in self.formats:
+            os.makedirs(os.path.join(directory, 'pages'), exist_ok=True)
+        if 'junit' in self.formats:
+            # Test cases first; the suite header needs the totals and is prepended on close
+            self.junit = open(os.path.join(directory, 'junit.xml.part'), 'w', encoding='utf-8')
+
+    def _page_path(self, number):
+        return os.path.join(self.directory, 'pages', f'page-{number:05d}.html')
+
+    def _open_page(self):
+        self.pages += 1
+        self.rows = 0
+        self.page = open(self._page_path(self.pages), 'w', encoding='utf-8')
+        self.page.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Results page {self.pages}</title>"
+                        f"<style>{STYLE}</style></head><body><h1>Results page {self.pages}</h1>"
+                        "<table><tr><th>URL</th><th>Status</th><th>Time</th><th>Findings</th></tr>\n")
+
+    def _close_page(self, last):
+        if not self.page:
+            return
+        links = ["<a href='../index.html'>Summary</a>"]
+        if self.pages > 1:
+            links.append(f"<a href='page-{self.pages - 1:05d}.html'>&larr; Previous</a>")
+        if not last:
+            links.append(f"<a href='page-{self.pages + 1:05d}.html'>Next &rarr;</a>")
+        self.page.write(f"</table><nav>{''.join(links)}</nav></body></html>\n")
+        self.page.close()
+        self.page = None
+
+    def add(self, url, findings, duration=None, error=None):
+        """Record the findings of one URL; error is set when the scan itself failed"""
+        findings = [f if isinstance(f, Finding) else Finding.from_dict(f) for f in findings]
+        with self.lock:
+            self._add(url, findings, duration, error)
+
+    def _add(self, url, findings, duration, error):
+        errors = sum(1 for f in findings if f.severity == 'error')
+        warnings = len(findings) - errors
+        status = 'error' if error else 'failed' if errors else 'passed'
+        host = _host(url)
+
+        self.totals['urls'] += 1
+        self.totals[status] += 1
+        self.totals['errors'] += errors
+        self.totals['warnings'] += warnings
+        self.hosts[host]['urls'] += 1
+        self.hosts[host][status] += 1
+        self.hosts[host]['errors'] += errors
+        self.hosts[host]['warnings'] += warnings
+        for finding in findings:
+            self.checks[finding.check][finding.severity] += 1
+
+        if 'html' in self.formats:
+            if self.page is None or self.rows >= self.page_size:
+                self._close_page(last=False)
+                self._open_page()
+            items = ''.join(f"<li class='{html.escape(f.severity)}'>{html.escape(f.check)}: {html.escape(f.message)}</li>"
+                            for f in findings)
+            if error:
+                items = f"<li class='error'>{html.escape(error)}</li>" + items
+            elapsed = f"{duration:.1f}s" if duration is not None else ''
+            self.page.write(f"<tr><td><a href='{html.escape(url)}'>{html.escape(url)}</a></td>"
+                            f"<td class='{status}'>{status}</td><td>{elapsed}</td><td><ul>{items}</ul></td></tr>\n")
+            self.rows += 1
+
+        if self.junit:
+            elapsed = f" time='{duration:.3f}'" if duration is not None else ''
+            self.junit.write(f"  <testcase classname={quoteattr(host)} name={quoteattr(url)}{elapsed}>\n")
+            if error:
+                self.junit.write(f"    <error message={quoteattr(error[:200])}/>\n")
+            for finding in findings:
+                if finding.severity == 'error':
+                    self.junit.write(f"    <failure type={quoteattr(finding.check)} message={quoteattr(finding.message[:200])}>"
+                                     f"{escape(finding.message)}</failure>\n")
+            if warnings:
+                text = '\n'.join(f"[{f.check}] {f.message}" for f in findings if f.severity != 'error')
+                self.junit.write(f"    <system-out>{escape(text)}</system-out>\n")
+            self.junit.write("  </testcase>\n")
+
+    def summary(self):
+        """Aggregated totals per host and per check"""
+        return {
+            'generated': time.strftime('%Y-%m-%d %H:%M:%S'),
+            'duration': round(time.time() - self.started, 1),
+            'totals': dict(self.totals),
+            'hosts': {host: dict(counts) for host, counts in sorted(self.hosts.items())},
+            'checks': {check: dict(counts) for check, counts in sorted(self.checks.items())},
+        }
+
+    def _write_index(self, summary):
+        totals = summary['totals']
+        host_rows = ''.join(
+            f"<tr><td>{html.escape(host)}</td><td>{c.get('urls', 0)}</td><td class='passed'>{c.get('passed', 0)}</td>"
+            f"<td class='error'>{c.get('failed', 0) + c.get('error', 0)}</td><td>{c.get('errors', 0)}</td>"
+            f"<td>{c.get('warnings', 0)}</td></tr>"
+            for host, c in sorted(summary['hosts'].items(), key=lambda item: -item[1].get('errors', 0)))
+        check_rows = ''.join(
+            f"<tr><td>{html.escape(check)}</td><td class='error'>{c.get('error', 0)}</td><td class='warning'>{c.get('warning', 0)}</td></tr>"
+            for check, c in summary['checks'].items())
+        pages = ' '.join(f"<a href='pages/page-{n:05d}.html'>{n}</a>" for n in range(1, self.pages + 1))
+        with open(os.path.join(self.directory, 'index.html'), 'w', encoding='utf-8') as f:
+            f.write(f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>Z_H_10min report</title>"
+                    f"<style>{STYLE}</style></head><body><h1>Z_H_10min report</h1>"
+                    f"<p>{summary['generated']} &middot; {totals.get('urls', 0)} URL(s) in {summary['duration']}s &middot; "
+                    f"<span class='passed'>{totals.get('passed', 0)} passed</span>, "
+                    f"<span class='error'>{totals.get('failed', 0)} failed, {totals.get('error', 0)} not scanned</span></p>"
+                    f"<h2>Hosts</h2><table><tr><th>Host</th><th>URLs</th><th>Passed</th><th>Failed</th>"
+                    f"<th>Errors</th><th>Warnings</th></tr>{host_rows}</table>"
+                    f"<h2>Checks</h2><table><tr><th>Check</th><th>Errors</th><th>Warnings</th></tr>{check_rows}</table>"
+                    f"<h2>Results</h2><nav>{pages or 'No results'}</nav></body></html>\n")
+
+    def close(self):
+        """Finish every report and return their paths"""
+        summary = self.summary()
+        paths = []
+        if 'html' in self.formats:
+            self._close_page(last=True)
+            self._write_index(summary)
+            paths.append(os.path.join(self.directory, 'index.html'))
+        if self.junit:
+            self.junit.close()
+            part = self.junit.name
+            path = os.path.join(self.directory, 'junit.xml')
+            totals = summary['totals']
+            with open(path, 'w', encoding='utf-8') as out, open(part, 'r', encoding='utf-8') as cases:
+                out.write("<?xml version='1.0' encoding='utf-8'?>\n")
+                out.write(f"<testsuite name='Z_H_10min' tests='{totals.get('urls', 0)}' failures='{totals.get('failed', 0)}' "
+                          f"errors='{totals.get('error', 0)}' time='{summary['duration']}'>\n")
+                shutil.copyfileobj(cases, out)
+                out.write("</testsuite>\n")
+            os.remove(part)
+            self.junit = None
+            paths.append(path)
+        if 'json' in self.formats:
+            path = os.path.join(self.directory, 'summary.json')
+            with open(path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2)
+            paths.append(path)
+        return paths
+
+
+def read_findings(path):
+    """Group a findings JSON lines file (see --findings-file) into (url, findings) per URL"""
+    url, findings = None, []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get('url') != url and url is not None:
+                yield url, findings
+                findings = []
+            url = record.get('url')
+            if 'check' in record:  # lines without a check mark pages without findings
+                findings.append(Finding.from_dict(record))
+    if url is not None:
+        yield url, findings
+
+
+def main():
+    """Build reports from a findings file written by an earlier run"""
+    parser = argparse.ArgumentParser(description='Z_H_10min - Build reports from a findings file')
+    parser.add_argument('findings', help='JSON lines file written with --findings-file')
+    parser.add_argument('-o', '--output', default='report', help='Report directory')
+    parser.add_argument('--format', default=','.join(FORMATS), help='Comma-separated formats: html, junit, json')
+    parser.add_argument('--page-size', type=int, default=500, help='Rows per HTML page')
+    args = parser.parse_args()
+
+    writer = ReportWriter(args.output, args.format.split(','), args.page_size)
+    for url, findings in read_findings(args.findings):
+        writer.add(url, findings)
+    for path in writer.close():
+        print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Z_H_10min - Subresource audit
+Works on the requests captured by the CDP event collector, so no resource
+is fetched a second time.
+"""
+
+from collections import Counter
+from urllib.parse import urlparse
+
+# Text resources that should be served compressed
+COMPRESSIBLE_TYPES = ('text/', 'application/javascript', 'application/x-javascript', 'application/json',
+                      'application/xml', 'image/svg+xml', 'application/wasm', 'font/ttf', 'font/otf')
+MIN_COMPRESS_SIZE = 1024
+STATIC_TYPES = ('Script', 'Stylesheet', 'Image', 'Font', 'Media')
+
+# One round trip for the integrity attributes, which only the DOM knows
+INTEGRITY_SCRIPT = """
+var tags = document.querySelectorAll('script[src], link[rel~="stylesheet"][href]');
+return Array.prototype.map.call(tags, function (el) {
+    return {url: el.src || el.href, tag: el.tagName.toLowerCase(), integrity: el.getAttribute('integrity') || ''};
+});
+"""
+
+
+def site_of(host):
+    """Registrable part of a host name (last two labels, good enough for first/third party)"""
+    parts = (host or '').split('.')
+    return '.'.join(parts[-2:])
+
+
+def audit_resources(page_url, resources, integrity_tags=()):
+    """Return (rule, url, message) issues for the captured subresources of a page"""
+    issues = []
+    page = urlparse(page_url)
+    page_site = site_of(page.hostname)
+
+    # Mixed content: HTTP subresources on an HTTPS page
+    if page.scheme == 'https':
+        for resource in resources:
+            if resource['url'].startswith('http://'):
+                blocked = ' (blocked by the browser)' if resource['failed'] else ''
+                issues.append(('mixed-content', resource['url'], f"{resource['type'] or 'Resource'} loaded over HTTP{blocked}"))
+
+    # Subresource integrity on third-party scripts and stylesheets
+    for tag in integrity_tags:
+        host = urlparse(tag['url']).hostname
+        if host and site_of(host) != page_site and not tag['integrity']:
+            kind = 'script' if tag['tag'] == 'script' else 'stylesheet'
+            issues.append(('sri', tag['url'], f"Third-party {kind} without an integrity attribute"))
+
+    audited = set()
+    for resource in resources:
+        if resource['failed'] or resource['from_cache'] or not resource['status'] or resource['status'] >= 300:
+            continue
+        if resource['url'] in audited:
+            continue  # duplicates are reported once below
+        audited.add(resource['url'])
+        headers = resource['headers']
+        mime_type = (resource['mime_type'] or headers.get('content-type', '')).lower()
+
+        # Compression: headers are lower-cased by the collector
+        if (mime_type.startswith(COMPRESSIBLE_TYPES) and resource['size'] >= MIN_COMPRESS_SIZE
+                and not headers.get('content-encoding')):
+            issues.append(('compression', resource['url'],
+                           f"{resource['size'] // 1024} KB {mime_type} served without Content-Encoding"))
+
+        # Caching: static assets need an explicit lifetime
+        if resource['type'] in STATIC_TYPES:
+            cache_control = headers.get('cache-control', '').lower()
+            if not cache_control and not headers.get('expires'):
+                issues.append(('caching', resource['url'], "Static asset without Cache-Control or Expires"))
+            elif 'no-store' in cache_control or 'max-age=0' in cache_control:
+                issues.append(('caching', resource['url'], f"Static asset is not cacheable ({cache_control})"))
+
+    # Duplicate downloads of the same URL within one page load
+    downloads = Counter(r['url'] for r in resources if not r['failed'] and not r['from_cache'] and r['type'] != 'Document')
+    for url, count in downloads.items():
+        if count > 1:
+            wasted = sum(r['size'] for r in resources if r['url'] == url) * (count - 1) // count
+            issues.append(('duplicate', url, f"Downloaded {count} times ({wasted // 1024} KB wasted)"))
+
+    return issues
+
+
+def potential_savings(resources, issues):
+    """Rough bytes saved by fixing compression and duplicate downloads"""
+    sizes = {}
+    for resource in resources:
+        sizes[resource['url']] = max(sizes.get(resource['url'], 0), resource['size'])
+    saved = 0
+    for rule, url, _ in issues:
+        if rule == 'compression':
+            saved += int(sizes.get(url, 0) * 0.7)  # typical gzip ratio for text assets
+        elif rule == 'duplicate':
+            saved += sizes.get(url, 0)
+    return saved
@@ -0,0 +1,145 @@
+"""
+Z_H_10min - Screenshot pipeline
+Captures are handed over as raw PNG bytes and encoded, deduplicated and
+written to a content-addressed layout by a background worker.
+"""
+
+import hashlib
+import io
+import json
+import os
+import queue
+import threading
+import time
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional, captures are then stored as-is
+    Image = None
+
+_STOP = object()
+
+
+def difference_hash(png_bytes):
+    """64-bit perceptual hash (dHash) of an image, or None without Pillow"""
+    if Image is None:
+        return None
+    with Image.open(io.BytesIO(png_bytes)) as img:
+        small = img.convert('L').resize((9, 8))
+        pixels = list(small.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            left = pixels[row * 9 + col]
+            right = pixels[row * 9 + col + 1]
+            value = (value << 1) | (left > right)
+    return value
+
+
+class ScreenshotPipeline:
+    def __init__(self, directory='screenshots', image_format='webp', dedupe='content',
+                 max_distance=2, max_pending=32):
+        """Start the background writer for screenshots stored under directory"""
+        self.directory = directory
+        self.dedupe = dedupe
+        self.max_distance = max_distance
+        if Image is None and image_format != 'png':
+            image_format = 'png'  # nothing to re-encode with
+        self.image_format = image_format
+        self.extension = 'webp' if image_format == 'webp' else 'png'
+        self.index_path = os.path.join(directory, 'index.jsonl')
+        os.makedirs(directory, exist_ok=True)
+        self.stored = set()  # digests written to disk
+        self.perceptual = {}  # dHash -> stored path
+        self.lock = threading.Lock()
+        self.queue = queue.Queue(maxsize=max_pending)  # put() blocks when the disk falls behind
+        self.worker = threading.Thread(target=self._run, name='screenshot-writer', daemon=True)
+        self.worker.start()
+
+    def path_for(self, digest):
+        """Content-addressed location of a capture"""
+        return os.path.join(self.directory, digest[:2], f"{digest}.{self.extension}")
+
+    def submit(self, png_bytes, label=None):
+        """Queue a capture and return the path it will be stored at"""
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        path = self.path_for(digest)
+        with self.lock:
+            written = digest in self.stored
+        # Copies still in the queue keep their bytes, in case the first write fails
+        self.queue.put((None if written else png_bytes, digest, path, label))
+        return path
+
+    def _run(self):
+        """Worker loop: encode, dedupe and write queued captures"""
+        while True:
+            item = self.queue.get()
+            try:
+                if item is _STOP:
+                    return
+                self._store(*item)
+            except Exception as e:
+                print(f"[!] Could not store screenshot: {str(e)}")
+            finally:
+                self.queue.task_done()
+
+    def _store(self, png_bytes, digest, path, label):
+        """Write one capture unless an identical one exists, noting an earlier near-identical one"""
+        similar_to = None
+        with self.lock:
+            duplicate = digest in self.stored
+        duplicate = duplicate or os.path.exists(path)
+        if not duplicate:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(self._encode(png_bytes))
+            os.replace(tmp_path, path)
+            # Near-identical pages (a changed price, an error banner) still keep their own file
+            phash = difference_hash(png_bytes) if self.dedupe == 'perceptual' else None
+            if phash is not None:
+                similar_to = self._find_similar(phash)
+                if not similar_to:
+                    self.perceptual[phash] = path
+        with self.lock:
+            self.stored.add(digest)
+        self._index(path, label, duplicate, similar_to)
+
+    def _find_similar(self, phash):
+        """Stored capture whose dHash is within max_distance bits"""
+        for known, path in self.perceptual.items():
+            if bin(known ^ phash).count('1') <= self.max_distance:
+                return path
+        return None
+
+    def _encode(self, png_bytes):
+        """Re-encode a PNG capture as WebP or optimized PNG"""
+        if Image is None:
+            return png_bytes
+        output = io.BytesIO()
+        with Image.open(io.BytesIO(png_bytes)) as img:
+            if self.image_format == 'webp':
+                img.save(output, 'WEBP', quality=80, method=4)
+            else:
+                img.save(output, 'PNG', optimize=True)
+        return output.getvalue()
+
+    def _index(self, path, label, duplicate, similar_to):
+        """Append the capture to the index so labels can be mapped to files"""
+        record = {'path': path, 'label': label, 'captured_at': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        if duplicate:
+            record['duplicate'] = True
+        if similar_to:
+            record['similar_to'] = similar_to
+        with open(self.index_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record) + '\n')
+
+    def flush(self):
+        """Block until every queued capture is on disk"""
+        self.queue.join()
+
+    def close(self):
+        """Flush pending captures and stop the worker"""
+        if self.worker.is_alive():
+            self.queue.put(_STOP)
+            self.worker.join()
@@ -0,0 +1,325 @@
+"""
+Z_H_10min - Site-level SEO analysis
+Pages are streamed through a parser that keeps only a compact record per
+URL. Records are cached on disk by content hash, and duplicate titles and
+descriptions are found through hash indexes, so large sites never need
+their DOMs in memory.
+"""
+
+import atexit
+import hashlib
+import re
+import shelve
+import threading
+import xml.etree.ElementTree as ET
+from collections import defaultdict, deque
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urldefrag, urlparse
+
+TITLE_MAX = 60
+DESCRIPTION_MAX = 160
+HREFLANG_RE = re.compile(r'^(x-default|[a-z]{2,3}(-[a-z]{4})?(-([a-z]{2}|\d{3}))?)$', re.IGNORECASE)
+SKIP_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.pdf', '.zip', '.css', '.js', '.ico', '.mp4', '.mp3')
+
+
+class SeoRecord:
+    """Everything the SEO rules need to know about one page"""
+    __slots__ = ('url', 'status', 'title', 'description', 'robots', 'canonical', 'canonical_count',
+                 'hreflang', 'h1_count', 'links')
+
+    def __init__(self, url, status=200):
+        self.url = url
+        self.status = status
+        self.title = None
+        self.description = None
+        self.robots = ''
+        self.canonical = None
+        self.canonical_count = 0
+        self.hreflang = {}
+        self.h1_count = 0
+        self.links = []
+
+    def to_dict(self):
+        """Plain dict for the on-disk cache"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a record from the on-disk cache"""
+        record = cls(data['url'], data.get('status', 200))
+        for name, value in data.items():
+            setattr(record, name, value)
+        return record
+
+    @property
+    def noindex(self):
+        return 'noindex' in self.robots
+
+
+class _SeoParser(HTMLParser):
+    """Streaming parser that fills a SeoRecord and drops the markup"""
+
+    def __init__(self, record, base_url):
+        super().__init__(convert_charrefs=True)
+        self.record = record
+        self.base_url = base_url
+        self.in_title = False
+        self.title_parts = []
+
+    def handle_starttag(self, tag, attrs):
+        attrs = {name: (value or '') for name, value in attrs}
+        if tag == 'title' and self.record.title is None:
+            self.in_title = True
+        elif tag == 'meta':
+            name = attrs.get('name', '').lower()
+            if name == 'description' and self.record.description is None:
+                self.record.description = attrs.get('content', '').strip()
+            elif name in ('robots', 'googlebot'):
+                self.record.robots += attrs.get('content', '').lower() + ','
+        elif tag == 'link':
+            rel = attrs.get('rel', '').lower().split()
+            href = attrs.get('href', '').strip()
+            if 'canonical' in rel and href:
+                self.record.canonical_count += 1
+                if self.record.canonical is None:
+                    self.record.canonical = urljoin(self.base_url, href)
+            elif 'alternate' in rel and attrs.get('hreflang') and href:
+                self.record.hreflang[attrs['hreflang']] = urljoin(self.base_url, href)
+        elif tag == 'h1':
+            self.record.h1_count += 1
+        elif tag == 'a':
+            href = attrs.get('href', '').strip()
+            if href and not href.startswith(('javascript:', 'mailto:', 'tel:', '#')):
+                self.record.links.append(urldefrag(urljoin(self.base_url, href))[0])
+
+    def handle_endtag(self, tag):
+        if tag == 'title' and self.in_title:
+            self.in_title = False
+            self.record.title = ' '.join(''.join(self.title_parts).split())
+
+    def handle_data(self, data):
+        if self.in_title:
+            self.title_parts.append(data)
+
+
+def parse_document(url, chunks, status=200):
+    """Parse HTML text (or an iterable of text chunks) into a SeoRecord"""
+    record = SeoRecord(url, status)
+    parser = _SeoParser(record, url)
+    if isinstance(chunks, str):
+        chunks = [chunks]
+    for chunk in chunks:
+        parser.feed(chunk)
+    parser.close()
+    return record
+
+
+def page_issues(record):
+    """Single-page SEO rules, returned as (rule, severity, message)"""
+    issues = []
+    if not record.title:
+        issues.append(('title', 'error', 'Missing page title'))
+    elif len(record.title) > TITLE_MAX:
+        issues.append(('title', 'warning', f"Title is longer than {TITLE_MAX} characters ({len(record.title)})"))
+    if record.description is None:
+        issues.append(('description', 'warning', 'Missing meta description'))
+    elif not record.description:
+        issues.append(('description', 'warning', 'Meta description tag exists but is empty'))
+    elif len(record.description) > DESCRIPTION_MAX:
+        issues.append(('description', 'warning',
+                       f"Meta description is longer than {DESCRIPTION_MAX} characters ({len(record.description)})"))
+    if record.h1_count == 0:
+        issues.append(('h1', 'warning', 'No H1 tag found'))
+    elif record.h1_count > 1:
+        issues.append(('h1', 'warning', f"Multiple H1 tags found ({record.h1_count})"))
+    if record.canonical_count == 0:
+        issues.append(('canonical', 'warning', 'Missing canonical link'))
+    elif record.canonical_count > 1:
+        issues.append(('canonical', 'warning', f"Multiple canonical links ({record.canonical_count})"))
+    elif record.canonical.rstrip('/') != record.url.rstrip('/'):
+        issues.append(('canonical', 'warning', f"Canonicalised to {record.canonical}"))
+    if record.noindex:
+        issues.append(('robots', 'warning', f"Page is excluded by robots meta ({record.robots.strip(',')})"))
+    for lang in record.hreflang:
+        if not HREFLANG_RE.match(lang):
+            issues.append(('hreflang', 'warning', f"Invalid hreflang code '{lang}'"))
+    if record.hreflang and record.url.rstrip('/') not in (u.rstrip('/') for u in record.hreflang.values()):
+        issues.append(('hreflang', 'warning', 'hreflang set does not reference the page itself'))
+    return issues
+
+
+_caches = {}  # path -> (shelf, lock)
+_caches_lock = threading.Lock()
+
+
+def shared_cache(path):
+    """The record cache at path, opened once per process; shelve files do not support concurrent opens"""
+    with _caches_lock:
+        if path not in _caches:
+            _caches[path] = (shelve.open(path), threading.Lock())
+        return _caches[path]
+
+
+@atexit.register
+def close_caches():
+    """Close every shared record cache"""
+    with _caches_lock:
+        for shelf, lock in _caches.values():
+            with lock:
+                shelf.close()
+        _caches.clear()
+
+
+def _digest(text):
+    """Short hash used as key in the duplicate indexes"""
+    return hashlib.sha1(' '.join(text.lower().split()).encode('utf-8')).hexdigest()[:16]
+
+
+class SiteSeoAnalyzer:
+    def __init__(self, session, max_pages=500, cache_path=None, timeout=10):
+        """Crawl a site with the given requests session and analyze every page"""
+        self.session = session
+        self.max_pages = max_pages
+        self.timeout = timeout
+        self.cache, self.cache_lock = shared_cache(cache_path) if cache_path else (None, None)
+        self.pages = {}  # url -> (status, canonical, noindex, hreflang)
+        self.titles = defaultdict(list)  # title digest -> urls
+        self.descriptions = defaultdict(list)  # description digest -> urls
+        self.issues = []  # (url, rule, message)
+
+    def fetch(self, url):
+        """Fetch and parse one page, reusing the cached record when the content is unchanged
+
+        The record is keyed by the URL the redirects ended at.
+        """
+        response = self.session.get(url, timeout=self.timeout)
+        url = response.url
+        if 'html' not in response.headers.get('Content-Type', ''):
+            return None, url
+        raw = response.content
+        key = hashlib.sha256(url.encode('utf-8') + b'\0' + raw).hexdigest()
+        cached = None
+        if self.cache is not None:
+            with self.cache_lock:
+                cached = self.cache.get(key)
+        if cached is not None:
+            record = SeoRecord.from_dict(cached)
+            record.status = response.status_code
+        else:
+            record = parse_document(url, raw.decode(response.encoding or 'utf-8', 'replace'), response.status_code)
+            if self.cache is not None:
+                with self.cache_lock:
+                    self.cache[key] = record.to_dict()
+        return record, url
+
+    def add(self, record):
+        """Index a page record and run the single-page rules"""
+        for rule, _, message in page_issues(record):
+            self.issues.append((record.url, rule, message))
+        # Excluded pages do not compete for titles or descriptions
+        if not record.noindex and record.status < 400:
+            if record.title:
+                self.titles[_digest(record.title)].append(record.url)
+            if record.description:
+                self.descriptions[_digest(record.description)].append(record.url)
+        self.pages[record.url] = (record.status, record.canonical, record.noindex, dict(record.hreflang))
+
+    def crawl(self, start_url):
+        """Breadth-first crawl of same-host pages up to max_pages"""
+        host = urlparse(start_url).netloc
+        queue = deque([start_url])
+        seen = {start_url}
+        crawled = set()  # final URLs fetched so far
+        while queue and len(self.pages) < self.max_pages:
+            url = queue.popleft()
+            if url in crawled:
+                continue  # reached earlier through a redirect
+            try:
+                record, final_url = self.fetch(url)
+            except Exception as e:
+                self.issues.append((url, 'fetch', f"Could not fetch page: {str(e)[:100]}"))
+                continue
+            if final_url != url:
+                self.issues.append((url, 'redirect', f"Internal link redirects to {final_url}"))
+                if final_url in crawled:
+                    continue  # the target was analyzed already
+                seen.add(final_url)
+            crawled.add(final_url)
+            if record is None:
+                continue
+            self.add(record)
+            for link in record.links:
+                parsed = urlparse(link)
+                if (parsed.netloc == host and link not in seen and
+                        not parsed.path.lower().endswith(SKIP_EXTENSIONS)):
+                    seen.add(link)
+                    queue.append(link)
+
+    def sitemap_urls(self, start_url, limit=50000):
+        """URLs listed in the site's sitemaps (robots.txt Sitemap: lines or /sitemap.xml)"""
+        root = f"{urlparse(start_url).scheme}://{urlparse(start_url).netloc}"
+        sitemaps = []
+        try:
+            robots = self.session.get(root + '/robots.txt', timeout=self.timeout)
+            if robots.status_code == 200:
+                sitemaps = [line.split(':', 1)[1].strip() for line in robots.text.splitlines()
+                            if line.lower().startswith('sitemap:')]
+        except Exception:
+            pass
+        sitemaps = deque(sitemaps or [root + '/sitemap.xml'])
+        urls = set()
+        visited = set()
+        while sitemaps and len(urls) < limit and len(visited) < 100:
+            sitemap = sitemaps.popleft()
+            if sitemap in visited:
+                continue
+            visited.add(sitemap)
+            try:
+                response = self.session.get(sitemap, timeout=self.timeout, stream=True)
+                if response.status_code != 200:
+                    continue
+                response.raw.decode_content = True
+                location = None
+                for _, element in ET.iterparse(response.raw):
+                    tag = element.tag.rsplit('}', 1)[-1]
+                    if tag == 'loc':
+                        location = (element.text or '').strip()
+                    elif tag == 'sitemap' and location:
+                        sitemaps.append(location)  # entry of a sitemap index
+                    elif tag == 'url' and location:
+                        urls.add(location)
+                    element.clear()
+            except Exception as e:
+                self.issues.append((sitemap, 'sitemap', f"Could not read sitemap: {str(e)[:100]}"))
+        return urls
+
+    def site_issues(self, sitemap=None):
+        """Cross-page rules: duplicates, hreflang reciprocity and sitemap coverage"""
+        issues = []
+        for index, label in ((self.titles, 'title'), (self.descriptions, 'description')):
+            for urls in index.values():
+                if len(urls) > 1:
+                    for url in urls:
+                        issues.append((url, f"duplicate-{label}", f"Same {label} as {len(urls) - 1} other page(s)"))
+        for url, (_, _, _, hreflang) in self.pages.items():
+            for lang, target in hreflang.items():
+                other = self.pages.get(target)
+                if other and target != url and url not in other[3].values():
+                    issues.append((url, 'hreflang', f"{lang} alternate {target} does not link back"))
+        if sitemap is not None:
+            for url, (status, canonical, noindex, _) in self.pages.items():
+                indexable = status < 400 and not noindex and (not canonical or canonical.rstrip('/') == url.rstrip('/'))
+                if indexable and url not in sitemap:
+                    issues.append((url, 'sitemap', 'Indexable page is missing from the sitemap'))
+                elif url in sitemap and not indexable:
+                    issues.append((url, 'sitemap', 'Sitemap lists a page that is not indexable'))
+            missing = len([url for url in sitemap if url not in self.pages])
+            if missing and len(self.pages) < self.max_pages:
+                issues.append(('(site)', 'sitemap', f"{missing} sitemap URL(s) are not linked from the crawled pages"))
+        return issues
+
+    def close(self):
+        """Flush the on-disk record cache; it stays open for the other analyzers"""
+        if self.cache is not None:
+            with self.cache_lock:
+                self.cache.sync()
@@ -0,0 +1,232 @@
+"""
+Z_H_10min - Tracing
+Records spans for every scan, check, HTTP request and WebDriver command
+and writes each finished trace as an OpenTelemetry (OTLP/JSON) line.
+Run this module on a trace file to see where the time of each URL went
+along its critical path.
+
+    python tracing.py trace.jsonl --depth 3
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+
+INTERNAL, CLIENT = 1, 3  # OTLP span kinds
+STATUS_OK, STATUS_ERROR = 1, 2
+
+
+class Span:
+    __slots__ = ('trace_id', 'span_id', 'parent_id', 'name', 'kind', 'start', 'end', 'attributes', 'error')
+
+    def __init__(self, trace_id, parent_id, name, kind, attributes):
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start = time.time_ns()
+        self.end = None
+        self.attributes = dict(attributes or {})
+        self.error = None
+
+    def to_otlp(self):
+        data = {
+            'traceId': self.trace_id,
+            'spanId': self.span_id,
+            'name': self.name,
+            'kind': self.kind,
+            'startTimeUnixNano': str(self.start),
+            'endTimeUnixNano': str(self.end),
+            'attributes': [{'key': key, 'value': _value(value)} for key, value in self.attributes.items()],
+            'status': {'code': STATUS_ERROR, 'message': self.error} if self.error else {'code': STATUS_OK},
+        }
+        if self.parent_id:
+            data['parentSpanId'] = self.parent_id
+        return data
+
+
+def _value(value):
+    if isinstance(value, bool):
+        return {'boolValue': value}
+    if isinstance(value, int):
+        return {'intValue': str(value)}
+    if isinstance(value, float):
+        return {'doubleValue': value}
+    return {'stringValue': str(value)}
+
+
+class Tracer:
+    def __init__(self, path, service='z_h_10min'):
+        """Append finished traces to path as OTLP/JSON lines"""
+        self.service = service
+        self.file = open(path, 'a', encoding='utf-8')
+        self.lock = threading.Lock()
+        self.local = threading.local()  # stack of open spans per thread
+        self.pending = defaultdict(list)  # trace id -> finished spans of traces still open
+        self.traces = 0
+
+    def _stack(self):
+        if not hasattr(self.local, 'stack'):
+            self.local.stack = []
+        return self.local.stack
+
+    @contextlib.contextmanager
+    def span(self, name, attributes=None, kind=INTERNAL):
+        """Time the enclosed block as a child of the thread's current span"""
+        stack = self._stack()
+        parent = stack[-1] if stack else None
+        span = Span(parent.trace_id if parent else os.urandom(16).hex(),
+                    parent.span_id if parent else None, name, kind, attributes)
+        stack.append(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {str(e)[:200]}"
+            raise
+        finally:
+            span.end = time.time_ns()
+            stack.pop()
+            self._finish(span)
+
+    def _finish(self, span):
+        with self.lock:
+            self.pending[span.trace_id].append(span)
+            if span.parent_id is None and self.file:
+                # The root closes the trace, write it as one OTLP request
+                spans = self.pending.pop(span.trace_id)
+                self.file.write(json.dumps({'resourceSpans': [{
+                    'resource': {'attributes': [{'key': 'service.name', 'value': {'stringValue': self.service}}]},
+                    'scopeSpans': [{'scope': {'name': 'z_h_10min'}, 'spans': [s.to_otlp() for s in spans]}],
+                }]}) + '\n')
+                self.file.flush()
+                self.traces += 1
+
+    def instrument_session(self, session):
+        """Trace every request sent by a requests session, redirect hops included"""
+        send = session.send
+
+        def traced_send(request, **kwargs):
+            with self.span(f"HTTP {request.method}", {'http.request.method': request.method, 'url.full': request.url},
+                           CLIENT) as span:
+                response = send(request, **kwargs)
+                span.attributes['http.response.status_code'] = response.status_code
+                return response
+
+        session.send = traced_send
+
+    def instrument_driver(self, driver):
+        """Trace every WebDriver command, DevTools calls included"""
+        execute = driver.execute
+
+        def traced_execute(command, params=None):
+            with self.span(f"WebDriver {command}", {'webdriver.command': command}, CLIENT):
+                return execute(command, params)
+
+        driver.execute = traced_execute
+
+    def close(self):
+        with self.lock:
+            if self.file:
+                self.file.close()
+                self.file = None
+
+
+def span(tracer, name, attributes=None, kind=INTERNAL):
+    """tracer.span(...) when tracing is on, otherwise a no-op"""
+    return tracer.span(name, attributes, kind) if tracer else contextlib.nullcontext()
+
+
+def read_traces(path):
+    """Spans of a trace file grouped by trace id"""
+    traces = defaultdict(list)
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            for resource in json.loads(line).get('resourceSpans', []):
+                for scope in resource.get('scopeSpans', []):
+                    for data in scope.get('spans', []):
+                        data['start'] = int(data['startTimeUnixNano'])
+                        data['end'] = int(data['endTimeUnixNano'])
+                        data['attrs'] = {a['key']: next(iter(a['value'].values())) for a in data.get('attributes', [])}
+                        traces[data['traceId']].append(data)
+    return traces
+
+
+def critical_path(span, children):
+    """Walk back from the end of span, taking the child that finished last before each point"""
+    path = []
+    cursor = span['end']
+    candidates = sorted(children.get(span['spanId'], []), key=lambda s: s['end'], reverse=True)
+    for child in candidates:
+        if child['end'] <= cursor:
+            path.append(child)
+            cursor = child['start']
+    path.reverse()
+    return path
+
+
+def _label(span):
+    attrs = span['attrs']
+    if 'url.full' in attrs and span['name'].startswith('HTTP'):
+        status = attrs.get('http.response.status_code', 'failed')
+        return f"{span['name']} {attrs['url.full'][:80]} [{status}]"
+    return span['name'] + (' (error)' if span.get('status', {}).get('code') == STATUS_ERROR else '')
+
+
+def summarize(traces, depth=3, top=10, match=None):
+    """Print the critical path of each scan and the biggest contributors overall"""
+    totals = defaultdict(int)  # span name -> self time on critical paths
+    for spans in traces.values():
+        children = defaultdict(list)
+        roots = []
+        for data in spans:
+            if data.get('parentSpanId'):
+                children[data['parentSpanId']].append(data)
+            else:
+                roots.append(data)
+        for root in roots:
+            url = root['attrs'].get('url.full', '')
+            if root['name'] != 'scan' or (match and match not in url):
+                continue  # browser start-up and other work outside the scans
+            total = root['end'] - root['start']
+            print(f"\n{url}  {total / 1e9:.2f}s")
+
+            def walk(span, level):
+                path = critical_path(span, children)
+                elapsed = span['end'] - span['start']
+                own = elapsed - sum(s['end'] - s['start'] for s in path)
+                totals[span['name']] += own
+                if level < depth:
+                    share = 100 * elapsed / total if total else 0
+                    print(f"{'  ' * (level + 1)}{_label(span):<{max(60 - 2 * level, 20)}} "
+                          f"{elapsed / 1e9:7.2f}s {share:5.1f}%")
+                for child in path:
+                    walk(child, level + 1)
+
+            walk(root, 0)
+
+    if totals:
+        print("\nTime on the critical paths by span (self time):")
+        for name, own in sorted(totals.items(), key=lambda item: -item[1])[:top]:
+            print(f"  {name:<40} {own / 1e9:8.2f}s")
+
+
+def main():
+    """Summarize a trace file written with --trace"""
+    parser = argparse.ArgumentParser(description='Z_H_10min - Critical paths of traced scans')
+    parser.add_argument('trace', help='OTLP/JSON lines file written with --trace')
+    parser.add_argument('--depth', type=int, default=3, help='Levels of the critical path to show per URL')
+    parser.add_argument('--top', type=int, default=10, help='Span names listed in the overall breakdown')
+    parser.add_argument('--url', help='Only show scans whose URL contains this text')
+    args = parser.parse_args()
+    summarize(read_traces(args.trace), args.depth, args.top, args.url)
+
+
+if __name__ == "__main__":
+    main()
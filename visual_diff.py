@@ -0,0 +1,151 @@
+"""
+Z_H_10min - Visual regression diffing
+Compares captures with per-URL baselines stored as memory-mapped arrays,
+tile by tile, and reports the changed regions.
+"""
+
+import hashlib
+import io
+import json
+import os
+import threading
+from collections import OrderedDict
+
+try:
+    import numpy as np
+    from PIL import Image
+except ImportError:  # visual diffing is optional
+    np = None
+    Image = None
+
+
+class VisualDiff:
+    def __init__(self, directory='baselines', tile_size=32, tolerance=16, update=False, cache_size=64):
+        """Compare captures against the baselines stored in directory"""
+        if np is None or Image is None:
+            raise ImportError("Visual diffing requires numpy and Pillow")
+        self.directory = directory
+        self.tile_size = tile_size
+        self.tolerance = tolerance  # per-channel difference treated as rendering noise
+        self.update = update
+        self.cache_size = cache_size
+        self.cache = OrderedDict()  # key -> (digest, memory-mapped baseline)
+        self.lock = threading.Lock()  # the cache is shared by the testers' threads
+        os.makedirs(directory, exist_ok=True)
+
+    def _key(self, url):
+        """File name stem for a URL's baseline"""
+        return hashlib.sha1(url.encode('utf-8')).hexdigest()
+
+    def _load(self, key):
+        """Memory-map a baseline, keeping recently used ones open"""
+        with self.lock:
+            if key in self.cache:
+                self.cache.move_to_end(key)
+                return self.cache[key]
+        array_path = os.path.join(self.directory, f"{key}.npy")
+        meta_path = os.path.join(self.directory, f"{key}.json")
+        if not os.path.exists(array_path) or not os.path.exists(meta_path):
+            return None
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            digest = json.load(f)['digest']
+        entry = (digest, np.load(array_path, mmap_mode='r'))
+        with self.lock:
+            self.cache[key] = entry
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return entry
+
+    def _save(self, key, url, digest, pixels):
+        """Store a capture as the new baseline for a URL"""
+        with self.lock:
+            self.cache.pop(key, None)
+        array_path = os.path.join(self.directory, f"{key}.npy")
+        meta_path = os.path.join(self.directory, f"{key}.json")
+        # Write beside the old files and swap them in, so an open memory map of the
+        # old baseline keeps its file instead of seeing it truncated
+        with open(array_path + '.tmp', 'wb') as f:
+            np.save(f, pixels)
+        with open(meta_path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump({'url': url, 'digest': digest, 'shape': list(pixels.shape)}, f)
+        os.replace(array_path + '.tmp', array_path)
+        os.replace(meta_path + '.tmp', meta_path)
+
+    def compare(self, url, png_bytes):
+        """Diff a PNG capture with the URL's baseline and return a result dict"""
+        with Image.open(io.BytesIO(png_bytes)) as img:
+            pixels = np.asarray(img.convert('RGB'))
+        digest = hashlib.sha256(pixels.tobytes()).hexdigest()
+        key = self._key(url)
+        baseline = self._load(key)
+
+        if baseline is None:
+            self._save(key, url, digest, pixels)
+            return {'status': 'baseline-created', 'score': 0.0, 'regions': []}
+
+        baseline_digest, baseline_pixels = baseline
+        if baseline_digest == digest:
+            result = {'status': 'unchanged', 'score': 0.0, 'regions': []}
+        elif baseline_pixels.shape != pixels.shape:
+            height, width = pixels.shape[:2]
+            result = {'status': 'changed', 'score': 1.0, 'regions': [(0, 0, width, height)],
+                      'reason': f"size changed from {baseline_pixels.shape[1]}x{baseline_pixels.shape[0]} to {width}x{height}"}
+        else:
+            result = self._diff_tiles(baseline_pixels, pixels)
+
+        if self.update and result['status'] == 'changed':
+            self._save(key, url, digest, pixels)
+        return result
+
+    def _diff_tiles(self, old, new):
+        """Tile-wise comparison that skips identical bands of rows"""
+        tile = self.tile_size
+        height, width = new.shape[:2]
+        rows = (height + tile - 1) // tile
+        cols = (width + tile - 1) // tile
+        changed_tiles = np.zeros((rows, cols), dtype=bool)
+        changed_pixels = 0
+
+        for row in range(rows):
+            top = row * tile
+            band_old = old[top:top + tile]
+            band_new = new[top:top + tile]
+            if np.array_equal(band_old, band_new):
+                continue  # most of a page is usually untouched
+            delta = np.abs(band_old.astype(np.int16) - band_new.astype(np.int16)).max(axis=2)
+            mask = delta > self.tolerance
+            if not mask.any():
+                continue
+            changed_pixels += int(mask.sum())
+            pad = cols * tile - width
+            if pad:
+                mask = np.pad(mask, ((0, 0), (0, pad)))
+            changed_tiles[row] = mask.reshape(mask.shape[0], cols, tile).any(axis=(0, 2))
+
+        score = changed_pixels / float(height * width)
+        regions = self._regions(changed_tiles, width, height)
+        return {'status': 'changed' if regions else 'unchanged', 'score': score, 'regions': regions}
+
+    def _regions(self, changed_tiles, width, height):
+        """Merge adjacent changed tiles into pixel bounding boxes (x, y, w, h)"""
+        tile = self.tile_size
+        seen = np.zeros_like(changed_tiles)
+        regions = []
+        for start in zip(*np.nonzero(changed_tiles)):
+            if seen[start]:
+                continue
+            stack = [start]
+            seen[start] = True
+            top, left, bottom, right = start[0], start[1], start[0], start[1]
+            while stack:
+                r, c = stack.pop()
+                top, left = min(top, r), min(left, c)
+                bottom, right = max(bottom, r), max(right, c)
+                for nr, nc in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+                    if (0 <= nr < changed_tiles.shape[0] and 0 <= nc < changed_tiles.shape[1]
+                            and changed_tiles[nr, nc] and not seen[nr, nc]):
+                        seen[nr, nc] = True
+                        stack.append((nr, nc))
+            x, y = int(left * tile), int(top * tile)
+            regions.append((x, y, min(int((right + 1) * tile), width) - x, min(int((bottom + 1) * tile), height) - y))
+        return regions
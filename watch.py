@@ -0,0 +1,241 @@
+"""
+Z_H_10min - Watch mode
+Keeps one process probing many targets for reachability, certificates
+and headers. Each target has its own schedule with jitter, connections
+stay warm in a pooled session, and only changes of state are reported,
+so thousands of sites can be monitored without restarting every run.
+"""
+
+import contextlib
+import heapq
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from urllib.parse import urlparse
+
+from colorama import Fore, Style
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from checks import resolve
+from checks.headers import test_security_headers
+
+WATCH_CHECKS = ('headers', 'ssl')  # used when --checks is not given
+UP, DEGRADED, DOWN = 'up', 'degraded', 'down'
+COLORS = {UP: Fore.GREEN, DEGRADED: Fore.YELLOW, DOWN: Fore.RED}
+DIGITS = re.compile(r'\d+')
+
+
+class Target:
+    """A watched URL and what was seen on its last probe"""
+    __slots__ = ('url', 'interval', 'state', 'signature', 'since', 'checked', 'latency')
+
+    def __init__(self, url, interval):
+        self.url = url
+        self.interval = interval
+        self.state = None
+        self.signature = None
+        self.since = None  # when the current state started
+        self.checked = None
+        self.latency = None
+
+
+def read_targets(path, interval):
+    """Read 'URL [seconds]' lines; targets without seconds use interval"""
+    targets = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            parts = line.split('#', 1)[0].split()
+            if not parts:
+                continue
+            url = parts[0] if parts[0].startswith(('http://', 'https://')) else 'http://' + parts[0]
+            targets.append(Target(url, float(parts[1]) if len(parts) > 1 else interval))
+    return targets
+
+
+def pool_session(session, targets, workers):
+    """Keep a warm connection pool for every watched host"""
+    hosts = len({urlparse(target.url).netloc for target in targets})
+    # One quick retry for dropped keep-alive connections; slower retries would hide outages
+    adapter = HTTPAdapter(pool_connections=max(hosts, 10), pool_maxsize=max(workers, 10),
+                          max_retries=Retry(total=1, backoff_factor=0))
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+
+def classify(response, findings):
+    """up, degraded or down from the probe's response and findings"""
+    if response is None or response.status_code >= 500:
+        return DOWN
+    if response.status_code >= 400 or any(f.severity == 'error' for f in findings):
+        return DEGRADED
+    return UP
+
+
+def signature(findings):
+    """What identifies a set of findings; numbers are ignored so day counts do not fire events"""
+    return frozenset((f.check, f.severity, DIGITS.sub('#', f.message)) for f in findings)
+
+
+class Watcher:
+    def __init__(self, testers, targets, checks=WATCH_CHECKS, jitter=0.1, retry_interval=60,
+                 output=None, verbose=True):
+        """Probe targets with one worker thread per tester"""
+        self.testers = testers
+        self.targets = targets
+        self.specs = resolve(checks)
+        self.jitter = jitter
+        self.retry_interval = retry_interval  # targets that are not up are probed this often
+        self.output = output  # path for event JSON lines, '-' for standard output
+        self.verbose = verbose
+        self.file = None
+        self.heap = []
+        self.seq = 0
+        self.cond = threading.Condition()
+        self.stopped = threading.Event()
+        self.probes = 0
+        self.events = 0
+
+    def _schedule(self, target, delay):
+        with self.cond:
+            self.seq += 1
+            heapq.heappush(self.heap, (time.time() + delay, self.seq, target))
+            self.cond.notify()
+
+    def _next_delay(self, target):
+        interval = target.interval if target.state == UP else min(target.interval, self.retry_interval)
+        return interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _take(self):
+        """Wait for the next due target; None once stopped"""
+        with self.cond:
+            while not self.stopped.is_set():
+                now = time.time()
+                if self.heap and self.heap[0][0] <= now:
+                    return heapq.heappop(self.heap)[2]
+                self.cond.wait(min(self.heap[0][0] - now, 1.0) if self.heap else 1.0)
+        return None
+
+    def probe(self, tester, target):
+        """Run the checks against a target; returns (response, findings)"""
+        browser_checks = [spec.name for spec in self.specs if spec.uses_browser]
+        findings = []
+        response = None
+        if browser_checks:
+            tester.run_checks(target.url, browser_checks)
+            response = tester.response  # fetched once already to open the page
+        if response is not None:
+            target.latency = response.elapsed.total_seconds()
+        else:
+            findings = [f for f in tester.findings if f.check != 'connection'] if browser_checks else []
+            tester.findings = []
+            start = time.time()
+            response = tester.test_connection(target.url)
+            target.latency = time.time() - start
+            tester.response = response
+        if response is not None:
+            for spec in self.specs:
+                if spec.name == 'headers':
+                    test_security_headers(tester, target.url, response)
+                elif not spec.uses_browser:
+                    spec.run(tester, target.url)
+        return response, tester.findings + findings
+
+    def _work(self, tester):
+        while True:
+            target = self._take()
+            if target is None:
+                return
+            try:
+                response, findings = self.probe(tester, target)
+            except Exception as e:
+                response, findings = None, []
+                tester.add_finding('connection', 'error', f"Probe failed: {str(e)[:200]}")
+                findings = tester.findings
+                if tester.driver:  # the browser may have crashed
+                    tester.recycle_driver("probe failed")
+            with self.cond:
+                self.probes += 1
+            self._record(target, response, findings)
+            if not self.stopped.is_set():
+                self._schedule(target, self._next_delay(target))
+
+    def _record(self, target, response, findings):
+        state = classify(response, findings)
+        sig = signature(findings)
+        now = time.time()
+        target.checked = now
+        previous = target.state
+        if state == previous and sig == target.signature:
+            return
+        target.signature = sig
+        if state != previous:
+            target.state = state
+            target.since = now
+        if previous is None and state == UP:
+            return  # a healthy first probe is the baseline, not an event
+        self._emit({
+            'time': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now)),
+            'url': target.url,
+            'event': state if state != previous else 'changed',
+            'previous': previous,
+            'state': state,
+            'status': response.status_code if response is not None else None,
+            'latency': round(target.latency, 3) if target.latency is not None else None,
+            'findings': [f.to_dict() for f in findings],
+        })
+
+    def _emit(self, event):
+        with self.cond:
+            self.events += 1
+            if self.file:
+                self.file.write(json.dumps(event) + '\n')
+                self.file.flush()
+            if self.verbose and self.file is not sys.__stdout__:
+                # Errors explain a state change better than the standing warnings
+                shown = [f for f in event['findings'] if f['severity'] == 'error'] or event['findings']
+                problems = '; '.join(f['message'] for f in shown[:3])
+                sys.__stdout__.write(f"{COLORS[event['state']]}[{event['time']}] {event['url']} {event['event']}"
+                                     f"{' (was ' + event['previous'] + ')' if event['previous'] else ''}"
+                                     f"{': ' + problems if problems else ''}{Style.RESET_ALL}\n")
+                sys.__stdout__.flush()
+
+    def summary(self):
+        """Number of targets in each state"""
+        return Counter(target.state or 'pending' for target in self.targets)
+
+    def stop(self):
+        self.stopped.set()
+        with self.cond:
+            self.cond.notify_all()
+
+    def run(self, duration=None):
+        """Probe until stopped (or for duration seconds)"""
+        if self.output:
+            self.file = sys.__stdout__ if self.output == '-' else open(self.output, 'a', encoding='utf-8')
+        # Spread the first round over the shortest interval instead of probing everything at once
+        spread = min(target.interval for target in self.targets)
+        for target in self.targets:
+            self._schedule(target, random.uniform(0, spread))
+        # Check output would drown the events, only they reach the console
+        with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+            threads = [threading.Thread(target=self._work, args=(tester,), daemon=True) for tester in self.testers]
+            for thread in threads:
+                thread.start()
+            try:
+                started = time.time()
+                while not self.stopped.wait(0.5):
+                    if duration and time.time() - started >= duration:
+                        self.stop()
+            finally:
+                self.stop()
+                for thread in threads:
+                    thread.join(30)
+                if self.file and self.file is not sys.__stdout__:
+                    self.file.close()
+        return self.summary()
@@ -6,19 +6,28 @@ Security Researchers
 """
 
 import argparse
+import contextlib
+import json
+import os
+import signal
+import socket
 import sys
+import threading
 import time
 import urllib3
 import warnings
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
 from colorama import init, Fore, Style
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from incremental import ScanState
+from jobs import JobStore, read_urls
+from findings import Finding, FindingWriter, ResultWriter, to_dicts
+from memory import BoundedCache, MemoryGuard
+from profiles import PROFILES, apply_profile
+from readiness import CONDITIONS, STRATEGIES, ReadinessPolicy
+from checks import BASIC_CHECKS, DEFAULT_CHECKS, FULL_LOAD, GROUPS, NETWORK, PAGE, REGISTRY, needs, resolve, uses_browser
+from tracing import span
 
 # Suppress insecure request warnings
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
@@ -39,15 +48,73 @@ session.verify = False
 # Initialize colorama
 init()
 
+# Exit codes for schedulers and CI
+EXIT_OK = 0           # every URL scanned, no error findings
+EXIT_FINDINGS = 1     # at least one error finding
+EXIT_USAGE = 2        # bad arguments or configuration
+EXIT_FAILED = 3       # at least one URL could not be scanned
+EXIT_INCOMPLETE = 4   # the run stopped with URLs left in the checkpoint
+EXIT_INTERRUPTED = 130
+
+POLL_INTERVAL = 5  # seconds between a worker's /lease calls while the queue has nothing for it
+
+class Unreachable(Exception):
+    """The URL could not be reached, so it was not scanned"""
+
 class WebTester:
-    def __init__(self, headless=False):
+    def __init__(self, headless=False, state=None, screenshots=None, visual=None, visual_threshold=0.001,
+                 memory=None, writer=None, link_cache_size=10000, profile='full', readiness=None, auth=None,
+                 report=None, checks=DEFAULT_CHECKS, browser=True, seo_pages=1, seo_cache=None, seo_sites=None,
+                 output=None, timeout=10, redirects=None, recorder=None, replay=None, tracer=None):
         """Initialize the WebTester with Chrome WebDriver"""
         self.headless = headless
+        self.state = state  # ScanState for incremental runs
+        self.screenshots = screenshots  # ScreenshotPipeline, started by the first capture if not given
+        self.visual = visual  # VisualDiff for regression checks against baselines
+        self.visual_threshold = visual_threshold
+        self.memory = memory  # MemoryGuard for long-running scans
+        self.writer = writer  # FindingWriter streaming results to disk
+        self.link_status = BoundedCache(link_cache_size)
+        # Permanent redirects learned from links, shared by the testers of a run
+        self.redirects = redirects  # RedirectResolver, created by the first link check if not given
+        self.profile = profile  # load profile for the non-visual checks
+        self.active_profile = None  # profile currently applied to the browser
+        self.loaded_profile = None  # profile the current page was loaded with
+        self.readiness = readiness or ReadinessPolicy()  # when a loaded page is ready for the checks
+        self.auth = auth  # AuthManager shared by the driver and the session
+        self.report = report  # ReportWriter receiving every scanned URL
+        self.output = output  # ResultWriter with one JSON line per URL
+        self.timeout = timeout  # seconds for each HTTP request
+        self.checks = checks  # check names run by run_full_suite
+        self.seo_pages = seo_pages  # pages crawled by the site-level SEO analysis
+        self.seo_cache = seo_cache
+        self.seo_sites = seo_sites  # hosts whose site analysis already ran, shared by a batch; None re-runs it
+        self.session = session  # shared with the checks
+        self.recorder = recorder  # HarRecorder storing a snapshot of every loaded page
+        self.replay = replay  # ReplayServer standing in for the recorded sites
+        self.tracer = tracer  # Tracer recording spans for each scan
+        self.response = None  # HTTP response of the page opened last
+        self.reused = ()  # checks whose findings were taken from the incremental state
+        self.unreachable = None  # why the URL under test could not be reached
+        self.findings = []
         self.driver = None
-        self.setup_driver()
+        self.events = None  # CDPEventCollector attached to the driver
+        if browser:
+            self.setup_driver()
+        elif self.auth:
+            self.authenticate()  # imported cookies only need the session
+    
+    def add_finding(self, check, severity, message):
+        """Record a finding for the URL under test"""
+        self.findings.append(Finding(check, severity, message))
     
     def setup_driver(self):
         """Setup Chrome WebDriver with options"""
+        # Selenium and the DevTools helpers are only loaded when a check needs the browser
+        from selenium import webdriver
+        from selenium.webdriver.chrome.service import Service
+        from selenium.webdriver.chrome.options import Options
+        from cdp import CDPEventCollector, enable_event_logging
         max_retries = 3
         retry_count = 0
         
@@ -66,6 +133,13 @@ class WebTester:
                 chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
                 chrome_options.add_experimental_option('useAutomationExtension', False)
                 
+                # Record network, page and console events for the event collector
+                enable_event_logging(chrome_options)
+                self.readiness.configure(chrome_options)
+                if self.replay:
+                    # Everything the replayed pages request goes to the stand-in, not the network
+                    chrome_options.add_argument(f'--proxy-server=http://{self.replay.address}')
+                
                 # Try different approaches to initialize the driver
                 try:
                     # First try with ChromeDriverManager
@@ -79,11 +153,22 @@ class WebTester:
                     # Fallback to system Chrome
                     self.driver = webdriver.Chrome(options=chrome_options)
                 
+                if self.tracer:
+                    self.tracer.instrument_driver(self.driver)
+                
                 # Set some additional capabilities
                 self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
                 self.driver.maximize_window()
+                self.events = CDPEventCollector(self.driver)
+                self.events.attach()
+                self.readiness.install(self.driver)
+                self.driver.set_page_load_timeout(self.readiness.timeout)
+                self.active_profile = None
+                self.loaded_profile = None
                 
                 print(Fore.GREEN + "[+] WebDriver initialized successfully" + Style.RESET_ALL)
+                if self.auth:
+                    self.authenticate()
                 return
                 
             except Exception as e:
@@ -96,47 +181,153 @@ class WebTester:
                     print("2. Try updating Chrome to the latest version")
                     print("3. Run 'pip install --upgrade webdriver-manager'")
                     print("4. Try running without --headless flag first")
-                    sys.exit(1)
+                    sys.exit(EXIT_FAILED)
                 
                 print(f"{Fore.YELLOW}[!] Retrying WebDriver initialization ({retry_count}/{max_retries})...{Style.RESET_ALL}")
                 time.sleep(2)  # Wait before retrying
     
+    def authenticate(self, refresh=False):
+        """Give the browser and the session the shared login, logging in if needed"""
+        logins = self.auth.logins
+        try:
+            if refresh:
+                self.auth.refresh(self.driver)
+            else:
+                self.auth.ensure(self.driver)
+        except Exception as e:
+            print(Fore.RED + f"[!] Authentication failed: {str(e)}" + Style.RESET_ALL)
+            self.add_finding('auth', 'error', "Authentication failed")
+            return False
+        if self.auth.logins > logins:
+            print(Fore.GREEN + "[+] Logged in" + Style.RESET_ALL)
+        else:
+            print(Fore.GREEN + "[+] Reusing the shared login session" + Style.RESET_ALL)
+        return True
+    
+    def use_profile(self, name):
+        """Switch the browser to another load profile"""
+        if name == self.active_profile:
+            return
+        try:
+            apply_profile(self.driver, name)
+            self.active_profile = name
+        except Exception as e:
+            # Without the DevTools command the page simply loads in full
+            print(Fore.YELLOW + f"[!] Could not apply the {name} load profile: {str(e)}" + Style.RESET_ALL)
+            self.active_profile = 'full'
+    
+    def load(self, url, profile=None, conditions=None):
+        """Navigate with a load profile and wait until the page is ready; returns the load time"""
+        from selenium.common.exceptions import TimeoutException
+        if not self.driver:
+            self.setup_driver()
+        self.use_profile(profile or self.profile)
+        self.events.reset()
+        start_time = time.time()
+        deadline = start_time + self.readiness.timeout
+        try:
+            self.driver.get(self.replay.local_url(url) if self.replay else url)
+        except TimeoutException:
+            # Hard deadline: stop whatever is still loading and check what is there
+            print(Fore.YELLOW + f"[!] Page load exceeded {self.readiness.timeout}s, stopping it" + Style.RESET_ALL)
+            try:
+                self.driver.execute_script('window.stop();')
+            except Exception:
+                pass
+        with span(self.tracer, 'wait for ready'):
+            ready, waited, pending = self.readiness.wait(self.driver, self.events, conditions, deadline)
+        if not ready:
+            print(Fore.YELLOW + f"[!] Page not ready after {time.time() - start_time:.1f}s, "
+                  f"gave up waiting for: {', '.join(pending)}" + Style.RESET_ALL)
+        load_time = time.time() - start_time
+        self.events.drain()
+        self.loaded_profile = self.active_profile
+        if self.recorder:
+            try:
+                self.recorder.snapshot(url, self.driver.page_source, self.driver.title)
+            except Exception as e:
+                print(Fore.YELLOW + f"[!] Could not record the page snapshot: {str(e)}" + Style.RESET_ALL)
+        return load_time
+    
     def test_url(self, url):
         """Test a given URL for basic web application tests"""
+        start_time = time.time()
+        if self.run_checks(url, BASIC_CHECKS) is False:
+            return False
+        print(f"\n{Fore.GREEN}[✓] Basic testing completed in {time.time() - start_time:.2f} seconds!{Style.RESET_ALL}")
+        return True
+    
+    def run_checks(self, url, checks):
+        """Run checks in the given order, opening the page once for all checks that read it"""
+        specs = resolve(checks)
+        names = [spec.name for spec in specs]
+        self.reused = ()
+        self.unreachable = None
+        opened = None
+        if needs(specs, PAGE):
+            with span(self.tracer, 'open page', {'url.full': url}):
+                opened = self.open_page(url, names)
+        else:
+            self.findings = []
+            self.response = None
+        for spec in specs:
+            if spec.name not in self.reused:
+                spec.run(self, url)
+        if self.state:
+            self.state.record(url, self.response, self.findings, checks=names)
+        return opened is not False
+    
+    def open_page(self, url, checks=None):
+        """Open a URL in the browser; returns False if the incremental state says it is unchanged for checks
+
+        Findings of the reusable checks are then taken from the previous run and their names
+        left in self.reused. The page is still loaded when another check needs to read it.
+        """
         if not hasattr(self, 'driver') or not self.driver:
             self.setup_driver()
             
         print(f"\n{Fore.CYAN}=== Testing URL: {url} ==={Style.RESET_ALL}")
+        self.findings = []
         
         try:
             start_time = time.time()
             
             # Test 1: Check if URL is reachable
-            self.test_connection(url)
+            response = self.test_connection(url)
+            if self.auth and self.auth.expired(response):
+                print(Fore.CYAN + "[i] Login session expired, refreshing it" + Style.RESET_ALL)
+                self.findings = []
+                if self.authenticate(refresh=True):
+                    response = self.test_connection(url)
+                    self.auth.recheck(response)
+            self.response = response
+            
+            # Reuse the previous findings if neither the HTML nor the headers changed
+            if self.state and self.state.is_unchanged(url, response, checks):
+                # Link targets, certificates and load times change on their own, those checks always run
+                specs = resolve(checks or list(REGISTRY))
+                self.reused = {spec.name for spec in specs if spec.reusable}
+                previous = [f for f in self.state.previous_findings(url) if f.check in self.reused]
+                self.findings += previous
+                print(Fore.CYAN + f"[i] Page unchanged since last run, reusing {len(previous)} finding(s)" + Style.RESET_ALL)
+                if not needs([spec for spec in specs if not spec.reusable], PAGE):
+                    return False
             
             # Test 2: Open URL in browser
-            self.driver.get(url)
+            self.load(url)
             load_time = time.time() - start_time
+            if self.auth:
+                # The site may have rotated its session cookies
+                self.auth.sync_from_driver(self.driver, url)
+            if self.loaded_profile != 'full':
+                print(Fore.CYAN + f"[i] Loaded with the {self.loaded_profile} profile" + Style.RESET_ALL)
             print(Fore.GREEN + f"[+] Successfully loaded the URL (took {load_time:.2f} seconds)" + Style.RESET_ALL)
             
             # Test 3: Get page info
             print(f"\n{Fore.YELLOW}=== Page Information ==={Style.RESET_ALL}")
             print(f"Title: {self.driver.title}")
             print(f"Current URL: {self.driver.current_url}")
-            
-            # Test 4: Check for console errors
-            print(f"\n{Fore.YELLOW}=== Console Error Check ==={Style.RESET_ALL}")
-            self.check_console_errors()
-            
-            # Test 5: Check for broken links
-            print(f"\n{Fore.YELLOW}=== Link Validation ==={Style.RESET_ALL}")
-            self.check_broken_links()
-            
-            # Test 6: Take screenshot
-            print(f"\n{Fore.YELLOW}=== Capturing Screenshot ==={Style.RESET_ALL}")
-            self.take_screenshot()
-            
-            print(f"\n{Fore.GREEN}[✓] Basic testing completed in {time.time() - start_time:.2f} seconds!{Style.RESET_ALL}")
+            return True
             
         except Exception as e:
             print(Fore.RED + f"[!] Error during testing: {str(e)}" + Style.RESET_ALL)
@@ -146,252 +337,292 @@ class WebTester:
         """Test if URL is reachable"""
         try:
             # Use the configured session
-            response = session.get(url, timeout=10)
+            response = session.get(url, timeout=self.timeout)
             status_msg = f"[+] URL is reachable. Status code: {response.status_code}"
             if response.status_code == 200:
                 print(Fore.GREEN + status_msg + Style.RESET_ALL)
             else:
                 print(Fore.YELLOW + status_msg + Style.RESET_ALL)
+                self.add_finding('connection', 'warning', f"Status code {response.status_code}")
             return response
         except requests.exceptions.SSLError as e:
             print(Fore.YELLOW + f"[!] SSL Certificate verification failed for {url}" + Style.RESET_ALL)
+            self.add_finding('connection', 'warning', "SSL certificate verification failed")
             try:
                 # Try with SSL verification disabled
-                response = session.get(url, timeout=10, verify=False)
+                response = session.get(url, timeout=self.timeout, verify=False)
                 print(Fore.YELLOW + f"[!] Connected with SSL verification disabled. Status: {response.status_code}" + Style.RESET_ALL)
                 return response
             except Exception as e:
                 print(Fore.RED + f"[!] Connection failed: {str(e)}" + Style.RESET_ALL)
+                self.add_finding('connection', 'error', "Connection failed")
+                self.unreachable = str(e)[:200]
                 return None
         except requests.exceptions.RequestException as e:
             print(Fore.RED + f"[!] Could not connect to {url}: {str(e)}" + Style.RESET_ALL)
+            self.add_finding('connection', 'error', "URL is not reachable")
+            self.unreachable = str(e)[:200]
             return None
     
-    def check_console_errors(self):
-        """Check browser console for errors"""
-        try:
-            logs = self.driver.get_log('browser')
-            if logs:
-                print(Fore.YELLOW + "[!] Browser console errors found:" + Style.RESET_ALL)
-                for log in logs:
-                    if log['level'] == 'SEVERE':
-                        print(f"- {log['message']}")
-            else:
-                print(Fore.GREEN + "[+] No browser console errors found" + Style.RESET_ALL)
-        except Exception as e:
-            print(Fore.YELLOW + f"[!] Could not retrieve browser logs: {str(e)}" + Style.RESET_ALL)
+    def recycle_driver(self, reason):
+        """Replace the browser with a fresh one to release its memory"""
+        print(Fore.CYAN + f"[i] Restarting the browser ({reason})" + Style.RESET_ALL)
+        self.cleanup_driver()
+        self.setup_driver()
     
-    def check_broken_links(self):
-        """Check for broken links on the page"""
-        try:
-            links = self.driver.find_elements(By.TAG_NAME, 'a')
-            print(f"Found {len(links)} links on the page")
-            
-            broken_links = 0
-            checked_links = set()  # To avoid checking the same link multiple times
-            
-            for link in links:
-                try:
-                    href = link.get_attribute('href')
-                    if href and href.startswith(('http://', 'https://')) and href not in checked_links:
-                        checked_links.add(href)
-                        try:
-                            response = session.head(
-                                href, 
-                                allow_redirects=True, 
-                                timeout=5,
-                                verify=False  # Disable SSL verification for link checking
-                            )
-                            if response.status_code >= 400:
-                                print(Fore.RED + f"[!] Broken link ({response.status_code}): {href}" + Style.RESET_ALL)
-                                broken_links += 1
-                            elif response.status_code >= 300:
-                                print(Fore.YELLOW + f"[!] Redirect ({response.status_code}): {href} -> {response.url}" + Style.RESET_ALL)
-                        except requests.exceptions.SSLError:
-                            # Try with GET if HEAD fails due to SSL
-                            try:
-                                response = session.get(href, timeout=5, verify=False, stream=True)
-                                if response.status_code >= 400:
-                                    print(Fore.RED + f"[!] Broken link ({response.status_code}): {href}" + Style.RESET_ALL)
-                                    broken_links += 1
-                            except Exception as e:
-                                print(Fore.RED + f"[!] Error checking link {href}: {str(e)[:100]}..." + Style.RESET_ALL)
-                                broken_links += 1
-                except Exception as e:
-                    continue
-            
-            if broken_links == 0:
-                print(Fore.GREEN + "[+] No broken links found" + Style.RESET_ALL)
-            
-        except Exception as e:
-            print(Fore.YELLOW + f"[!] Error checking links: {str(e)}" + Style.RESET_ALL)
+    def cleanup_driver(self):
+        """Quit the browser, ignoring errors from a crashed session"""
+        if hasattr(self, 'driver') and self.driver:
+            try:
+                self.driver.quit()
+                print(Fore.CYAN + "[i] WebDriver session ended" + Style.RESET_ALL)
+            except:
+                pass  # Ignore errors during cleanup
+            self.driver = None
     
-    def take_screenshot(self):
-        """Take a screenshot of the current page"""
-        try:
-            timestamp = time.strftime("%Y%m%d_%H%M%S")
-            filename = f"screenshot_{timestamp}.png"
-            self.driver.save_screenshot(filename)
-            print(Fore.GREEN + f"[+] Screenshot saved as {filename}" + Style.RESET_ALL)
-        except Exception as e:
-            print(Fore.YELLOW + f"[!] Could not take screenshot: {str(e)}" + Style.RESET_ALL)
+    def cleanup(self):
+        """Clean up resources"""
+        if self.screenshots:
+            self.screenshots.close()
+        self.cleanup_driver()
+
+def run_full_suite(tester, url, checks=None):
+    """Run the selected checks against a URL, skipping the browser for unchanged pages
+
+    Raises Unreachable when the site could not be reached, so it counts as a failed scan.
+    """
+    start_time = time.time()
+    with span(tester.tracer, 'scan', {'url.full': url}):
+        tester.run_checks(url, checks or tester.checks)
+    if tester.unreachable:
+        raise Unreachable(f"{url} is not reachable: {tester.unreachable}")
+    if tester.writer:
+        tester.writer.write(url, tester.findings)
+    for sink in (tester.report, tester.output):
+        if sink:
+            sink.add(url, tester.findings, time.time() - start_time)
+
+def run_parallel(target, arguments):
+    """Call target once per argument tuple, each on its own thread when there are several"""
+    if len(arguments) == 1:
+        return target(*arguments[0])
+    threads = [threading.Thread(target=target, args=args, daemon=True) for args in arguments]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        while thread.is_alive():
+            thread.join(0.5)  # short joins keep Ctrl+C responsive
+
+def run_jobs(testers, store):
+    """Scan every queued URL in the checkpoint, resuming after crashes"""
+    recovered = store.recover()
+    if recovered:
+        print(Fore.CYAN + f"[i] Requeued {recovered} job(s) interrupted by the previous run" + Style.RESET_ALL)
+    counts = store.counts()
+    print(Fore.CYAN + f"[i] Jobs: {counts.get('done', 0)} done, {counts.get('pending', 0)} pending, "
+          f"{counts.get('failed', 0)} failed" + Style.RESET_ALL)
+    
+    try:
+        run_parallel(work_jobs, [(tester, store) for tester in testers])
+    except KeyboardInterrupt:
+        print(Fore.YELLOW + "\n[!] Interrupted, progress is saved in the checkpoint" + Style.RESET_ALL)
+        raise
     
-    def test_security_headers(self, url):
-        """Test for important security headers"""
+    counts = store.counts()
+    print(f"\n{Fore.CYAN}=== Job Summary ==={Style.RESET_ALL}")
+    print(f"Done: {counts.get('done', 0)}, failed: {counts.get('failed', 0)}, pending: {counts.get('pending', 0)}")
+
+def work_jobs(tester, store):
+    """Claim and scan jobs until the checkpoint has none left"""
+    while True:
+        url = store.claim()
+        if url is None:
+            break
         try:
-            print(f"\n{Fore.CYAN}=== Testing Security Headers ==={Style.RESET_ALL}")
-            
-            response = requests.get(url, verify=False, timeout=10)
-            headers = response.headers
-            
-            security_headers = {
-                'X-Content-Type-Options': 'Prevents MIME type sniffing',
-                'X-Frame-Options': 'Prevents clickjacking',
-                'X-XSS-Protection': 'Cross-site scripting filter',
-                'Content-Security-Policy': 'Prevents XSS and data injection',
-                'Strict-Transport-Security': 'Enforces HTTPS',
-                'Referrer-Policy': 'Controls referrer information',
-                'Permissions-Policy': 'Controls browser features',
-                'Cross-Origin-Opener-Policy': 'Isolates browsing context',
-                'Cross-Origin-Resource-Policy': 'Controls cross-origin requests'
-            }
-            
-            missing_headers = []
-            
-            for header, description in security_headers.items():
-                if header.lower() in (h.lower() for h in headers):
-                    print(f"{Fore.GREEN}[✓] {header}: {headers.get(header, 'Present')}" + 
-                          f"{Style.DIM} - {description}{Style.RESET_ALL}")
-                else:
-                    missing_headers.append(header)
-                    print(f"{Fore.RED}[!] Missing: {header}{Style.RESET_ALL} {Style.DIM}- {description}{Style.RESET_ALL}")
-            
-            if missing_headers:
-                print(f"\n{Fore.YELLOW}Recommendations:")
-                for header in missing_headers:
-                    print(f"- Consider adding the {header} header for better security")
-                print(Style.RESET_ALL)
-            
-            return len(missing_headers) == 0
-            
+            run_full_suite(tester, url)
+            store.complete(url, to_dicts(tester.findings))
+        except KeyboardInterrupt:
+            store.release(url)
+            raise
         except Exception as e:
-            print(Fore.RED + f"[!] Error checking security headers: {str(e)}" + Style.RESET_ALL)
-            return False
-    
-    def test_forms(self):
-        """Test all forms on the page"""
+            store.fail(url, e)
+            print(Fore.RED + f"[!] Job failed for {url}: {str(e)[:200]}" + Style.RESET_ALL)
+            # The browser may have crashed, start a fresh one for the next job
+            if tester.driver and not isinstance(e, Unreachable):
+                tester.cleanup_driver()
+                tester.setup_driver()
+        if tester.memory and not tester.memory.check(tester):
+            print(Fore.YELLOW + f"[!] Memory limit of {tester.memory.max_rss_mb} MB reached, stopping; "
+                  "rerun to resume from the checkpoint" + Style.RESET_ALL)
+            break
+
+def report_checkpoint(store, *sinks):
+    """Add the results and the failed jobs of a checkpoint to reports and outputs"""
+    for url, findings in store.results():
+        for sink in sinks:
+            sink.add(url, findings)
+    report_failures(store, *sinks)
+
+def report_failures(store, *sinks):
+    """Add the jobs that ran out of attempts to reports and outputs"""
+    for url, error in store.failures():
+        for sink in sinks:
+            sink.add(url, [], error=error or 'scan failed')
+
+def checkpoint_outcome(store):
+    """Exit code for the results stored in a checkpoint"""
+    if store.failures():
+        return EXIT_FAILED
+    remaining = store.remaining()
+    if remaining:
+        # Stopped by the memory limit or before the queue was drained, rerun to resume
+        print(Fore.YELLOW + f"[!] {remaining} URL(s) not scanned yet, the scan is incomplete" + Style.RESET_ALL)
+        return EXIT_INCOMPLETE
+    for _, findings in store.results():
+        if any(finding.get('severity') == 'error' for finding in findings):
+            return EXIT_FINDINGS
+    return EXIT_OK
+
+def finish_report(report):
+    """Close a report and print where it was written"""
+    print(f"\n{Fore.CYAN}=== Reports ==={Style.RESET_ALL}")
+    for path in report.close():
+        print(f"- {path}")
+
+def run_coordinator(store, address, lease, token=None):
+    """Serve the job queue to remote workers until every job is finished"""
+    from broker import Broker
+    host, _, port = address.rpartition(':')
+    broker = Broker(store, host or '127.0.0.1', int(port), lease=lease, token=token).start()
+    print(Fore.GREEN + f"[+] Broker listening on {broker.address}" + Style.RESET_ALL)
+    print(f"Start workers with: python web_tester.py --worker {broker.address} --headless")
+    try:
+        while store.remaining():
+            time.sleep(5)
+            status = broker.status()
+            jobs = status['jobs']
+            print(f"[i] {jobs.get('done', 0)} done, {jobs.get('running', 0)} running, "
+                  f"{jobs.get('pending', 0)} pending, {jobs.get('failed', 0)} failed, "
+                  f"{len(status['workers'])} worker(s) alive")
+        # Keep answering for a few polls so idle workers hear that the queue is done
+        print(Fore.CYAN + "[i] Queue finished, telling the idle workers" + Style.RESET_ALL)
+        time.sleep(POLL_INTERVAL * 2)
+    except KeyboardInterrupt:
+        print(Fore.YELLOW + "\n[!] Coordinator stopped, unfinished jobs stay in the queue" + Style.RESET_ALL)
+    finally:
+        broker.stop()
+    counts = store.counts()
+    print(f"\n{Fore.CYAN}=== Job Summary ==={Style.RESET_ALL}")
+    print(f"Done: {counts.get('done', 0)}, failed: {counts.get('failed', 0)}, pending: {counts.get('pending', 0)}")
+
+def run_worker(tester, client, poll_interval=POLL_INTERVAL, max_failures=12):
+    """Pull jobs from a broker, scan them and push the findings back"""
+    from broker import Heartbeat
+    print(Fore.GREEN + f"[+] Worker {client.worker} connected to {client.url}" + Style.RESET_ALL)
+    failures = 0
+    while True:
         try:
-            print(f"\n{Fore.CYAN}=== Form Testing ==={Style.RESET_ALL}")
-            forms = self.driver.find_elements(By.TAG_NAME, 'form')
-            
-            if not forms:
-                print("No forms found on the page.")
+            reply = client.call('/lease')
+        except requests.exceptions.RequestException as e:
+            failures += 1
+            if failures >= max_failures:
+                # The coordinator has most likely finished and shut down
+                print(Fore.YELLOW + f"[!] Broker unreachable {failures} times in a row, worker exiting" + Style.RESET_ALL)
                 return
-                
-            print(f"Found {len(forms)} form(s) on the page.")
-            
-            for i, form in enumerate(forms, 1):
-                print(f"\n{Fore.YELLOW}Form {i}:{Style.RESET_ALL}")
-                
-                # Get form attributes
-                form_id = form.get_attribute('id') or 'No ID'
-                form_action = form.get_attribute('action') or 'No action specified'
-                form_method = form.get_attribute('method') or 'GET'
-                
-                print(f"ID: {form_id}")
-                print(f"Action: {form_action}")
-                print(f"Method: {form_method}")
-                
-                # Check for password fields
-                password_fields = form.find_elements(By.CSS_SELECTOR, 'input[type="password"]')
-                if password_fields:
-                    print(f"{Fore.YELLOW}[!] Contains password field(s) - check for HTTPS in form action{Style.RESET_ALL}")
-                
-                # Check for CSRF token
-                csrf_tokens = form.find_elements(By.CSS_SELECTOR, 'input[name*="csrf"], input[name*="CSRF"]')
-                if not csrf_tokens:
-                    print(f"{Fore.YELLOW}[!] No CSRF token detected - potential security risk{Style.RESET_ALL}")
-                
-                # List all input fields
-                inputs = form.find_elements(By.TAG_NAME, 'input')
-                if inputs:
-                    print("\nInput fields:")
-                    for input_field in inputs:
-                        input_type = input_field.get_attribute('type') or 'text'
-                        input_name = input_field.get_attribute('name') or 'No name'
-                        input_id = input_field.get_attribute('id') or 'No ID'
-                        print(f"- {input_type.upper()}: {input_name} (ID: {input_id})")
-            
-            print(f"\n{Fore.GREEN}[✓] Form testing completed{Style.RESET_ALL}")
-            
-        except Exception as e:
-            print(Fore.RED + f"[!] Error testing forms: {str(e)}" + Style.RESET_ALL)
-    
-    def test_performance(self, url):
-        """Test page load performance"""
+            print(Fore.YELLOW + f"[!] Broker unreachable ({str(e)[:100]}), retrying..." + Style.RESET_ALL)
+            time.sleep(poll_interval)
+            continue
+        failures = 0
+        url = reply['url']
+        if url is None:
+            if reply['done']:
+                print(Fore.GREEN + "[+] Queue is empty, worker exiting" + Style.RESET_ALL)
+                return
+            time.sleep(poll_interval)
+            continue
+        
+        with Heartbeat(client, url, reply['lease'] / 3) as heartbeat:
+            try:
+                run_full_suite(tester, url, reply.get('checks'))
+                error = None
+            except KeyboardInterrupt:
+                client.call('/release', url=url)
+                raise
+            except Exception as e:
+                error = str(e)[:500]
+                if tester.driver and not isinstance(e, Unreachable):
+                    tester.cleanup_driver()
+                    tester.setup_driver()
+        if heartbeat.lost:
+            print(Fore.YELLOW + f"[!] Lease for {url} expired, the job was handed to another worker" + Style.RESET_ALL)
+        if error:
+            client.call('/fail', url=url, error=error)
+        else:
+            client.call('/complete', url=url, findings=to_dicts(tester.findings))
+        if tester.memory and not tester.memory.check(tester):
+            print(Fore.YELLOW + f"[!] Memory limit of {tester.memory.max_rss_mb} MB reached, worker exiting" + Style.RESET_ALL)
+            return
+
+def run_watch(args):
+    """Probe the targets on their schedules until interrupted, reporting changes of state"""
+    from watch import WATCH_CHECKS, Target, Watcher, pool_session, read_targets
+    targets = [Target(args.url, args.interval)] if args.url else []
+    if args.urls_file:
         try:
-            print(f"\n{Fore.CYAN}=== Performance Testing ==={Style.RESET_ALL}")
-            
-            # Test initial page load
-            start_time = time.time()
-            self.driver.get(url)
-            load_time = time.time() - start_time
-            
-            # Get performance metrics
-            navigation_start = self.driver.execute_script("return window.performance.timing.navigationStart")
-            dom_complete = self.driver.execute_script("return window.performance.timing.domComplete")
-            load_event_end = self.driver.execute_script("return window.performance.timing.loadEventEnd")
-            
-            # Calculate metrics
-            dom_loading = (dom_complete - navigation_start) / 1000
-            page_load = (load_event_end - navigation_start) / 1000
-            
-            print(f"Page loaded in {load_time:.2f} seconds")
-            print(f"DOM loading time: {dom_loading:.2f} seconds")
-            print(f"Full page load time: {page_load:.2f} seconds")
-            
-            # Check for large resources
-            resources = self.driver.execute_script("""
-                var resources = window.performance.getEntriesByType('resource');
-                return resources.map(function(resource) {
-                    return {
-                        name: resource.name,
-                        type: resource.initiatorType,
-                        duration: resource.duration,
-                        size: resource.transferSize
-                    };
-                });
-            """)
-            
-            # Sort resources by size (largest first)
-            large_resources = sorted(
-                [r for r in resources if r['size'] > 102400],  # > 100KB
-                key=lambda x: x['size'],
-                reverse=True
-            )
-            
-            if large_resources:
-                print(f"\n{Fore.YELLOW}Large resources found (over 100KB):{Style.RESET_ALL}")
-                for i, resource in enumerate(large_resources[:5], 1):  # Show top 5
-                    size_mb = resource['size'] / (1024 * 1024)
-                    print(f"{i}. {resource['name']}")
-                    print(f"   Type: {resource['type']}")
-                    print(f"   Size: {size_mb:.2f} MB")
-                    print(f"   Load time: {resource['duration']:.2f} ms")
-            
-            print(f"\n{Fore.GREEN}[✓] Performance testing completed{Style.RESET_ALL}")
-            
-        except Exception as e:
-            print(Fore.RED + f"[!] Error during performance testing: {str(e)}" + Style.RESET_ALL)
+            targets.extend(read_targets(args.urls_file, args.interval))
+        except (OSError, ValueError) as e:
+            return usage_error(f"Could not read {args.urls_file}: {str(e)}")
+    if not targets:
+        return usage_error("No targets given; pass a URL or --urls-file")
+    try:
+        specs = resolve(args.checks or ','.join(WATCH_CHECKS))
+    except ValueError as e:
+        return usage_error(str(e))
     
-    def cleanup(self):
-        """Clean up resources"""
-        if hasattr(self, 'driver') and self.driver:
-            try:
-                self.driver.quit()
-                print(Fore.CYAN + "[i] WebDriver session ended" + Style.RESET_ALL)
-            except:
-                pass  # Ignore errors during cleanup
+    workers = max(args.concurrency, 1)
+    pool_session(session, targets, workers)
+    browser = uses_browser(specs)
+    screenshots = None
+    if any(spec.name == 'screenshot' for spec in specs):
+        from screenshots import ScreenshotPipeline
+        screenshots = ScreenshotPipeline(args.screenshot_dir, args.screenshot_format, args.dedupe)
+    testers = [WebTester(headless=args.headless, screenshots=screenshots, profile=args.profile,
+                         checks=[spec.name for spec in specs], browser=browser, timeout=args.timeout or 10)
+               for _ in range(workers)]
+    watcher = Watcher(testers, targets, [spec.name for spec in specs], args.jitter, args.retry_interval,
+                      args.output, verbose=not args.quiet)
+    # Service managers stop daemons with SIGTERM
+    signal.signal(signal.SIGTERM, lambda signum, frame: watcher.stop())
+    print(Fore.CYAN + f"[i] Watching {len(targets)} target(s) with {workers} worker(s): "
+          f"{', '.join(spec.name for spec in specs)}; Ctrl+C to stop" + Style.RESET_ALL)
+    try:
+        watcher.run()
+    finally:
+        counts = watcher.summary()
+        print(Fore.CYAN + f"[i] {watcher.probes} probe(s), {watcher.events} event(s); "
+              + ', '.join(f"{count} {state}" for state, count in sorted(counts.items())) + Style.RESET_ALL)
+        for tester in testers:
+            tester.cleanup_driver()
+        if screenshots:
+            screenshots.close()
+    return EXIT_OK
+
+def report_diff(state, output=None):
+    """Print new and resolved findings against the previous run"""
+    diff = state.diff()
+    print(f"\n{Fore.CYAN}=== Changes Since Last Run ==={Style.RESET_ALL}")
+    if not diff:
+        print(Fore.GREEN + "[+] No new or resolved findings" + Style.RESET_ALL)
+    for url, changes in diff.items():
+        print(f"{url}")
+        for finding in changes['new']:
+            print(Fore.RED + f"  [NEW] {finding['check']}: {finding['message']}" + Style.RESET_ALL)
+        for finding in changes['resolved']:
+            print(Fore.GREEN + f"  [RESOLVED] {finding['check']}: {finding['message']}" + Style.RESET_ALL)
+    if output:
+        with open(output, 'w', encoding='utf-8') as f:
+            json.dump(diff, f, indent=2)
+        print(Fore.CYAN + f"[i] Diff written to {output}" + Style.RESET_ALL)
 
 def show_banner():
     """Display tool banner"""
@@ -413,14 +644,18 @@ def get_test_options():
     print("3. Security Headers Check")
     print("4. Form Testing")
     print("5. Performance Testing")
-    print(f"6. {Fore.RED}Exit{Style.RESET_ALL}")
+    print("6. Resource Audit (mixed content, SRI, compression, caching)")
+    print("7. SEO Check")
+    print("8. Accessibility Check")
+    print("9. SSL Certificate Check")
+    print(f"10. {Fore.RED}Exit{Style.RESET_ALL}")
     
     while True:
         try:
-            choice = int(input("\nEnter your choice (1-6): "))
-            if 1 <= choice <= 6:
+            choice = int(input("\nEnter your choice (1-10): "))
+            if 1 <= choice <= 10:
                 return choice
-            print(f"{Fore.RED}Please enter a number between 1 and 6{Style.RESET_ALL}")
+            print(f"{Fore.RED}Please enter a number between 1 and 10{Style.RESET_ALL}")
         except ValueError:
             print(f"{Fore.RED}Invalid input. Please enter a number.{Style.RESET_ALL}")
 
@@ -439,58 +674,358 @@ def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Z_H_10min - Web Application Testing Tool')
     parser.add_argument('url', nargs='?', help='URL to test')
+    parser.add_argument('--urls-file', metavar='FILE', help='Scan every URL in FILE (one per line)')
+    parser.add_argument('--job', metavar='CHECKPOINT',
+                        help='SQLite checkpoint for the scan queue; rerun with the same file to resume')
+    parser.add_argument('--max-attempts', type=int, default=3, help='Attempts per URL before a job stays failed')
+    parser.add_argument('--serve', metavar='HOST:PORT',
+                        help='Coordinator mode: serve the queued URLs to remote workers instead of scanning')
+    parser.add_argument('--worker', metavar='BROKER_URL', help='Worker mode: pull jobs from a coordinator')
+    parser.add_argument('--lease', type=int, default=120,
+                        help='Seconds without heartbeat before a job is handed to another worker')
+    parser.add_argument('--broker-token', default=os.environ.get('ZH10MIN_BROKER_TOKEN'),
+                        help='Shared secret between coordinator and workers')
+    parser.add_argument('--checks',
+                        help=f"Comma-separated checks to run, in order, or a group ({', '.join(GROUPS)}); "
+                             "see --list-checks (default: default, or headers,ssl with --watch)")
+    parser.add_argument('--list-checks', action='store_true', help='List the available checks and exit')
+    parser.add_argument('--concurrency', type=int, default=1,
+                        help='Scan this many URLs at once, one browser each (batch, worker and watch modes)')
+    parser.add_argument('--timeout', type=float,
+                        help='Seconds for each HTTP request and, unless --ready-timeout is given, for each page load')
+    parser.add_argument('--output', metavar='FILE',
+                        help="Write one JSON line per URL with its status and findings ('-' for standard output)")
+    parser.add_argument('--quiet', action='store_true',
+                        help='No banner, menus or progress output; the exit code and --output tell the result')
+    parser.add_argument('--seo-pages', type=int, default=1,
+                        help='Crawl up to this many pages for the site-level SEO analysis')
+    parser.add_argument('--seo-cache', metavar='FILE', help='On-disk cache of parsed pages for the SEO analysis')
     parser.add_argument('--headless', action='store_true', help='Run in headless mode')
     parser.add_argument('--auto', action='store_true', help='Run all tests automatically')
+    parser.add_argument('--incremental', metavar='STATE_FILE',
+                        help='Reuse findings for pages unchanged since the run stored in STATE_FILE')
+    parser.add_argument('--screenshot-dir', default='screenshots', help='Directory for content-addressed screenshots')
+    parser.add_argument('--screenshot-format', choices=['webp', 'png'], default='webp',
+                        help='Encoding for stored screenshots (needs Pillow)')
+    parser.add_argument('--dedupe', choices=['content', 'perceptual'], default='content',
+                        help='Also mark near-identical screenshots in the index (perceptual)')
+    parser.add_argument('--visual-diff', metavar='BASELINE_DIR',
+                        help='Compare screenshots with baselines stored in BASELINE_DIR (needs numpy and Pillow)')
+    parser.add_argument('--visual-threshold', type=float, default=0.001,
+                        help='Fraction of changed pixels reported as a visual change (default 0.001)')
+    parser.add_argument('--update-baselines', action='store_true', help='Replace baselines with changed captures')
+    parser.add_argument('--profile', choices=list(PROFILES), default='full',
+                        help='Resources to load for non-visual checks (performance and resource audits always load in full)')
+    parser.add_argument('--page-load-strategy', choices=STRATEGIES, default='normal',
+                        help='When driver.get returns: after load (normal), DOMContentLoaded (eager) or at once (none)')
+    parser.add_argument('--ready', metavar='CONDITIONS', default='',
+                        help=f"Comma-separated conditions to wait for after navigation: {', '.join(CONDITIONS)}")
+    parser.add_argument('--wait-selector', metavar='CSS', help='Wait until an element matching CSS exists')
+    parser.add_argument('--idle-time', type=float, default=0.5,
+                        help='Seconds without requests or DOM mutations that count as idle (default 0.5)')
+    parser.add_argument('--idle-max-inflight', type=int, default=0, metavar='N',
+                        help='Requests that may stay in flight while the network counts as idle (default 0)')
+    parser.add_argument('--ready-timeout', type=float,
+                        help='Hard deadline in seconds for loading a page and waiting for readiness (default 30)')
+    parser.add_argument('--login', metavar='SCRIPT',
+                        help='JSON login script run once in the browser (${VAR} values come from the environment)')
+    parser.add_argument('--cookies', metavar='FILE', help='Import a session from a JSON or Netscape cookies file')
+    parser.add_argument('--auth-state', metavar='FILE',
+                        help='Share the login between local processes through FILE (workers use the coordinator)')
+    parser.add_argument('--auth-max-age', type=int, default=3600,
+                        help='Seconds before a login is refreshed even if its cookies have no expiry')
+    parser.add_argument('--findings-file', metavar='FILE', help='Stream findings to FILE as JSON lines')
+    parser.add_argument('--max-rss', type=int, metavar='MB',
+                        help='Stop taking new URLs once the scanner process uses more than MB')
+    parser.add_argument('--browser-max-rss', type=int, metavar='MB',
+                        help='Restart the browser between URLs once it uses more than MB')
+    parser.add_argument('--link-cache-size', type=int, default=10000,
+                        help='Number of link statuses remembered across pages')
+    parser.add_argument('--max-redirects', type=int, default=10,
+                        help='Redirect hops followed per link before it is reported as a loop')
+    parser.add_argument('--report', metavar='DIR', help='Write HTML, JUnit XML and JSON reports to DIR')
+    parser.add_argument('--report-format',
+                        help='Comma-separated report formats (default: html,junit,json)')
+    parser.add_argument('--diff-output', metavar='FILE', help='Write new/resolved findings as JSON (with --incremental)')
+    parser.add_argument('--record', metavar='HAR',
+                        help='Save every HTTP exchange and a snapshot of each loaded page to a HAR file')
+    parser.add_argument('--replay', metavar='HAR',
+                        help='Answer requests from a HAR file recorded with --record instead of the network')
+    parser.add_argument('--trace', metavar='FILE',
+                        help='Append OpenTelemetry JSON spans of every scan, check, HTTP request and WebDriver command to FILE')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and probe every target on a schedule, reporting changes of state')
+    parser.add_argument('--interval', type=float, default=300,
+                        help="Seconds between probes of a target in watch mode; a second column in --urls-file overrides it")
+    parser.add_argument('--retry-interval', type=float, default=60,
+                        help='Seconds between probes of a target that is degraded or down')
+    parser.add_argument('--jitter', type=float, default=0.1,
+                        help='Random spread of the probe times, as a fraction of the interval')
     return parser.parse_args()
 
 def main():
     """Main function"""
-    show_banner()
     args = parse_arguments()
+    if not args.quiet and sys.stdout.isatty():
+        show_banner()
     
-    # Get URL
-    url = args.url if args.url else get_url_input()
+    try:
+        if args.quiet:
+            # Only the results written to --output reach the console
+            with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+                code = run(args)
+        else:
+            code = run(args)
+    except KeyboardInterrupt:
+        code = EXIT_INTERRUPTED
+    sys.exit(code)
+
+def usage_error(message):
+    """Report a configuration problem, also in quiet mode"""
+    print(Fore.RED + f"[!] {message}" + Style.RESET_ALL, file=sys.stderr)
+    return EXIT_USAGE
+
+def run(args):
+    """Run the scan described by the arguments and return the exit code"""
+    if args.list_checks:
+        for name, spec in REGISTRY.items():
+            default = ' (default)' if name in DEFAULT_CHECKS else ''
+            print(f"{name:<14} {spec.description}{default}")
+        return EXIT_OK
+    if args.watch:
+        return run_watch(args)
+    try:
+        specs = resolve(args.checks or 'default')
+    except ValueError as e:
+        return usage_error(str(e))
+    
+    # Get URLs
+    urls = [args.url] if args.url else []
+    if args.urls_file:
+        try:
+            urls.extend(read_urls(args.urls_file))
+        except OSError as e:
+            return usage_error(f"Could not read {args.urls_file}: {str(e)}")
+    batch = bool(args.job or len(urls) > 1)
+    # Menus and prompts only when somebody is there to answer them
+    interactive = (sys.stdin.isatty() and not args.quiet and not args.output
+                   and not (args.worker or batch or args.auto))
+    if not urls and not args.job and not args.worker:
+        if not (sys.stdin.isatty() and not args.quiet):
+            return usage_error("No URL given; pass a URL or --urls-file")
+        urls = [get_url_input()]
+    url = urls[0] if urls else None
+    
+    report = None
+    if args.report:
+        from reports import FORMATS, ReportWriter
+        try:
+            formats = (args.report_format or ','.join(FORMATS)).split(',')
+            report = ReportWriter(args.report, [f for f in formats if f])
+        except ValueError as e:
+            return usage_error(str(e))
+    output = ResultWriter(args.output) if args.output else None
+    sinks = [sink for sink in (report, output) if sink]
+    
+    if args.serve:
+        # The coordinator only hands out work, it never starts a browser
+        store = JobStore(args.job or ':memory:', max_attempts=args.max_attempts, checks=[spec.name for spec in specs])
+        store.add(urls)
+        try:
+            try:
+                run_coordinator(store, args.serve, args.lease, args.broker_token)
+            except ValueError as e:
+                return usage_error(str(e))
+            report_checkpoint(store, *sinks)
+            return checkpoint_outcome(store)
+        finally:
+            store.close()
+            if report:
+                finish_report(report)
+            if output:
+                output.close()
     
     # Initialize tester
-    tester = WebTester(headless=args.headless)
+    state = ScanState(args.incremental) if args.incremental else None
+    # The menu can run any check; otherwise only the selected checks' helpers are loaded
+    selected = set(REGISTRY) if interactive else {spec.name for spec in specs}
+    screenshots = None
+    if 'screenshot' in selected:
+        from screenshots import ScreenshotPipeline
+        screenshots = ScreenshotPipeline(args.screenshot_dir, args.screenshot_format, args.dedupe)
+    visual = None
+    if args.visual_diff:
+        try:
+            from visual_diff import VisualDiff  # numpy is only imported when baselines are compared
+            visual = VisualDiff(args.visual_diff, update=args.update_baselines)
+        except ImportError as e:
+            return usage_error(str(e))
+    ready_timeout = args.ready_timeout or args.timeout or 30
+    try:
+        readiness = ReadinessPolicy(args.page_load_strategy, [c for c in args.ready.split(',') if c],
+                                    args.wait_selector, ready_timeout, args.idle_time, args.idle_max_inflight)
+    except ValueError as e:
+        return usage_error(str(e))
+    concurrency = max(args.concurrency, 1) if (batch or args.worker) else 1
+    clients = []
+    if args.worker:
+        from broker import BrokerClient
+        worker_id = f"{socket.gethostname()}-{os.getpid()}"
+        clients = [BrokerClient(args.worker, worker_id if concurrency == 1 else f"{worker_id}-{i}", args.broker_token)
+                   for i in range(concurrency)]
+    auth = None
+    if args.login or args.cookies:
+        from auth import AuthManager, BrokerAuthStore, FileAuthStore, load_cookie_file, load_login_script
+        try:
+            login = load_login_script(args.login) if args.login else None
+            cookies = load_cookie_file(args.cookies) if args.cookies else None
+        except (OSError, ValueError, KeyError) as e:
+            return usage_error(f"Could not read the login settings: {str(e)}")
+        store = BrokerAuthStore(clients[0]) if clients else FileAuthStore(args.auth_state) if args.auth_state else None
+        auth = AuthManager(session, login, cookies, store, args.auth_max_age)
+    recorder = replay = None
+    if args.replay:
+        from replay import HarArchive, ReplayServer, mount
+        try:
+            archive = HarArchive(args.replay)
+        except (OSError, ValueError, KeyError) as e:
+            return usage_error(f"Could not read {args.replay}: {str(e)}")
+        mount(session, archive)
+        # Sockets are not recorded, and full page loads would fetch HTTPS subresources the stand-in cannot serve
+        offline = [spec for spec in specs if needs([spec], NETWORK) or needs([spec], FULL_LOAD)]
+        if offline:
+            print(Fore.YELLOW + f"[!] Skipping {', '.join(spec.name for spec in offline)}: "
+                  "they need the live network" + Style.RESET_ALL)
+            specs = [spec for spec in specs if spec not in offline]
+        print(Fore.CYAN + f"[i] Replaying {len(archive)} response(s) and {len(archive.snapshots)} "
+              f"page snapshot(s) from {args.replay}" + Style.RESET_ALL)
+    # Chrome is started up front only if a selected check uses it
+    browser = interactive or uses_browser(specs) or bool(args.login)
+    memory = MemoryGuard(args.max_rss, args.browser_max_rss) if args.max_rss or args.browser_max_rss else None
+    writer = FindingWriter(args.findings_file) if args.findings_file else None
+    if args.replay and browser:
+        replay = ReplayServer(archive)
+    if args.record:
+        from replay import HarRecorder
+        recorder = HarRecorder(args.record)
+        recorder.attach(session)
+    tracer = None
+    if args.trace:
+        from tracing import Tracer
+        tracer = Tracer(args.trace)
+        tracer.instrument_session(session)
+    redirects = None
+    if 'links' in selected:
+        from redirects import RedirectResolver
+        redirects = RedirectResolver(session, max_hops=args.max_redirects, cache_size=args.link_cache_size)
+    # A batch crawls each site once; the menu and single scans analyze it every time they are asked to
+    seo_sites = set() if batch or args.worker else None
+    testers = [WebTester(headless=args.headless, state=state, screenshots=screenshots,
+                         visual=visual, visual_threshold=args.visual_threshold,
+                         memory=memory, writer=writer, link_cache_size=args.link_cache_size,
+                         profile=args.profile, readiness=readiness, auth=auth, report=report,
+                         checks=[spec.name for spec in specs], browser=browser,
+                         seo_pages=args.seo_pages, seo_cache=args.seo_cache, seo_sites=seo_sites,
+                         output=output, timeout=args.timeout or 10, redirects=redirects,
+                         recorder=recorder, replay=replay, tracer=tracer)
+               for _ in range(concurrency)]
+    tester = testers[0]
+    code = EXIT_OK
     
-    if args.auto:
-        # Run all tests in automated mode
-        print(f"\n{Fore.CYAN}=== Running Automated Test Suite ==={Style.RESET_ALL}")
-        tester.test_url(url)
-        tester.test_security_headers(url)
-        tester.test_forms()
-        tester.test_performance(url)
-    else:
-        # Interactive mode
-        while True:
-            choice = get_test_options()
-            
-            if choice == 1:
-                print(f"\n{Fore.CYAN}=== Running Basic Tests ==={Style.RESET_ALL}")
-                tester.test_url(url)
-            elif choice == 2:
-                print(f"\n{Fore.CYAN}=== Running Full Test Suite ==={Style.RESET_ALL}")
-                tester.test_url(url)
-                tester.test_security_headers(url)
-                tester.test_forms()
-                tester.test_performance(url)
-            elif choice == 3:
-                print(f"\n{Fore.CYAN}=== Testing Security Headers ==={Style.RESET_ALL}")
-                tester.test_security_headers(url)
-            elif choice == 4:
-                print(f"\n{Fore.CYAN}=== Testing Forms ==={Style.RESET_ALL}")
-                tester.test_forms()
-            elif choice == 5:
-                print(f"\n{Fore.CYAN}=== Performance Testing ==={Style.RESET_ALL}")
-                tester.test_performance(url)
-            elif choice == 6:
-                print(f"\n{Fore.GREEN}Thank you for using Z_H_10min!{Style.RESET_ALL}")
+    try:
+        if clients:
+            try:
+                run_parallel(run_worker, list(zip(testers, clients)))
+            except KeyboardInterrupt:
+                print(Fore.YELLOW + "\n[!] Worker stopped" + Style.RESET_ALL)
+        elif batch:
+            # Batch mode, the queue lives in a checkpoint so it can be resumed
+            store = JobStore(args.job or ':memory:', max_attempts=args.max_attempts,
+                             checks=[spec.name for spec in specs])
+            store.add(urls)
+            try:
+                # Pages finished by an earlier run of this checkpoint
+                for done_url, findings in store.results():
+                    for sink in sinks:
+                        sink.add(done_url, findings)
+                run_jobs(testers, store)
+                report_failures(store, *sinks)
+                code = checkpoint_outcome(store)
+            finally:
+                store.close()
+        elif not interactive:
+            # Run the selected checks in automated mode
+            print(f"\n{Fore.CYAN}=== Running Automated Test Suite ==={Style.RESET_ALL}")
+            try:
+                run_full_suite(tester, url)
+                code = EXIT_FINDINGS if any(f.severity == 'error' for f in tester.findings) else EXIT_OK
+            except Exception as e:
+                print(Fore.RED + f"[!] Scan failed: {str(e)[:200]}" + Style.RESET_ALL)
+                for sink in sinks:
+                    sink.add(url, [], error=str(e)[:500])
+                code = EXIT_FAILED
+        else:
+            # Interactive mode
+            while True:
+                choice = get_test_options()
+                
+                if choice == 1:
+                    print(f"\n{Fore.CYAN}=== Running Basic Tests ==={Style.RESET_ALL}")
+                    tester.test_url(url)
+                elif choice == 2:
+                    print(f"\n{Fore.CYAN}=== Running Full Test Suite ==={Style.RESET_ALL}")
+                    run_full_suite(tester, url)
+                elif choice == 3:
+                    tester.run_checks(url, ['headers'])
+                elif choice == 4:
+                    tester.run_checks(url, ['forms'])
+                elif choice == 5:
+                    tester.run_checks(url, ['performance'])
+                elif choice == 6:
+                    tester.run_checks(url, ['resources'])
+                elif choice == 7:
+                    tester.run_checks(url, ['seo'])
+                elif choice == 8:
+                    tester.run_checks(url, ['accessibility'])
+                elif choice == 9:
+                    tester.run_checks(url, ['ssl'])
+                elif choice == 10:
+                    print(f"\n{Fore.GREEN}Thank you for using Z_H_10min!{Style.RESET_ALL}")
+                    break
+                
+                if not input("\nPress Enter to continue or 'q' to quit: ").lower() == 'q':
+                    continue
                 break
-            
-            if not input("\nPress Enter to continue or 'q' to quit: ").lower() == 'q':
-                continue
-            break
+    finally:
+        for each in testers:
+            each.cleanup_driver()
+        if screenshots:
+            screenshots.close()
+        if writer:
+            writer.close()
+        if report:
+            # Also on Ctrl+C or a crash, so the pages scanned so far are reported
+            finish_report(report)
+        if output:
+            output.close()
+        if recorder:
+            recorder.close()
+            print(Fore.CYAN + f"[i] Recorded {recorder.entries} exchange(s) and page snapshot(s) to {args.record}" + Style.RESET_ALL)
+        if replay:
+            replay.close()
+        if tracer:
+            tracer.close()
+            print(Fore.CYAN + f"[i] Wrote {tracer.traces} trace(s) to {args.trace}; "
+                  f"summarize them with: python tracing.py {args.trace}" + Style.RESET_ALL)
+    
+    if memory:
+        summary = memory.summary()
+        print(f"\n{Fore.CYAN}[i] Peak memory: scanner {summary['peak_rss_mb']} MB, "
+              f"browser {summary['peak_browser_mb']} MB, {summary['browser_recycles']} browser restart(s){Style.RESET_ALL}")
+    if state:
+        state.save()
+        report_diff(state, args.diff_output)
+    return code
 
 if __name__ == "__main__":
     main()